@@ -10,32 +10,51 @@ bl_info = {
     "category": "3D View",
 }
 
+import time
+
 import bpy
 from . import preferences
 from . import operators
 from . import ui
 from . import keymap
 
-modules = (
-    preferences,
-    operators,
-    ui,
-)
+# (step, seconds) of the last registration, shown in the preferences
+registration_timings = []
 
-def register():
-    for mod in modules:
-        mod.register()
-        
-    # Register keymaps if enabled
-    prefs = bpy.context.preferences.addons[__package__].preferences
-    if prefs.enable_keymaps:
+
+def get_preferences():
+    return bpy.context.preferences.addons[__package__].preferences
+
+
+def sync_features(prefs, timings=None):
+    """Register the enabled features and unregister the disabled ones"""
+    operators.sync(prefs, timings)
+    ui.sync(prefs, timings)
+
+    # The keymap only has Smart Delete
+    start = time.perf_counter()
+    keymap.unregister_keymaps()
+    if prefs.enable_keymaps and prefs.enable_mesh_tools:
         keymap.register_keymaps()
+    if timings is not None:
+        timings.append(("keymap", time.perf_counter() - start))
+
+
+def register():
+    registration_timings.clear()
+    start = time.perf_counter()
+
+    preferences.register()
+    registration_timings.append(("preferences", time.perf_counter() - start))
+
+    sync_features(get_preferences(), registration_timings)
+    registration_timings.append(("total", time.perf_counter() - start))
 
 def unregister():
     keymap.unregister_keymaps()
-    
-    for mod in reversed(modules):
-        mod.unregister()
+    ui.unregister()
+    operators.unregister()
+    preferences.unregister()
 
 if __name__ == "__main__":
     register()
@@ -0,0 +1,256 @@
+"""Batch Set Dimensions and Quick Material swap over .blend libraries.
+
+Runs with plain Python and drives a pool of background Blender workers:
+
+    python batch/run.py --blender /path/to/blender --jobs 8 --log batch_log.jsonl \
+        --dimensions 1 1 1 --replace-materials "placeholder*" --material-type CLAY \
+        assets/
+
+Directories are searched recursively for .blend files. Each worker is one
+Blender process that stays alive and handles file after file, so Blender
+starts once per worker instead of once per file. One JSON line per file is
+appended to the log as soon as it is done; rerunning with the same log
+skips the files already processed successfully, so a crashed or interrupted
+run resumes where it stopped. A worker that crashes or exceeds --timeout is
+restarted and the file is logged with status "crashed" or "timeout".
+"""
+
+import argparse
+import json
+import os
+import queue
+import shutil
+import subprocess
+import sys
+import threading
+import time
+
+WORKER = os.path.join(os.path.dirname(os.path.abspath(__file__)), "worker.py")
+RESULT_PREFIX = "BFA_RESULT "
+
+
+def find_blend_files(paths):
+    """Return the sorted absolute .blend paths given as files or directories"""
+    files = set()
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, _dirnames, filenames in os.walk(path):
+                files.update(
+                    os.path.join(dirpath, name) for name in filenames
+                    if name.lower().endswith(".blend")
+                )
+        else:
+            files.add(path)
+    return sorted(os.path.abspath(path) for path in files)
+
+
+def completed_files(log_path):
+    """Return the paths logged with status ok by previous runs"""
+    done = set()
+    if not os.path.exists(log_path):
+        return done
+    with open(log_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # Last line of a run that was killed while writing
+                continue
+            if entry.get("status") == "ok":
+                done.add(entry["path"])
+    return done
+
+
+def output_path(path, args):
+    """Return where the processed file is saved, None to save in place"""
+    if not args.output_dir:
+        return None
+    return os.path.join(os.path.abspath(args.output_dir), os.path.relpath(path, args.root))
+
+
+class Worker:
+    """One background Blender process fed jobs through stdin"""
+
+    def __init__(self, command):
+        self.command = command
+        self.process = None
+
+    def start(self):
+        self.process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            bufsize=1,
+        )
+
+    def stop(self):
+        if self.process is None:
+            return
+        try:
+            self.process.stdin.close()
+            self.process.wait(timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            self.process.kill()
+            self.process.wait()
+        self.process = None
+
+    def run(self, job, timeout):
+        """Return the result of job, restarting the process if it dies"""
+        if self.process is None:
+            self.start()
+
+        # A hung file is killed by the watchdog, which ends the readline below
+        process = self.process
+        timed_out = threading.Event()
+
+        def kill():
+            timed_out.set()
+            process.kill()
+
+        watchdog = threading.Timer(timeout, kill) if timeout else None
+        if watchdog:
+            watchdog.start()
+        start = time.perf_counter()
+        result = None
+        try:
+            process.stdin.write(json.dumps(job) + "\n")
+            process.stdin.flush()
+            for line in process.stdout:
+                if line.startswith(RESULT_PREFIX):
+                    result = json.loads(line[len(RESULT_PREFIX):])
+                    break
+        except OSError:
+            pass
+        finally:
+            if watchdog:
+                watchdog.cancel()
+                # A kill already under way is finished before timed_out is read
+                watchdog.join()
+
+        # The watchdog may fire right after the result was read: the result
+        # stands, but the killed process must not get the next job
+        if result is not None and not timed_out.is_set():
+            return result
+
+        # No result (the worker crashed or was killed), or killed after it:
+        # the process is replaced
+        process.kill()
+        process.wait()
+        self.process = None
+        if result is not None:
+            return result
+        return {
+            "path": job["path"],
+            "status": "timeout" if timed_out.is_set() else "crashed",
+            "seconds": time.perf_counter() - start,
+        }
+
+
+def worker_command(args):
+    command = [args.blender, "-b", "--factory-startup", "--python", WORKER, "--"]
+    command += ["--objects", *args.objects]
+    if args.dimensions:
+        command += ["--dimensions", *map(str, args.dimensions), "--axes", args.axes]
+        command += ["--pivot", args.pivot, "--orientation", args.orientation]
+    if args.replace_materials:
+        command += ["--replace-materials", *args.replace_materials]
+        command += ["--material-type", args.material_type, "--material-color", args.material_color]
+    if args.dry_run:
+        command.append("--dry-run")
+    return command
+
+
+def run(files, args):
+    """Process files on args.jobs workers, appending results to the log"""
+    jobs = queue.Queue()
+    for path in files:
+        jobs.put({"path": path, "output": output_path(path, args)})
+
+    lock = threading.Lock()
+    counts = {"done": 0, "failed": 0}
+
+    with open(args.log, "a", encoding="utf-8") as log:
+        def work():
+            worker = Worker(worker_command(args))
+            try:
+                while True:
+                    try:
+                        job = jobs.get_nowait()
+                    except queue.Empty:
+                        return
+                    result = worker.run(job, args.timeout)
+                    with lock:
+                        log.write(json.dumps(result) + "\n")
+                        log.flush()
+                        counts["done"] += 1
+                        if result["status"] != "ok":
+                            counts["failed"] += 1
+                        print(f"[{counts['done']}/{len(files)}] {result['status']:8} "
+                              f"{result.get('seconds', 0.0):7.2f} s  {result['path']}", flush=True)
+            finally:
+                worker.stop()
+
+        threads = [threading.Thread(target=work, daemon=True) for _i in range(min(args.jobs, len(files)))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    return counts
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("paths", nargs="+", help=".blend files or directories")
+    parser.add_argument("--blender", default=os.environ.get("BLENDER", "blender"), help="Blender executable")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1, help="Number of Blender workers")
+    parser.add_argument("--log", default="batch_log.jsonl", help="Per-file JSON lines result log")
+    parser.add_argument("--timeout", type=float, default=0.0, help="Seconds per file before the worker is killed (0: none)")
+    parser.add_argument("--output-dir", help="Save processed files here (mirroring the input tree) instead of in place")
+    parser.add_argument("--dry-run", action="store_true", help="Process without saving")
+
+    parser.add_argument("--objects", nargs="+", default=["*"], help="Object name patterns")
+    parser.add_argument("--dimensions", type=float, nargs=3, metavar=("X", "Y", "Z"), help="Set Dimensions targets")
+    parser.add_argument("--axes", default="XYZ", help="Axes to set, e.g. XY")
+    parser.add_argument("--pivot", default='BOUNDS_CENTER', choices=('MEDIAN', 'BOUNDS_CENTER', 'CURSOR'))
+    parser.add_argument("--orientation", default='WORLD', choices=('WORLD', 'LOCAL', 'NORMAL', 'ORIENTED'))
+
+    parser.add_argument("--replace-materials", nargs="+", help="Material name patterns to replace")
+    parser.add_argument("--material-type", default='PLASTIC',
+                        choices=('PLASTIC', 'METAL', 'GLASS', 'EMISSION', 'CLAY'))
+    parser.add_argument("--material-color", default='WHITE',
+                        choices=('WHITE', 'GREY', 'BLACK', 'RED', 'GREEN', 'BLUE', 'YELLOW', 'CYAN', 'MAGENTA'))
+    args = parser.parse_args()
+
+    if not args.dimensions and not args.replace_materials:
+        parser.error("nothing to do, give --dimensions and/or --replace-materials")
+    if shutil.which(args.blender) is None and not os.path.isfile(args.blender):
+        parser.error(f"Blender executable not found: {args.blender}")
+    return args
+
+
+def main():
+    args = parse_args()
+
+    files = find_blend_files(args.paths)
+    args.root = os.path.commonpath([os.path.dirname(path) for path in files]) if files else os.getcwd()
+
+    done = completed_files(args.log)
+    pending = [path for path in files if path not in done]
+    print(f"{len(files)} files, {len(files) - len(pending)} already done, {len(pending)} to process "
+          f"on {min(args.jobs, len(pending))} workers", flush=True)
+    if not pending:
+        return
+
+    start = time.perf_counter()
+    counts = run(pending, args)
+    print(f"Processed {counts['done']} files in {time.perf_counter() - start:.1f} s, "
+          f"{counts['failed']} failed (see {args.log})")
+    if counts["failed"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
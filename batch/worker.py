@@ -0,0 +1,217 @@
+"""Background Blender worker of the batch runner (see batch/run.py).
+
+Started by run.py as:
+
+    blender -b --factory-startup --python batch/worker.py -- <options>
+
+Reads one JSON job per line from stdin ({"path": ..., "output": ...}),
+opens the file, applies Set Dimensions and/or the Quick Material swap,
+saves it and prints one result line prefixed with RESULT_PREFIX. Blender
+itself prints to stdout too, so run.py only reads the prefixed lines.
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import sys
+import tempfile
+import time
+import traceback
+
+import bpy
+import addon_utils
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULE_NAME = "bfa_tools"
+RESULT_PREFIX = "BFA_RESULT "
+
+
+def enable_addon():
+    """Enable the add-on from this checkout, whatever the folder is called"""
+    link_dir = tempfile.mkdtemp(prefix="bfa_batch_")
+    os.symlink(ROOT, os.path.join(link_dir, MODULE_NAME))
+    sys.path.insert(0, link_dir)
+    addon_utils.enable(MODULE_NAME, default_set=True, handle_error=None)
+
+
+def matching(name, patterns):
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in patterns)
+
+
+def target_objects(patterns):
+    """Return one local mesh object per local mesh, among objects matching patterns"""
+    view_layer = bpy.context.view_layer
+    targets = {}
+    for obj in view_layer.objects:
+        if obj.type != 'MESH' or obj.library or obj.data.library:
+            continue
+        if not matching(obj.name, patterns):
+            continue
+        # Scaling a shared mesh scales all of its users, do it once
+        targets.setdefault(obj.data, obj)
+    return list(targets.values())
+
+
+def read_selection_flags(me):
+    """Return the vertex, edge and face select flags of a mesh outside of Edit Mode"""
+    flags = []
+    for collection in (me.vertices, me.edges, me.polygons):
+        values = [False] * len(collection)
+        collection.foreach_get("select", values)
+        flags.append(values)
+    return flags
+
+
+def write_selection_flags(me, flags):
+    for collection, values in zip((me.vertices, me.edges, me.polygons), flags):
+        collection.foreach_set("select", values)
+
+
+def set_dimensions(args):
+    """Run Set Dimensions on the whole mesh of every target object.
+
+    Return the names of the processed and of the skipped objects (hidden in
+    the viewport or in a hidden collection, they can't enter Edit Mode). The
+    hide, selection and active state of the objects and the element
+    selection of the meshes are restored, so the saved file only differs by
+    the dimensions.
+    """
+    view_layer = bpy.context.view_layer
+    objects = target_objects(args.objects)
+    hidden = [obj for obj in objects if obj.hide_get()]
+    selected = list(view_layer.objects.selected)
+    active = view_layer.objects.active
+
+    for obj in hidden:
+        obj.hide_set(False)
+    skipped = [obj for obj in objects if not obj.visible_get()]
+    objects = [obj for obj in objects if obj.visible_get()]
+    element_selection = {obj.data: read_selection_flags(obj.data) for obj in objects}
+
+    try:
+        if objects:
+            for obj in selected:
+                obj.select_set(False)
+            for obj in objects:
+                obj.select_set(True)
+            view_layer.objects.active = objects[0]
+
+            # One Edit Mode for all targets, each one is then measured and
+            # scaled on its own by limiting the objects in mode
+            bpy.ops.object.mode_set(mode='EDIT')
+            bpy.ops.mesh.select_all(action='SELECT')
+            for obj in objects:
+                with bpy.context.temp_override(objects_in_mode=[obj], edit_object=obj, active_object=obj, object=obj):
+                    bpy.ops.bfa.set_dimensions(
+                        'EXEC_DEFAULT',
+                        target_x=args.dimensions[0],
+                        target_y=args.dimensions[1],
+                        target_z=args.dimensions[2],
+                        use_x="X" in args.axes,
+                        use_y="Y" in args.axes,
+                        use_z="Z" in args.axes,
+                        pivot_point=args.pivot,
+                        orientation=args.orientation,
+                    )
+    finally:
+        if bpy.context.object and bpy.context.object.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+        for me, flags in element_selection.items():
+            write_selection_flags(me, flags)
+        for obj in view_layer.objects.selected:
+            obj.select_set(False)
+        for obj in selected:
+            obj.select_set(True)
+        view_layer.objects.active = active
+        for obj in hidden:
+            obj.hide_set(True)
+
+    return [obj.name for obj in objects], [obj.name for obj in skipped]
+
+
+def replace_materials(args):
+    """Remap local materials matching --replace-materials to a Quick Material preset"""
+    from bfa_tools.operators import materials
+
+    placeholders = [
+        mat for mat in bpy.data.materials
+        if mat.library is None and matching(mat.name, args.replace_materials)
+    ]
+    if not placeholders:
+        return 0
+
+    preset = materials.get_preset_material(args.material_type, args.material_color)
+    replaced = 0
+    for mat in placeholders:
+        if mat != preset:
+            mat.user_remap(preset)
+            replaced += 1
+    return replaced
+
+
+def process(job, args):
+    """Process one file and return its result entry"""
+    start = time.perf_counter()
+    result = {"path": job["path"]}
+
+    bpy.ops.wm.open_mainfile(filepath=job["path"], load_ui=False)
+    if bpy.context.object and bpy.context.object.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+    if args.dimensions:
+        processed, skipped = set_dimensions(args)
+        result["objects"] = len(processed)
+        if skipped:
+            result["skipped_objects"] = skipped
+    if args.replace_materials:
+        result["materials_replaced"] = replace_materials(args)
+
+    output = job.get("output")
+    if args.dry_run:
+        pass
+    elif output and output != job["path"]:
+        os.makedirs(os.path.dirname(output), exist_ok=True)
+        bpy.ops.wm.save_as_mainfile(filepath=output, copy=True)
+        result["output"] = output
+    else:
+        bpy.ops.wm.save_mainfile()
+
+    result["status"] = "ok"
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--objects", nargs="+", default=["*"], help="Object name patterns")
+    parser.add_argument("--dimensions", type=float, nargs=3, metavar=("X", "Y", "Z"), help="Target dimensions")
+    parser.add_argument("--axes", default="XYZ", help="Axes to set, e.g. XY")
+    parser.add_argument("--pivot", default='BOUNDS_CENTER', choices=('MEDIAN', 'BOUNDS_CENTER', 'CURSOR'))
+    parser.add_argument("--orientation", default='WORLD', choices=('WORLD', 'LOCAL', 'NORMAL', 'ORIENTED'))
+    parser.add_argument("--replace-materials", nargs="+", help="Material name patterns to replace")
+    parser.add_argument("--material-type", default='PLASTIC')
+    parser.add_argument("--material-color", default='WHITE')
+    parser.add_argument("--dry-run", action="store_true", help="Process without saving")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    enable_addon()
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        job = json.loads(line)
+        try:
+            result = process(job, args)
+        except Exception:
+            result = {"path": job["path"], "status": "error", "error": traceback.format_exc()}
+        print(RESULT_PREFIX + json.dumps(result), flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""Benchmark the oriented bounding box search on packed coordinate arrays.
+
+Run with Blender's Python (NumPy and bmesh are bundled with Blender):
+
+    blender -b --factory-startup --python benchmarks/obb.py -- [--count 1000000]
+"""
+
+import argparse
+import importlib.util
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_arrays():
+    # Load the module on its own, without registering the add-on
+    spec = importlib.util.spec_from_file_location("bfa_arrays", os.path.join(ROOT, "operators", "arrays.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def random_rotation(rng):
+    q, r = np.linalg.qr(rng.normal(size=(3, 3)))
+    q *= np.sign(np.diag(r))
+    if np.linalg.det(q) < 0.0:
+        q[:, 2] *= -1.0
+    return q
+
+
+def make_box(rng, count, size):
+    """Points filling a box of the given size with a random rotation"""
+    points = (rng.random((count, 3)) - 0.5) * size
+    return points @ random_rotation(rng).T
+
+
+def make_shell(rng, count, size):
+    """Points on the surface of an ellipsoid (scan-like), randomly rotated"""
+    points = rng.normal(size=(count, 3))
+    points /= np.linalg.norm(points, axis=1)[:, None]
+    return (points * size / 2) @ random_rotation(rng).T
+
+
+def run(count, repeat):
+    arrays = load_arrays()
+    rng = np.random.default_rng(0)
+    size = np.array((4.0, 2.0, 1.0))
+
+    results = []
+    for name, points in (("box", make_box(rng, count, size)), ("shell", make_shell(rng, count, size))):
+        timings = []
+        for _i in range(repeat):
+            start = time.perf_counter()
+            orientation = arrays.oriented_bounds_orientation(points)
+            timings.append(time.perf_counter() - start)
+
+        min_co, max_co = arrays.frame_bounds(points, orientation)
+        dims = np.sort(max_co - min_co)[::-1]
+        error = np.prod(dims) / np.prod(size) - 1.0
+        results.append((name, min(timings), dims, error))
+        print(f"{name:6} {count:>9} verts  best {min(timings) * 1000:8.1f} ms  "
+              f"dims {np.round(dims, 4)}  volume error {error * 100:+.2f}%")
+
+    return results
+
+
+def main():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    run(args.count, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,288 @@
+"""Headless benchmark suite for the BFA mesh, material and view operators.
+
+Run with Blender in background mode (or with the ``bpy`` module). No
+baseline is shipped: create it on the reference machine first, then compare:
+
+    blender -b --factory-startup --python-exit-code 1 --python benchmarks/run.py -- \
+        --baseline benchmarks/baseline.json --save-baseline
+    blender -b --factory-startup --python-exit-code 1 --python benchmarks/run.py -- \
+        --output bench_output.json --baseline benchmarks/baseline.json
+
+Generates grid meshes from 10k to 5M vertices at several selection
+densities, times the operators and writes the results as JSON. When a
+baseline is given, any case slower than baseline * tolerance fails the run
+(exit code 1), as does a missing baseline file. The run also fails if the
+BMesh and array Smart Deletes leave meshes with different vertex, edge or
+face counts.
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import bpy
+import addon_utils
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULE_NAME = "bfa_tools"
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000, 5_000_000)
+DEFAULT_DENSITIES = (0.1, 0.5, 1.0)
+SELECT_MODES = {
+    'VERT': (True, False, False),
+    'EDGE': (False, True, False),
+    'FACE': (False, False, True),
+}
+
+
+def enable_addon():
+    """Enable the add-on from this checkout, whatever the folder is called"""
+    link_dir = tempfile.mkdtemp(prefix="bfa_bench_")
+    os.symlink(ROOT, os.path.join(link_dir, MODULE_NAME))
+    sys.path.insert(0, link_dir)
+    addon_utils.enable(MODULE_NAME, default_set=True, handle_error=None)
+
+
+def clear_scene():
+    if bpy.context.object and bpy.context.object.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj)
+    for me in list(bpy.data.meshes):
+        bpy.data.meshes.remove(me)
+    for mat in list(bpy.data.materials):
+        bpy.data.materials.remove(mat)
+
+
+def make_grid(vert_count):
+    """Add a grid mesh with about vert_count vertices and make it active"""
+    side = max(2, round(math.sqrt(vert_count)))
+    bpy.ops.mesh.primitive_grid_add(x_subdivisions=side, y_subdivisions=side, size=2.0)
+    return bpy.context.active_object
+
+
+def select_faces(obj, density, seed=0):
+    """Select a random fraction of the faces and flush to edges and verts"""
+    me = obj.data
+    rng = np.random.default_rng(seed)
+
+    face_sel = rng.random(len(me.polygons)) < density
+    loop_starts = np.empty(len(me.polygons), dtype=np.int32)
+    me.polygons.foreach_get("loop_start", loop_starts)
+    loop_verts = np.empty(len(me.loops), dtype=np.int32)
+    me.loops.foreach_get("vertex_index", loop_verts)
+
+    loop_face = np.repeat(np.arange(len(me.polygons)), np.diff(np.append(loop_starts, len(me.loops))))
+    vert_sel = np.zeros(len(me.vertices), dtype=bool)
+    vert_sel[loop_verts[face_sel[loop_face]]] = True
+
+    edge_verts = np.empty(len(me.edges) * 2, dtype=np.int32)
+    me.edges.foreach_get("vertices", edge_verts)
+    edge_sel = vert_sel[edge_verts.reshape(-1, 2)].all(axis=1)
+
+    me.vertices.foreach_set("select", vert_sel)
+    me.edges.foreach_set("select", edge_sel)
+    me.polygons.foreach_set("select", face_sel)
+    me.update()
+
+
+def prepare(vert_count, density, select_mode='VERT'):
+    """Fresh grid with a selection, in edit mode"""
+    clear_scene()
+    obj = make_grid(vert_count)
+    select_faces(obj, density)
+    bpy.context.tool_settings.mesh_select_mode = SELECT_MODES[select_mode]
+    bpy.ops.object.mode_set(mode='EDIT')
+    return obj
+
+
+def timed(func, repeat=1):
+    """Return the best wall time of func over repeat calls"""
+    best = math.inf
+    for _i in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench_set_dimensions(results, sizes, densities, repeat):
+    for size in sizes:
+        for density in densities:
+            obj = prepare(size, density)
+            seconds = timed(lambda: bpy.ops.bfa.set_dimensions(
+                'EXEC_DEFAULT', target_x=1.5, target_y=0.5, target_z=0.0), repeat)
+            record(results, f"set_dimensions/{len(obj.data.vertices)}/{density}", seconds)
+
+
+def mesh_counts(obj):
+    """Return the (verts, edges, faces) counts of obj in edit mode"""
+    obj.update_from_editmode()
+    me = obj.data
+    return len(me.vertices), len(me.edges), len(me.polygons)
+
+
+def bench_smart_delete(results, sizes, densities, repeat):
+    """Time Smart Delete, return the cases where both delete paths disagree"""
+    mismatches = []
+    for size in sizes:
+        for density in densities:
+            for select_mode in SELECT_MODES:
+                # Both delete paths, to place the ARRAY_DELETE_* thresholds
+                counts = {}
+                for action, dissolve, method in (
+                    ("delete", False, 'BMESH'),
+                    ("delete_arrays", False, 'ARRAYS'),
+                    ("dissolve", True, 'BMESH'),
+                ):
+                    best = math.inf
+                    for _i in range(repeat):
+                        # Deleting is destructive, start from a fresh mesh every time
+                        obj = prepare(size, density, select_mode)
+                        verts = len(obj.data.vertices)
+                        best = min(best, timed(lambda: bpy.ops.bfa.smart_delete(
+                            'EXEC_DEFAULT', dissolve=dissolve, method=method)))
+                    name = f"smart_delete/{action}/{select_mode.lower()}/{verts}/{density}"
+                    record(results, name, best)
+                    counts[action] = mesh_counts(obj)
+
+                if counts["delete"] != counts["delete_arrays"]:
+                    mismatches.append((name, counts["delete"], counts["delete_arrays"]))
+    return mismatches
+
+
+def bench_quick_material(results, repeat, calls=100):
+    clear_scene()
+    make_grid(10_000)
+
+    seconds = timed(lambda: bpy.ops.bfa.quick_material(
+        'EXEC_DEFAULT', mat_type='PLASTIC', color_preset='RED', always_new=True), repeat)
+    record(results, "quick_material/single", seconds)
+
+    presets = ('WHITE', 'GREY', 'RED', 'GREEN', 'BLUE')
+
+    def repeated():
+        for i in range(calls):
+            bpy.ops.bfa.quick_material('EXEC_DEFAULT', mat_type='PLASTIC', color_preset=presets[i % len(presets)])
+
+    record(results, f"quick_material/repeated_{calls}", timed(repeated, repeat))
+
+
+def bench_obb(results, sizes, repeat):
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import obb
+
+    for size in sizes:
+        for name, seconds, _dims, _error in obb.run(size, repeat):
+            record(results, f"oriented_box/{name}/{size}", seconds)
+
+
+def record(results, name, seconds):
+    results[name] = seconds
+    print(f"{name:48} {seconds * 1000:10.2f} ms", flush=True)
+
+
+def compare(results, baseline, tolerance, min_delta):
+    """Return the cases slower than the baseline allows"""
+    regressions = []
+    for name, seconds in sorted(results.items()):
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        if seconds > reference * tolerance and seconds - reference > min_delta:
+            regressions.append((name, reference, seconds))
+    return regressions
+
+
+def parse_args():
+    if bpy.app.background and "--" in sys.argv:
+        argv = sys.argv[sys.argv.index("--") + 1:]
+    elif bpy.app.background:
+        argv = []
+    else:
+        # bpy module: plain command line
+        argv = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Vertex counts")
+    parser.add_argument("--densities", type=float, nargs="+", default=DEFAULT_DENSITIES, help="Selected face fractions")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case, the best one is kept")
+    parser.add_argument("--only", nargs="+", choices=("set_dimensions", "smart_delete", "quick_material", "oriented_box"),
+                        help="Run only these groups")
+    parser.add_argument("--output", default="bench_output.json", help="Results JSON file")
+    parser.add_argument("--baseline", help="Baseline JSON file to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Write the results to --baseline instead of comparing")
+    parser.add_argument("--tolerance", type=float, default=1.25, help="Allowed slowdown factor")
+    parser.add_argument("--min-delta", type=float, default=0.005, help="Ignore slowdowns below this many seconds")
+    return parser.parse_args(argv)
+
+
+def main():
+    args = parse_args()
+    enable_addon()
+
+    groups = args.only or ("set_dimensions", "smart_delete", "quick_material", "oriented_box")
+    results = {}
+    mismatches = []
+    if "set_dimensions" in groups:
+        bench_set_dimensions(results, args.sizes, args.densities, args.repeat)
+    if "smart_delete" in groups:
+        mismatches = bench_smart_delete(results, args.sizes, args.densities, args.repeat)
+    if "quick_material" in groups:
+        bench_quick_material(results, args.repeat)
+    if "oriented_box" in groups:
+        bench_obb(results, args.sizes, args.repeat)
+
+    output = {
+        "meta": {
+            "blender_version": bpy.app.version_string,
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "timestamp": time.time(),
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(output, f, indent=2)
+
+    # The array delete must leave the same mesh as the BMesh one
+    for name, bmesh_counts, array_counts in mismatches:
+        print(f"MISMATCH {name}: delete left {bmesh_counts} (verts, edges, faces), "
+              f"delete_arrays left {array_counts}")
+    if mismatches:
+        sys.exit(1)
+
+    if not args.baseline:
+        return
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(output, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return
+
+    if not os.path.exists(args.baseline):
+        # A missing baseline must not pass as "no regressions"
+        print(f"No baseline at {args.baseline}, run with --save-baseline to create it")
+        sys.exit(1)
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+
+    regressions = compare(results, baseline, args.tolerance, args.min_delta)
+    for name, reference, seconds in regressions:
+        print(f"REGRESSION {name}: {reference * 1000:.2f} ms -> {seconds * 1000:.2f} ms "
+              f"({seconds / reference:.2f}x)")
+    if regressions:
+        sys.exit(1)
+    print("No regressions against the baseline")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,17 +1,88 @@
-from . import view
-from . import mesh
-from . import materials
-
-modules = (
-    view,
-    mesh,
-    materials,
+import importlib
+import importlib.util
+import sys
+import time
+
+# Preference toggle -> operator modules registered while it is enabled.
+# Modules are imported on first registration, so disabled features cost
+# nothing at startup. Shared modules are registered once.
+FEATURES = (
+    ("enable_view_tools", ("selection", "scene_bounds", "view")),
+    ("enable_mesh_tools", ("selection", "mesh")),
+    ("enable_material_tools", ("materials",)),
+    ("enable_profiling", ("profiling",)),
 )
 
-def register():
-    for mod in modules:
+# Registered modules, in registration order
+modules = []
+
+
+def enabled_module_names(prefs):
+    names = []
+    for attr, feature_modules in FEATURES:
+        if getattr(prefs, attr):
+            names.extend(name for name in feature_modules if name not in names)
+    return names
+
+
+def sync(prefs, timings=None):
+    """Register the modules of enabled features and unregister the others.
+
+    (name, seconds) of each newly registered module is appended to timings.
+    """
+    names = enabled_module_names(prefs)
+
+    # register_class checks the method signatures, which the profiling
+    # wrappers don't have: unwrap while (re)registering, wrap again below
+    profiling = sys.modules.get(__name__ + ".profiling")
+    if profiling is not None:
+        profiling.uninstall()
+
+    for mod in reversed(modules[:]):
+        if mod.__name__.rpartition(".")[2] not in names:
+            mod.unregister()
+            modules.remove(mod)
+
+    registered = {mod.__name__.rpartition(".")[2] for mod in modules}
+    for name in names:
+        if name in registered:
+            continue
+        start = time.perf_counter()
+        mod = importlib.import_module("." + name, __name__)
         mod.register()
+        modules.append(mod)
+        if timings is not None:
+            timings.append((f"operators.{name}", time.perf_counter() - start))
+
+    # Wrap the registered operators again, including newly enabled features
+    if prefs.enable_profiling:
+        sys.modules[__name__ + ".profiling"].install(prefs.profiling_buffer_size)
+
+
+def lazy_import(name):
+    """Return module name, executed on first attribute access"""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def optional_numpy_module(name):
+    """Return the NumPy backed submodule name (imported on first use), or None without NumPy"""
+    if importlib.util.find_spec("numpy") is None:
+        return None
+    return lazy_import(f"{__name__}.{name}")
+
+
+def register(prefs, timings=None):
+    sync(prefs, timings)
 
 def unregister():
-    for mod in modules:
+    for mod in reversed(modules):
         mod.unregister()
+    modules.clear()
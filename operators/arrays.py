@@ -0,0 +1,565 @@
+"""NumPy helpers for bulk mesh access and vectorized transforms.
+
+Coordinates are read and written with ``foreach_get``/``foreach_set`` so the
+per-vertex work happens in C instead of in Python loops over BMesh elements.
+"""
+
+import bmesh
+import numpy as np
+
+
+def read_edit_mesh(obj):
+    """Return (coords, selection) for the edit-mesh of obj.
+
+    coords is an (N, 3) float64 array in local space and selection an (N,)
+    bool mask. The edit-mesh is flushed to the object data first, so indices
+    match the BMesh vertex indices.
+    """
+    obj.update_from_editmode()
+    return read_mesh(obj.data)
+
+
+def read_mesh(me):
+    """Return (coords, selection) of the vertices of a mesh, see read_edit_mesh"""
+    count = len(me.vertices)
+
+    co = np.empty(count * 3, dtype=np.float32)
+    me.vertices.foreach_get("co", co)
+
+    sel = np.empty(count, dtype=bool)
+    me.vertices.foreach_get("select", sel)
+
+    return co.reshape(count, 3).astype(np.float64), sel
+
+
+def write_edit_mesh(obj, coords):
+    """Write (N, 3) local coords back to the edit-mesh of obj in one bulk set.
+
+    The object data must be in sync with the edit-mesh (see read_edit_mesh).
+    The edit BMesh is reloaded from the data, which keeps selection, hidden
+    state, UVs and other layers intact.
+    """
+    me = obj.data
+    me.vertices.foreach_set("co", np.ascontiguousarray(coords, dtype=np.float32).ravel())
+    reload_edit_mesh(me)
+
+
+def write_mesh(me, coords):
+    """Write (N, 3) local coords to the data of a mesh outside of Edit Mode"""
+    me.vertices.foreach_set("co", np.ascontiguousarray(coords, dtype=np.float32).ravel())
+    me.update()
+
+
+def selection_indices(sel):
+    """Return the indices of a bool mask (cheaper than the mask for repeated writes)"""
+    return np.flatnonzero(sel)
+
+
+def reload_edit_mesh(me):
+    """Reload the edit BMesh of me from the mesh data after a bulk write"""
+    bm = bmesh.from_edit_mesh(me)
+    bm.clear()
+    bm.from_mesh(me)
+    bmesh.update_edit_mesh(me)
+
+
+def assign_edit_face_material(obj, index):
+    """Set material_index of the selected edit-mode faces of obj in one bulk set"""
+    obj.update_from_editmode()
+    me = obj.data
+    count = len(me.polygons)
+
+    sel = np.empty(count, dtype=bool)
+    me.polygons.foreach_get("select", sel)
+    material_index = np.empty(count, dtype=np.int32)
+    me.polygons.foreach_get("material_index", material_index)
+
+    material_index[sel] = index
+    me.polygons.foreach_set("material_index", material_index)
+    reload_edit_mesh(me)
+
+
+def read_edit_normals(obj):
+    """Return the (N, 3) local vertex normals of obj.
+
+    Must be called after read_edit_mesh, which flushes the edit-mesh.
+    """
+    me = obj.data
+    count = len(me.vertices)
+    normals = np.empty(count * 3, dtype=np.float32)
+    me.vertices.foreach_get("normal", normals)
+    return normals.reshape(count, 3).astype(np.float64)
+
+
+def world_normals(normals, mat_world):
+    """Return unit length world space normals from (N, 3) local normals"""
+    # Normals transform with the inverse transpose of the 3x3 part
+    result = normals @ np.linalg.inv(mat_world[:3, :3])
+    result /= np.maximum(np.linalg.norm(result, axis=1), 1e-12)[:, None]
+    return result
+
+
+def as_points(vectors):
+    """Convert a list of Vectors to an (N, 3) float64 array"""
+    return np.array(vectors, dtype=np.float64).reshape(-1, 3)
+
+
+def read_object_boxes(objects, subset=None):
+    """Return (matrices, corners) of every object in a bpy collection.
+
+    matrices is (N, 4, 4) matrix_world (row major), corners the (N, 8, 3)
+    local bound_box corners, both read with a single foreach_get. With
+    subset (a list of objects of the collection) only those are returned,
+    in subset order.
+    """
+    count = len(objects)
+
+    matrices = np.empty(count * 16, dtype=np.float32)
+    objects.foreach_get("matrix_world", matrices)
+    corners = np.empty(count * 24, dtype=np.float32)
+    objects.foreach_get("bound_box", corners)
+
+    # RNA matrices are stored column major
+    matrices = matrices.reshape(count, 4, 4).transpose(0, 2, 1).astype(np.float64)
+    corners = corners.reshape(count, 8, 3).astype(np.float64)
+
+    if subset is not None:
+        wanted = {obj.as_pointer(): i for i, obj in enumerate(subset)}
+        order = np.empty(len(subset), dtype=np.intp)
+        for i, obj in enumerate(objects):
+            j = wanted.get(obj.as_pointer())
+            if j is not None:
+                order[j] = i
+        matrices, corners = matrices[order], corners[order]
+
+    return matrices, corners
+
+
+def boxes_from_objects(objects):
+    """Return (matrices, corners) like read_object_boxes, reading objects one by one"""
+    matrices = np.array([obj.matrix_world for obj in objects], dtype=np.float64).reshape(-1, 4, 4)
+    corners = np.array([obj.bound_box for obj in objects], dtype=np.float64).reshape(-1, 8, 3)
+    return matrices, corners
+
+
+def box_bounds(matrices, corners):
+    """Return the (N, 3) world min and max of N boxes of 8 local corners"""
+    world = np.einsum("nij,nkj->nki", matrices[:, :3, :3], corners) + matrices[:, None, :3, 3]
+    return world.min(axis=1), world.max(axis=1)
+
+
+def box_dimensions(matrices, corners):
+    """Return the (N, 3) dimensions of N boxes along their object axes.
+
+    Same as Object.dimensions: the local box extent times the world scale
+    of each axis.
+    """
+    extents = corners.max(axis=1) - corners.min(axis=1)
+    return extents * np.linalg.norm(matrices[:, :3, :3], axis=1)
+
+
+def box_centers(matrices, corners):
+    """Return the (N, 3) world centers of N boxes of 8 local corners"""
+    centers = (corners.min(axis=1) + corners.max(axis=1)) / 2
+    return np.einsum("nij,nj->ni", matrices[:, :3, :3], centers) + matrices[:, :3, 3]
+
+
+def scale_factors(dims, targets, use_axes):
+    """Return the per-axis factors taking dims to targets.
+
+    Axes that are disabled, or too small to scale, keep a factor of 1.
+    """
+    dims = np.asarray(dims, dtype=np.float64)
+    safe = np.where(dims < 1e-6, 1.0, dims)
+    factors = np.asarray(targets, dtype=np.float64) / safe
+    return np.where((dims < 1e-6) | ~np.asarray(use_axes, dtype=bool), 1.0, factors)
+
+
+def affine_about_pivots(linear, pivots):
+    """Return (N, 4, 4) matrices applying the (N, 3, 3) linear maps around the pivots.
+
+    pivots is (N, 3), or a single (3,) pivot shared by all.
+    """
+    count = len(linear)
+    pivots = np.broadcast_to(pivots, (count, 3))
+    m = np.tile(np.identity(4), (count, 1, 1))
+    m[:, :3, :3] = linear
+    m[:, :3, 3] = pivots - np.einsum("nij,nj->ni", linear, pivots)
+    return m
+
+
+def diagonal_linear(factors, count):
+    """Return count copies of the 3x3 scale by factors along the world axes"""
+    return np.tile(np.diag(factors), (count, 1, 1))
+
+
+def axis_scale_linear(matrices, factors):
+    """Return the (N, 3, 3) world maps scaling each object along its own axes.
+
+    R @ diag(f) @ R^-1 with R the 3x3 part of each matrix_world; pinv keeps
+    objects with a zero scale axis from failing the whole batch.
+    """
+    rot = matrices[:, :3, :3]
+    return (rot * factors[:, None, :]) @ np.linalg.pinv(rot)
+
+
+def local_transforms(matrices, transforms):
+    """Return M^-1 @ T @ M per object: the world transforms T in local space"""
+    # pinv: objects scaled to zero on an axis have no inverse
+    return np.linalg.pinv(matrices) @ transforms @ matrices
+
+
+def is_axis_aligned(matrix):
+    """Whether the linear part of a 4x4 matrix only scales along its axes"""
+    linear = matrix[:3, :3]
+    return np.allclose(linear - np.diag(np.diagonal(linear)), 0.0, atol=1e-6)
+
+
+def compensate(current, target, local):
+    """Return the matrix_world putting geometry transformed by local at target.
+
+    target @ local^-1, or None when that is current already.
+    """
+    # pinv: a mesh flattened to a zero dimension can't be fully undone
+    result = target @ np.linalg.pinv(local)
+    if np.allclose(result, current, atol=1e-6):
+        return None
+    return result
+
+
+def transform_mesh(me, matrix):
+    """Apply a 4x4 matrix to all vertices (and shape keys) of a mesh in bulk"""
+    count = len(me.vertices)
+    co = np.empty(count * 3, dtype=np.float32)
+
+    collections = [me.vertices]
+    if me.shape_keys:
+        collections += [key.data for key in me.shape_keys.key_blocks]
+
+    for collection in collections:
+        collection.foreach_get("co", co)
+        points = transform_points(co.reshape(count, 3).astype(np.float64), matrix)
+        collection.foreach_set("co", points.astype(np.float32).ravel())
+    me.update()
+
+
+def matrix_to_array(matrix):
+    """Convert a mathutils 4x4 Matrix to a float64 array"""
+    return np.array(matrix, dtype=np.float64)
+
+
+def transform_points(points, matrix):
+    """Apply a 4x4 affine matrix to an (N, 3) array of points"""
+    return points @ matrix[:3, :3].T + matrix[:3, 3]
+
+
+def concatenate(points_list):
+    """Stack a list of (N, 3) arrays into one array"""
+    if len(points_list) == 1:
+        return points_list[0]
+    return np.concatenate(points_list)
+
+
+def bounds(points):
+    """Return (min, max, median) of an (N, 3) array of points"""
+    return points.min(axis=0), points.max(axis=0), points.mean(axis=0)
+
+
+def read_edges(me):
+    """Return the (E, 2) vertex indices of the edges of a mesh"""
+    edges = np.empty(len(me.edges) * 2, dtype=np.int32)
+    me.edges.foreach_get("vertices", edges)
+    return edges.reshape(-1, 2)
+
+
+def connected_components(count, edges):
+    """Return the component index (0..K-1) of count nodes linked by (E, 2) edges.
+
+    Vectorized union-find: every pass hooks the root of the higher label
+    onto the lower one for all edges at once, then pointer jumping flattens
+    the trees so each node points at its root. A pass at least halves the
+    number of roots that still have an edge to another root, so the number
+    of passes stays logarithmic and the Python overhead doesn't depend on
+    the number of components.
+    """
+    parent = np.arange(count)
+    while len(edges):
+        a = parent[edges[:, 0]]
+        b = parent[edges[:, 1]]
+        linked = a != b
+        if not linked.any():
+            break
+        # Roots of the higher label hook onto the lower one (never a cycle)
+        np.minimum.at(parent, np.maximum(a, b)[linked], np.minimum(a, b)[linked])
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+        # Edges inside a single component are done
+        edges = edges[linked]
+
+    return np.unique(parent, return_inverse=True)[1].reshape(-1)
+
+
+def selection_islands(edges, sel):
+    """Return (indices, labels, count) of the connected parts of a vertex selection.
+
+    indices are the selected vertex indices, labels their island (0..count-1).
+    Only edges between two selected vertices connect.
+    """
+    indices = np.flatnonzero(sel)
+    local = np.full(len(sel), -1, dtype=np.int64)
+    local[indices] = np.arange(len(indices))
+    edges = local[edges]
+    edges = edges[(edges >= 0).all(axis=1)]
+
+    labels = connected_components(len(indices), edges)
+    return indices, labels, int(labels.max()) + 1 if len(labels) else 0
+
+
+def island_of(indices, labels, vertex):
+    """Return the island of a vertex index, or None when it isn't in the selection"""
+    position = np.searchsorted(indices, vertex)
+    if position < len(indices) and indices[position] == vertex:
+        return int(labels[position])
+    return None
+
+
+def island_bounds(points, labels, count):
+    """Return (min, max, mean) (count, 3) arrays of the points of each island"""
+    order = np.argsort(labels, kind='stable')
+    points = points[order]
+    # Labels are 0..count-1 with every island present, so the sorted runs
+    # start where the label changes and run i is island i
+    starts = np.flatnonzero(np.diff(labels[order], prepend=-1))
+    sizes = np.diff(np.append(starts, len(points)))
+
+    mins = np.minimum.reduceat(points, starts, axis=0)
+    maxs = np.maximum.reduceat(points, starts, axis=0)
+    means = np.add.reduceat(points, starts, axis=0) / sizes[:, None]
+    return mins, maxs, means
+
+
+def scale_islands(points, labels, mat_world, orientation, pivots, factors):
+    """Scale the (N, 3) local points of each island around its own pivot.
+
+    factors are (K, 3) per island and pivots (K, 3), or a single (3,) pivot
+    shared by all, along the orientation axes (a 3x3 array, columns are
+    axes). Returns the new local points.
+    """
+    frame = transform_points(points, mat_world) @ orientation
+    pivots = np.broadcast_to(pivots, factors.shape)[labels]
+    frame = pivots + (frame - pivots) * factors[labels]
+    # pinv: a zero scale axis doesn't fail the whole mesh
+    return transform_points(frame @ orientation.T, np.linalg.pinv(mat_world))
+
+
+def scale_about_pivot(pivot, scale, orientation=None):
+    """Return a 4x4 matrix scaling by scale (per axis) around pivot.
+
+    orientation is an optional 3x3 rotation whose columns are the axes the
+    scale is applied along, world axes are used when None.
+    """
+    pivot = np.asarray(pivot, dtype=np.float64)
+    scale = np.asarray(scale, dtype=np.float64)
+
+    if orientation is None:
+        m3 = np.diag(scale)
+    else:
+        rot = np.asarray(orientation, dtype=np.float64)
+        m3 = (rot * scale) @ rot.T
+
+    m = np.identity(4)
+    m[:3, :3] = m3
+    m[:3, 3] = pivot - m3 @ pivot
+    return m
+
+
+def local_scale_matrix(mat_world, pivot, scale, orientation=None):
+    """Return a 4x4 matrix applying a world-space scale to local coordinates.
+
+    P_local' = M^-1 @ S(pivot) @ M @ P_local, folded into a single matrix so
+    the vertices only need one transform pass.
+    """
+    return np.linalg.inv(mat_world) @ scale_about_pivot(pivot, scale, orientation) @ mat_world
+
+
+# -----------------------------------------------------------------------------
+# Orientations
+#
+# An orientation is a right handed 3x3 rotation whose columns are the
+# measurement axes in world space. Points are expressed in that frame with
+# points @ orientation.
+
+def world_orientation():
+    return np.identity(3)
+
+
+def frame_bounds(points, orientation):
+    """Return (min, max) of points measured along the orientation axes"""
+    local = points @ orientation
+    return local.min(axis=0), local.max(axis=0)
+
+
+def right_handed(orientation):
+    """Flip the last axis of orientation if needed so it is a rotation"""
+    if np.linalg.det(orientation) < 0.0:
+        orientation = orientation.copy()
+        orientation[:, 2] *= -1.0
+    return orientation
+
+
+def principal_axes(points):
+    """Return the principal axes of points, largest variance first"""
+    centered = points - points.mean(axis=0)
+    _values, vectors = np.linalg.eigh(centered.T @ centered)
+    return right_handed(vectors[:, ::-1])
+
+
+def normal_orientation(points, normals):
+    """Return an orientation with Z along the summed normals.
+
+    X follows the main direction of the points in the plane of the normal.
+    Returns None when the normals cancel out.
+    """
+    z_axis = normals.sum(axis=0)
+    length = np.linalg.norm(z_axis)
+    if length < 1e-9:
+        return None
+    z_axis /= length
+
+    # Project the points onto the plane and take its main direction as X
+    centered = points - points.mean(axis=0)
+    planar = centered - np.outer(centered @ z_axis, z_axis)
+    _values, vectors = np.linalg.eigh(planar.T @ planar)
+    x_axis = vectors[:, 2] - z_axis * (vectors[:, 2] @ z_axis)
+    if np.linalg.norm(x_axis) < 1e-9:
+        # Degenerate (e.g. a single vertex), any perpendicular will do
+        x_axis = np.cross(z_axis, (1.0, 0.0, 0.0) if abs(z_axis[0]) < 0.9 else (0.0, 1.0, 0.0))
+    x_axis /= np.linalg.norm(x_axis)
+
+    return np.column_stack((x_axis, np.cross(z_axis, x_axis), z_axis))
+
+
+def convex_hull_2d(points):
+    """Return the convex hull of a small (N, 2) array (monotone chain)"""
+    pts = sorted(set(map(tuple, points)))
+    if len(pts) <= 2:
+        return np.array(pts)
+
+    def half(sequence):
+        hull = []
+        for p in sequence:
+            while len(hull) >= 2:
+                (ax, ay), (bx, by) = hull[-2], hull[-1]
+                if (bx - ax) * (p[1] - ay) - (by - ay) * (p[0] - ax) > 0.0:
+                    break
+                hull.pop()
+            hull.append(p)
+        return hull
+
+    lower = half(pts)
+    upper = half(reversed(pts))
+    return np.array(lower[:-1] + upper[:-1])
+
+
+def extreme_points(points, directions):
+    """Return the indices of points that are extreme along any direction.
+
+    directions is a (D, 3) array. The projection runs in float32 with one
+    (D, N) product, so the arg reductions walk contiguous rows.
+    """
+    proj = directions.astype(np.float32) @ points.T.astype(np.float32)
+    return np.unique(np.concatenate((proj.argmin(axis=1), proj.argmax(axis=1))))
+
+
+def min_area_angle(points_2d):
+    """Return the rotation angle of the minimum area rectangle of points_2d.
+
+    Rotating calipers: the optimal rectangle has a side on a hull edge, so
+    every hull edge direction is evaluated at once.
+    """
+    hull = convex_hull_2d(points_2d)
+    if len(hull) < 3:
+        return 0.0
+
+    edges = np.roll(hull, -1, axis=0) - hull
+    edge_angles = np.arctan2(edges[:, 1], edges[:, 0])
+    cos, sin = np.cos(edge_angles), np.sin(edge_angles)
+
+    # Hull coordinates along every edge direction and its perpendicular
+    u = hull[:, 0, None] * cos + hull[:, 1, None] * sin
+    v = -hull[:, 0, None] * sin + hull[:, 1, None] * cos
+    areas = np.ptp(u, axis=0) * np.ptp(v, axis=0)
+    return float(edge_angles[np.argmin(areas)])
+
+
+def box_volume(points, orientation):
+    min_co, max_co = frame_bounds(points, orientation)
+    return np.prod(max_co - min_co)
+
+
+def hemisphere_directions(count):
+    """Return count evenly spread unit directions on the +Z hemisphere"""
+    # Fibonacci spiral; with min and max taken per direction this covers
+    # the full sphere.
+    i = np.arange(count) + 0.5
+    z = i / count
+    r = np.sqrt(1.0 - z * z)
+    phi = np.pi * (1.0 + 5.0 ** 0.5) * i
+    return np.column_stack((r * np.cos(phi), r * np.sin(phi), z))
+
+
+def oriented_bounds_orientation(points, directions=16, sphere_directions=64, iterations=8):
+    """Return the orientation of a minimum volume box around points.
+
+    Only the extreme points along a fan of directions in each principal
+    plane plus an even spread over the sphere take part in the search, so a
+    few hundred points reach the Python hull step no matter how large the
+    input is. Starting from the principal axes, each axis of the current
+    best box is tried as the "up" axis and the other two are found with a
+    rotating calipers search on the projected candidates, until the volume
+    stops shrinking.
+    """
+    principal = axes = principal_axes(points)
+    if len(points) < 4:
+        return axes
+
+    angles = np.linspace(0.0, np.pi, directions, endpoint=False)
+    cos, sin = np.cos(angles)[:, None], np.sin(angles)[:, None]
+    fans = np.concatenate([
+        cos * axes[:, (up + 1) % 3] + sin * axes[:, (up + 2) % 3]
+        for up in range(3)
+    ] + [hemisphere_directions(sphere_directions)])
+    candidates = points[extreme_points(points, fans)]
+
+    best = axes
+    best_volume = box_volume(candidates, axes)
+
+    for _i in range(iterations):
+        axes = best
+        for up in range(3):
+            u_axis = axes[:, (up + 1) % 3]
+            v_axis = axes[:, (up + 2) % 3]
+            w_axis = axes[:, up]
+
+            angle = min_area_angle(np.column_stack((candidates @ u_axis, candidates @ v_axis)))
+            cos, sin = np.cos(angle), np.sin(angle)
+
+            x_axis = u_axis * cos + v_axis * sin
+            y_axis = -u_axis * sin + v_axis * cos
+            candidate = right_handed(np.column_stack((x_axis, y_axis, w_axis)))
+
+            volume = box_volume(candidates, candidate)
+            if volume < best_volume * (1.0 - 1e-9):
+                best, best_volume = candidate, volume
+
+        if best is axes:
+            break
+
+    # The candidates only approximate the hull, so confirm on all points
+    # that the search actually beat the principal axes.
+    if box_volume(points, best) < box_volume(points, principal):
+        return best
+    return principal
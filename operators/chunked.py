@@ -0,0 +1,158 @@
+"""Chunked execution of long mesh operations from a modal timer.
+
+On huge meshes an operator invoked from the UI hands its work to a Job
+instead of running it in one go. The job is processed in slices on timer
+events, so the UI keeps redrawing, the progress shows in the window
+manager and Esc cancels (the job then restores the original state). The
+operator only finishes, and pushes its single undo step, after the last
+slice.
+"""
+
+import time
+
+import bpy
+
+# Selected elements from which an invoked operator runs chunked
+CHUNKED_THRESHOLD = 500_000
+
+# Target duration of one slice, in seconds
+SLICE_BUDGET = 0.05
+
+# Minimum time between two refreshes of the edited data, in seconds
+REFRESH_INTERVAL = 1.0
+
+
+class ChunkSizer:
+    """Adapt the slice size so a slice takes about budget seconds"""
+
+    def __init__(self, budget=SLICE_BUDGET, initial=10_000, minimum=100):
+        self.budget = budget
+        self.size = initial
+        self.minimum = minimum
+
+    def record(self, count, seconds):
+        if count <= 0 or seconds <= 0.0:
+            return
+        wanted = count * self.budget / seconds
+        # Damped, so one slow slice (e.g. a redraw in between) doesn't collapse it
+        self.size = max(self.minimum, int(min(max(wanted, self.size / 2), self.size * 2)))
+
+
+class Job:
+    """Work split in phases of slices.
+
+    phases() yields (label, total, step) one phase at a time, so a phase can
+    use the results of the previous ones. step(start, stop) processes the
+    items start:stop of the phase. phase_count is the number of phases
+    (for the progress).
+
+    Costs paid once per update (e.g. a full edit-mesh update) belong in
+    refresh(), not in step(): the slice size is fitted to step() alone.
+    """
+
+    phase_count = 1
+
+    def phases(self):
+        raise NotImplementedError
+
+    def refresh(self, context):
+        """Called between slices, at most every REFRESH_INTERVAL, to show the progress"""
+
+    def finish(self, operator, context):
+        """Called after the last slice"""
+
+    def cancel(self, context):
+        """Called on Esc or error, restore the original state"""
+
+
+def use_chunked(operator, count):
+    """Return True if operator should run its count elements as a chunked job"""
+    options = operator.options
+    return (
+        count >= CHUNKED_THRESHOLD
+        and options.is_invoke
+        and not options.is_repeat
+        and not bpy.app.background
+    )
+
+
+class ChunkedOperator:
+    """Operator mixin running a Job from a modal timer, see start_job"""
+
+    def start_job(self, context, job):
+        wm = context.window_manager
+        self._job = job
+        self._phases = job.phases()
+        self._phase = None
+        self._phase_index = -1
+        self._sizer = ChunkSizer()
+        self._refreshed = time.perf_counter()
+        self._timer = wm.event_timer_add(0.001, window=context.window)
+        wm.modal_handler_add(self)
+        wm.progress_begin(0, 100)
+        return {'RUNNING_MODAL'}
+
+    def next_phase(self):
+        """Advance to the next non-empty phase, return False when the job is done"""
+        for phase in self._phases:
+            self._phase_index += 1
+            label, total, step = phase
+            if total:
+                self._phase = [label, total, step, 0]
+                return True
+        return False
+
+    def modal(self, context, event):
+        if event.type == 'ESC' and event.value == 'PRESS':
+            self.end_job(context)
+            self._job.cancel(context)
+            self.report({'INFO'}, f"{self.bl_label} cancelled")
+            return {'CANCELLED'}
+
+        if event.type in {'MIDDLEMOUSE', 'WHEELUPMOUSE', 'WHEELDOWNMOUSE', 'TRACKPADPAN', 'TRACKPADZOOM'}:
+            # View navigation stays available while the job runs
+            return {'PASS_THROUGH'}
+
+        if event.type != 'TIMER' or event.timer != self._timer:
+            # Editing while the job runs would invalidate its data
+            return {'RUNNING_MODAL'}
+
+        try:
+            if self._phase is None and not self.next_phase():
+                return self.finish_job(context)
+
+            label, total, step, position = self._phase
+            stop = min(total, position + self._sizer.size)
+            start_time = time.perf_counter()
+            step(position, stop)
+            self._sizer.record(stop - position, time.perf_counter() - start_time)
+            self._phase[3] = stop
+            if stop >= total:
+                self._phase = None
+            if time.perf_counter() - self._refreshed >= REFRESH_INTERVAL:
+                self._job.refresh(context)
+                self._refreshed = time.perf_counter()
+        except Exception:
+            self.end_job(context)
+            self._job.cancel(context)
+            raise
+
+        self.update_progress(context, label, stop / total)
+        return {'RUNNING_MODAL'}
+
+    def update_progress(self, context, label, phase_fraction):
+        count = max(self._job.phase_count, self._phase_index + 1)
+        fraction = (self._phase_index + phase_fraction) / count
+        context.window_manager.progress_update(int(fraction * 100))
+        context.workspace.status_text_set(f"{self.bl_label}: {label} {fraction:.0%}  |  Esc: cancel")
+
+    def finish_job(self, context):
+        self.end_job(context)
+        self._job.finish(self, context)
+        return {'FINISHED'}
+
+    def end_job(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self._timer)
+        wm.progress_end()
+        context.workspace.status_text_set(None)
@@ -0,0 +1,238 @@
+"""Geometry adapters: the editable points of non-mesh objects as flat arrays.
+
+Every adapter exposes one part of an object (with a single world matrix) as
+an (N, 3) float64 array of local coordinates and an (N,) bool selection,
+read and written with ``foreach_get``/``foreach_set`` per point collection
+(spline, stroke, drawing) instead of per point. Set Dimensions then runs
+the same vectorized bounds, pivot and scale code as for meshes.
+"""
+
+import numpy as np
+
+
+def read_floats(collection, attr, width):
+    data = np.empty(len(collection) * width, dtype=np.float32)
+    collection.foreach_get(attr, data)
+    return data.reshape(-1, width)
+
+
+def read_bools(collection, attr):
+    data = np.empty(len(collection), dtype=bool)
+    collection.foreach_get(attr, data)
+    return data
+
+
+def write_floats(collection, attr, values):
+    collection.foreach_set(attr, np.ascontiguousarray(values, dtype=np.float32).ravel())
+
+
+class Adapter:
+    """Points of one object part: read() -> (coords, selection), write(coords)"""
+
+    def __init__(self, obj, matrix_world=None):
+        self.obj = obj
+        self.matrix_world = obj.matrix_world if matrix_world is None else matrix_world
+
+    def read(self):
+        raise NotImplementedError
+
+    def write(self, coords):
+        raise NotImplementedError
+
+
+class CurveAdapter(Adapter):
+    """Bezier control points with their handles, NURBS and poly points"""
+
+    def read(self):
+        # (collection, attribute, width, count) per block, in array order
+        self.blocks = []
+        coords = []
+        selection = []
+
+        for spline in self.obj.data.splines:
+            if spline.type == 'BEZIER':
+                points = spline.bezier_points
+                # Hidden points are never transformed
+                visible = ~read_bools(points, "hide")
+                control = read_bools(points, "select_control_point") & visible
+                for attr, sel_attr in (
+                    ("co", None),
+                    ("handle_left", "select_left_handle"),
+                    ("handle_right", "select_right_handle"),
+                ):
+                    coords.append(read_floats(points, attr, 3))
+                    # Handles follow their control point, like in transform
+                    selection.append(control if sel_attr is None else control | (read_bools(points, sel_attr) & visible))
+                    self.blocks.append((points, attr, 3, len(points)))
+            else:
+                points = spline.points
+                # 4D homogeneous coordinates, the weight is kept as is
+                co = read_floats(points, "co", 4)
+                coords.append(co[:, :3])
+                selection.append(read_bools(points, "select") & ~read_bools(points, "hide"))
+                self.blocks.append((points, "co", 4, len(points)))
+
+        if not coords:
+            return np.empty((0, 3)), np.empty(0, dtype=bool)
+        return np.concatenate(coords).astype(np.float64), np.concatenate(selection)
+
+    def write(self, coords):
+        start = 0
+        for points, attr, width, count in self.blocks:
+            block = coords[start:start + count]
+            if width == 4:
+                co = read_floats(points, attr, 4)
+                co[:, :3] = block
+                block = co
+            write_floats(points, attr, block)
+            start += count
+        self.obj.data.update_tag()
+
+
+class LatticeAdapter(Adapter):
+    """Lattice points (their deformed position, as moved in Edit Mode)"""
+
+    def read(self):
+        points = self.obj.data.points
+        return read_floats(points, "co_deform", 3).astype(np.float64), read_bools(points, "select")
+
+    def write(self, coords):
+        write_floats(self.obj.data.points, "co_deform", coords)
+        self.obj.data.update_tag()
+
+
+def read_attribute_selection(attributes, count, curve_offsets=None):
+    """Return the point selection from the ".selection" attribute.
+
+    A missing attribute means everything is selected. A selection stored on
+    curves is expanded to their points with curve_offsets.
+    """
+    attribute = attributes.get(".selection")
+    if attribute is None:
+        return np.ones(count, dtype=bool)
+
+    if attribute.data_type == 'BOOLEAN':
+        sel = read_bools(attribute.data, "value")
+    else:
+        sel = read_floats(attribute.data, "value", 1).ravel() > 0.0
+
+    if attribute.domain == 'CURVE' and curve_offsets is not None:
+        sel = np.repeat(sel, np.diff(curve_offsets))
+    return sel
+
+
+class PointCloudAdapter(Adapter):
+    """Point cloud positions"""
+
+    def read(self):
+        attributes = self.obj.data.attributes
+        co = read_floats(attributes["position"].data, "vector", 3).astype(np.float64)
+        return co, read_attribute_selection(attributes, len(co))
+
+    def write(self, coords):
+        write_floats(self.obj.data.attributes["position"].data, "vector", coords)
+        self.obj.data.update_tag()
+
+
+class GreasePencilAdapter(Adapter):
+    """Points of the current drawing of one Grease Pencil layer (Blender 4.3+)"""
+
+    def __init__(self, obj, drawing, matrix_world):
+        super().__init__(obj, matrix_world)
+        self.drawing = drawing
+
+    def read(self):
+        attributes = self.drawing.attributes
+        co = read_floats(attributes["position"].data, "vector", 3).astype(np.float64)
+
+        offsets = None
+        if hasattr(self.drawing, "curve_offsets"):
+            offsets = np.empty(len(self.drawing.curve_offsets), dtype=np.int32)
+            self.drawing.curve_offsets.foreach_get("value", offsets)
+        return co, read_attribute_selection(attributes, len(co), offsets)
+
+    def write(self, coords):
+        write_floats(self.drawing.attributes["position"].data, "vector", coords)
+        if hasattr(self.drawing, "tag_positions_changed"):
+            self.drawing.tag_positions_changed()
+        self.obj.data.update_tag()
+
+
+class LegacyGreasePencilAdapter(Adapter):
+    """Stroke points of the edited frames of one Grease Pencil layer (before 4.3)"""
+
+    def __init__(self, obj, frames, matrix_world):
+        super().__init__(obj, matrix_world)
+        self.frames = frames
+
+    def read(self):
+        self.strokes = [stroke for frame in self.frames for stroke in frame.strokes]
+        if not self.strokes:
+            return np.empty((0, 3)), np.empty(0, dtype=bool)
+        coords = [read_floats(stroke.points, "co", 3) for stroke in self.strokes]
+        selection = [read_bools(stroke.points, "select") for stroke in self.strokes]
+        return np.concatenate(coords).astype(np.float64), np.concatenate(selection)
+
+    def write(self, coords):
+        start = 0
+        for stroke in self.strokes:
+            count = len(stroke.points)
+            write_floats(stroke.points, "co", coords[start:start + count])
+            start += count
+            # Fill triangulation
+            if hasattr(stroke.points, "update"):
+                stroke.points.update()
+        self.obj.data.update_tag()
+
+
+def layer_matrix(obj, layer):
+    """Return the world matrix of a Grease Pencil layer"""
+    for attr in ("matrix_local", "matrix_layer"):
+        matrix = getattr(layer, attr, None)
+        if matrix is not None:
+            return obj.matrix_world @ matrix
+    return obj.matrix_world
+
+
+def grease_pencil_adapters(obj):
+    adapters = []
+    data = obj.data
+    for layer in data.layers:
+        if layer.lock or layer.hide:
+            continue
+        matrix_world = layer_matrix(obj, layer)
+
+        if obj.type == 'GREASEPENCIL':
+            frame = layer.current_frame()
+            if frame is not None and frame.drawing is not None:
+                adapters.append(GreasePencilAdapter(obj, frame.drawing, matrix_world))
+        else:
+            if data.use_multiedit:
+                frames = [frame for frame in layer.frames if frame.select]
+            else:
+                frames = [layer.active_frame] if layer.active_frame else []
+            if frames:
+                adapters.append(LegacyGreasePencilAdapter(obj, frames, matrix_world))
+    return adapters
+
+
+def edit_adapters(context, types):
+    """Return the adapters of every object of types edited in the current mode"""
+    objects = getattr(context, "objects_in_mode", None)
+    if not objects:
+        # No screen context (e.g. background mode), or legacy Grease Pencil
+        objects = [obj for obj in context.view_layer.objects if obj.mode != 'OBJECT']
+
+    adapters = []
+    for obj in objects:
+        if obj.type not in types:
+            continue
+        if obj.type in {'CURVE', 'SURFACE'}:
+            adapters.append(CurveAdapter(obj))
+        elif obj.type == 'LATTICE':
+            adapters.append(LatticeAdapter(obj))
+        elif obj.type == 'POINTCLOUD':
+            adapters.append(PointCloudAdapter(obj))
+        else:
+            adapters.extend(grease_pencil_adapters(obj))
+    return adapters
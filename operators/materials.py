@@ -1,6 +1,12 @@
 import bpy
+import colorsys
+import hashlib
 import random
 
+import bmesh
+
+from .selection import arrays, edit_mesh_objects
+
 class BFA_OT_quick_material(bpy.types.Operator):
     """Create and assign a quick material"""
     bl_idname = "bfa.quick_material"
@@ -29,109 +35,574 @@ class BFA_OT_quick_material(bpy.types.Operator):
             ('YELLOW', "Yellow", ""),
             ('CYAN', "Cyan", ""),
             ('MAGENTA', "Magenta", ""),
-            ('RANDOM', "Random", ""),
+            ('RANDOM', "Random", "A new material with a random color"),
+            ('RANDOM_OBJECT', "Random per Object",
+             "One shared material, every object gets its own color from Object Info > Random"),
         ],
         default='WHITE'
     )
 
+    use_palette: bpy.props.BoolProperty(
+        name="Palette",
+        description="Random per Object picks from a seeded palette instead of the full hue range",
+        default=False
+    )
+
+    palette_size: bpy.props.IntProperty(
+        name="Palette Colors",
+        description="Number of colors in the palette",
+        default=8, min=2, max=32
+    )
+
+    palette_seed: bpy.props.IntProperty(
+        name="Palette Seed",
+        description="Seed the palette colors are generated from",
+        default=0, min=0
+    )
+
+    always_new: bpy.props.BoolProperty(
+        name="Always New",
+        description="Always create a new material instead of reusing an identical one",
+        default=False
+    )
+
     def execute(self, context):
-        obj = context.active_object
-        if not obj or obj.type != 'MESH':
-            self.report({'WARNING'}, "No mesh object active")
-            return {'CANCELLED'}
-
-        # Create Material
-        mat_name = f"BFA_{self.mat_type}_{self.color_preset}"
-        mat = bpy.data.materials.new(name=mat_name)
-        mat.use_nodes = True
-        nodes = mat.node_tree.nodes
-        links = mat.node_tree.links
-        
-        # Clear default nodes
-        nodes.clear()
-        
-        # Output
-        node_out = nodes.new(type='ShaderNodeOutputMaterial')
-        node_out.location = (400, 0)
-        
-        # Shader
-        node_shader = nodes.new(type='ShaderNodeBsdfPrincipled')
-        node_shader.location = (0, 0)
-        
-        links.new(node_shader.outputs[0], node_out.inputs[0])
-        
-        # Determine Color
-        color = (1.0, 1.0, 1.0, 1.0)
-        if self.color_preset == 'WHITE': color = (1.0, 1.0, 1.0, 1.0)
-        elif self.color_preset == 'GREY': color = (0.5, 0.5, 0.5, 1.0)
-        elif self.color_preset == 'BLACK': color = (0.05, 0.05, 0.05, 1.0)
-        elif self.color_preset == 'RED': color = (0.8, 0.05, 0.05, 1.0)
-        elif self.color_preset == 'GREEN': color = (0.05, 0.8, 0.05, 1.0)
-        elif self.color_preset == 'BLUE': color = (0.05, 0.05, 0.8, 1.0)
-        elif self.color_preset == 'YELLOW': color = (0.8, 0.8, 0.05, 1.0)
-        elif self.color_preset == 'CYAN': color = (0.05, 0.8, 0.8, 1.0)
-        elif self.color_preset == 'MAGENTA': color = (0.8, 0.05, 0.8, 1.0)
-        elif self.color_preset == 'RANDOM': color = (random.random(), random.random(), random.random(), 1.0)
-        
-        # Set Properties
-        if self.mat_type == 'PLASTIC':
-            node_shader.inputs['Base Color'].default_value = color
-            node_shader.inputs['Roughness'].default_value = 0.2
-            node_shader.inputs['Specular IOR Level'].default_value = 0.5 # API changed in 4.0, keep generic for now
-            # In 4.0 "Specular" input is "Specular IOR Level" or generic "Specular"? 
-            # 3.6 uses 'Specular'. 4.0 uses 'Specular IOR Level'. 
-            # Smart check:
-            if 'Specular' in node_shader.inputs:
-                node_shader.inputs['Specular'].default_value = 0.5
-            
-        elif self.mat_type == 'METAL':
-            node_shader.inputs['Base Color'].default_value = color
-            node_shader.inputs['Metallic'].default_value = 1.0
-            node_shader.inputs['Roughness'].default_value = 0.1
-            
-        elif self.mat_type == 'GLASS':
-            node_shader.inputs['Base Color'].default_value = color
-            node_shader.inputs['Transmission'].default_value = 1.0 # 3.6
-             # 4.0: Transmission Weight
-            if 'Transmission Weight' in node_shader.inputs:
-                 node_shader.inputs['Transmission Weight'].default_value = 1.0
-            elif 'Transmission' in node_shader.inputs:
-                 node_shader.inputs['Transmission'].default_value = 1.0
-                 
-            node_shader.inputs['Roughness'].default_value = 0.0
-            
-        elif self.mat_type == 'EMISSION':
-            # Principled has emission, or use Emission node
-            node_shader.inputs['Emission Color'].default_value = color # 4.0 compatible?
-            # 3.6: Emission. 4.0: Emission Color
-            if 'Emission' in node_shader.inputs: # Old principled
-                 node_shader.inputs['Emission'].default_value = color
-            elif 'Emission Color' in node_shader.inputs:
-                 node_shader.inputs['Emission Color'].default_value = color
-                 
-            node_shader.inputs['Emission Strength'].default_value = 5.0
-            
-        elif self.mat_type == 'CLAY':
-            node_shader.inputs['Base Color'].default_value = color
-            node_shader.inputs['Roughness'].default_value = 0.9
-            node_shader.inputs['Metallic'].default_value = 0.0
-            if 'Specular' in node_shader.inputs:
-                node_shader.inputs['Specular'].default_value = 0.1
-
-        # Assign to Object
-        if obj.data.materials:
-            # Replace active
-            obj.data.materials[obj.active_material_index] = mat
+        if context.mode == 'EDIT_MESH':
+            # Selected faces of every mesh in edit mode
+            objects = [obj for obj in edit_mesh_objects(context) if obj.data.total_face_sel]
+            if not objects:
+                self.report({'WARNING'}, "No faces selected")
+                return {'CANCELLED'}
+        else:
+            objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+            obj = context.active_object
+            if obj and obj.type == 'MESH' and obj not in objects:
+                objects.append(obj)
+            if not objects:
+                self.report({'WARNING'}, "No mesh object selected")
+                return {'CANCELLED'}
+
+        if self.color_preset == 'RANDOM_OBJECT':
+            # The same material for every object, colored per object
+            # at render time: no material or shader compile per object
+            mat = get_random_object_material(
+                self.mat_type,
+                self.palette_size if self.use_palette else 0,
+                self.palette_seed,
+                self.always_new,
+            )
+        else:
+            mat = get_preset_material(self.mat_type, self.color_preset, self.always_new)
+
+        if context.mode == 'EDIT_MESH':
+            for obj in objects:
+                assign_to_faces(obj, mat)
         else:
-            obj.data.materials.append(mat)
+            # Objects sharing a mesh only need it assigned once
+            for obj in {obj.data: obj for obj in objects}.values():
+                assign_to_object(obj, mat)
 
+        self.report({'INFO'}, f"Assigned {mat.name} to {len(objects)} object(s)")
         return {'FINISHED'}
 
+
+PRESET_COLORS = {
+    'WHITE': (1.0, 1.0, 1.0, 1.0),
+    'GREY': (0.5, 0.5, 0.5, 1.0),
+    'BLACK': (0.05, 0.05, 0.05, 1.0),
+    'RED': (0.8, 0.05, 0.05, 1.0),
+    'GREEN': (0.05, 0.8, 0.05, 1.0),
+    'BLUE': (0.05, 0.05, 0.8, 1.0),
+    'YELLOW': (0.8, 0.8, 0.05, 1.0),
+    'CYAN': (0.05, 0.8, 0.8, 1.0),
+    'MAGENTA': (0.8, 0.05, 0.8, 1.0),
+}
+
+
+# Principled BSDF values of each preset, by Blender 4.x socket name.
+# PRESET_COLOR stands for the color chosen on the operator.
+PRESET_COLOR = "COLOR"
+
+PRESETS = {
+    'PLASTIC': {
+        'Base Color': PRESET_COLOR,
+        'Roughness': 0.2,
+        'Specular IOR Level': 0.5,
+    },
+    'METAL': {
+        'Base Color': PRESET_COLOR,
+        'Metallic': 1.0,
+        'Roughness': 0.1,
+    },
+    'GLASS': {
+        'Base Color': PRESET_COLOR,
+        'Transmission Weight': 1.0,
+        'Roughness': 0.0,
+    },
+    # Principled has emission, no need for an Emission node
+    'EMISSION': {
+        'Emission Color': PRESET_COLOR,
+        'Emission Strength': 5.0,
+    },
+    'CLAY': {
+        'Base Color': PRESET_COLOR,
+        'Roughness': 0.9,
+        'Metallic': 0.0,
+        'Specular IOR Level': 0.1,
+    },
+}
+
+
+def preset_inputs(mat_type, color):
+    """Return the Principled BSDF input values of a preset, by 4.x socket name"""
+    return {
+        name: color if value == PRESET_COLOR else value
+        for name, value in PRESETS.get(mat_type, {}).items()
+    }
+
+
+def get_preset_material(mat_type, color_preset, always_new=False):
+    """Return the material of a preset, reusing an identical one unless always_new"""
+    # Determine Color
+    if color_preset == 'RANDOM':
+        color = (random.random(), random.random(), random.random(), 1.0)
+    else:
+        color = PRESET_COLORS[color_preset]
+
+    inputs = preset_inputs(mat_type, color)
+    key = preset_hash(mat_type, color, inputs)
+
+    # Reuse an equivalent material instead of piling up .001 copies
+    mat = None if always_new else find_preset_material(key)
+    if mat is None:
+        mat = create_preset_material(f"BFA_{mat_type}_{color_preset}", inputs)
+        tag_preset_material(mat, key)
+    return mat
+
+
+def random_ramp_stops(palette_size=0, seed=0):
+    """Return (stops, interpolation) of the Random per Object color ramp.
+
+    stops are (position, color). Without palette_size the ramp covers the
+    hue circle, otherwise it has palette_size constant steps with colors
+    drawn from seed, so the same seed always gives the same palette.
+    """
+    if not palette_size:
+        stops = [
+            (i / 6, (*colorsys.hsv_to_rgb(i / 6, 0.8, 0.8), 1.0))
+            for i in range(7)
+        ]
+        return stops, 'LINEAR'
+
+    rng = random.Random(seed)
+    stops = [
+        (i / palette_size, (*colorsys.hsv_to_rgb(rng.random(), rng.uniform(0.5, 0.9), rng.uniform(0.5, 0.9)), 1.0))
+        for i in range(palette_size)
+    ]
+    return stops, 'CONSTANT'
+
+
+def get_random_object_material(mat_type, palette_size=0, palette_seed=0, always_new=False):
+    """Return the shared Random per Object material of a preset, reusing an identical one"""
+    stops, interpolation = random_ramp_stops(palette_size, palette_seed)
+    inputs = preset_inputs(mat_type, PRESET_COLORS['WHITE'])
+    flat_stops = tuple(v for position, color in stops for v in (position, *color))
+    key = preset_hash(f"{mat_type}_RANDOM_{interpolation}", flat_stops, inputs)
+
+    mat = None if always_new else find_preset_material(key)
+    if mat is None:
+        name = f"BFA_{mat_type}_PALETTE_{palette_seed}" if palette_size else f"BFA_{mat_type}_RANDOM_OBJECT"
+        mat = create_random_object_material(name, inputs, stops, interpolation)
+        tag_preset_material(mat, key)
+    return mat
+
+
+def assign_to_object(obj, mat):
+    """Put mat in the active slot of obj (or its first slot)"""
+    if obj.data.materials:
+        # Replace active
+        obj.data.materials[obj.active_material_index] = mat
+    else:
+        obj.data.materials.append(mat)
+
+
+def assign_to_faces(obj, mat):
+    """Assign mat to the selected faces of obj in edit mode"""
+    me = obj.data
+
+    # Reuse the slot if the material is already on the mesh
+    index = me.materials.find(mat.name)
+    if index == -1:
+        me.materials.append(mat)
+        index = len(me.materials) - 1
+
+    if arrays is not None:
+        arrays.assign_edit_face_material(obj, index)
+    else:
+        bm = bmesh.from_edit_mesh(me)
+        for f in bm.faces:
+            if f.select:
+                f.material_index = index
+        bmesh.update_edit_mesh(me)
+
+
+# -----------------------------------------------------------------------------
+# Material Registry
+#
+# Quick materials are tagged with a hash of their preset parameters, so an
+# identical preset reuses the existing datablock instead of creating
+# BFA_PLASTIC_WHITE.001, .002... (one shader compile each). They also keep
+# the fingerprint of their content, so a material edited by hand is not
+# handed out again as the preset.
+
+PRESET_HASH_PROP = "bfa_preset_hash"
+PRESET_FINGERPRINT_PROP = "bfa_preset_fingerprint"
+
+# preset hash -> material name
+_registry = {}
+
+
+def preset_hash(mat_type, color, inputs):
+    """Return a stable hash of the preset parameters"""
+    def rounded(value):
+        if isinstance(value, (tuple, list)):
+            return tuple(round(v, 4) for v in value)
+        return round(value, 4)
+
+    data = (mat_type, rounded(color), sorted((names, rounded(value)) for names, value in inputs.items()))
+    return hashlib.sha1(repr(data).encode()).hexdigest()[:16]
+
+
+def tag_preset_material(mat, key):
+    """Mark mat as the material of the preset key, with its current content"""
+    mat[PRESET_HASH_PROP] = key
+    mat[PRESET_FINGERPRINT_PROP] = material_fingerprint(mat)
+    _registry[key] = mat.name
+
+
+def is_unedited(mat):
+    """Whether mat still has the content it was tagged with"""
+    return mat.get(PRESET_FINGERPRINT_PROP) == material_fingerprint(mat)
+
+
+def untag_preset_material(mat):
+    """Drop the preset tag of a material edited by hand, it is the user's now"""
+    for prop in (PRESET_HASH_PROP, PRESET_FINGERPRINT_PROP):
+        if prop in mat:
+            del mat[prop]
+
+
+def find_preset_material(key):
+    """Return the existing, unedited material created from the preset key, or None"""
+    name = _registry.get(key)
+    mat = bpy.data.materials.get(name) if name else None
+    if mat is not None and mat.get(PRESET_HASH_PROP) == key:
+        if is_unedited(mat):
+            return mat
+        untag_preset_material(mat)
+
+    # Stale after file load, undo, rename or edit: rebuild from the file
+    _registry.clear()
+    for mat in bpy.data.materials:
+        mat_key = mat.get(PRESET_HASH_PROP)
+        if mat_key is None or mat.library is not None:
+            continue
+        if mat_key == key and not is_unedited(mat):
+            untag_preset_material(mat)
+            continue
+        _registry.setdefault(mat_key, mat.name)
+
+    name = _registry.get(key)
+    return bpy.data.materials.get(name) if name else None
+
+
+# -----------------------------------------------------------------------------
+# Material Construction
+#
+# Quick materials are copies of one template material (Output + Principled
+# BSDF) with only the preset values set, instead of building and linking
+# nodes for every material.
+
+TEMPLATE_NAME = ".BFA_Template"
+SHADER_NODE_NAME = "Principled BSDF"
+
+# Principled BSDF sockets renamed in Blender 4.0: 4.x name -> 3.x name
+LEGACY_SOCKET_NAMES = {
+    'Specular IOR Level': 'Specular',
+    'Transmission Weight': 'Transmission',
+    'Emission Color': 'Emission',
+}
+
+# 4.x socket name -> name in the running Blender, see resolve_socket_names
+_socket_names = None
+
+
+def resolve_socket_names():
+    """Map the preset socket names to the running Blender version (once)"""
+    global _socket_names
+    _socket_names = {} if bpy.app.version >= (4, 0, 0) else dict(LEGACY_SOCKET_NAMES)
+
+
+def socket_name(name):
+    """Return the Principled BSDF socket called name in Blender 4.x"""
+    if _socket_names is None:
+        # Used without registering (e.g. the preview render script)
+        resolve_socket_names()
+    return _socket_names.get(name, name)
+
+
+def get_template():
+    """Return the template material, built on first use (and after undo or file load)"""
+    mat = bpy.data.materials.get(TEMPLATE_NAME)
+    if mat is not None and mat.library is None and mat.node_tree and SHADER_NODE_NAME in mat.node_tree.nodes:
+        return mat
+
+    if mat is not None:
+        # Broken or linked: leave the name to the new template
+        mat.name = TEMPLATE_NAME + "_old"
+
+    mat = bpy.data.materials.new(name=TEMPLATE_NAME)
+    mat.use_nodes = True
+    nodes = mat.node_tree.nodes
+    links = mat.node_tree.links
+
+    # Clear default nodes
+    nodes.clear()
+
+    # Output
+    node_out = nodes.new(type='ShaderNodeOutputMaterial')
+    node_out.location = (400, 0)
+
+    # Shader
+    node_shader = nodes.new(type='ShaderNodeBsdfPrincipled')
+    node_shader.name = SHADER_NODE_NAME
+    node_shader.location = (0, 0)
+
+    links.new(node_shader.outputs[0], node_out.inputs[0])
+    return mat
+
+
+def create_preset_material(name, inputs):
+    """Create a new material with a Principled BSDF set to inputs"""
+    mat = get_template().copy()
+    mat.name = name
+
+    node_shader = mat.node_tree.nodes[SHADER_NODE_NAME]
+    for input_name, value in inputs.items():
+        node_shader.inputs[socket_name(input_name)].default_value = value
+
+    return mat
+
+
+# Principled BSDF inputs taking the preset color
+COLOR_SOCKETS = {'Base Color', 'Emission Color'}
+
+
+def create_random_object_material(name, inputs, stops, interpolation):
+    """Create a preset material colored by Object Info > Random through a color ramp"""
+    mat = create_preset_material(name, inputs)
+    nodes = mat.node_tree.nodes
+    links = mat.node_tree.links
+    node_shader = nodes[SHADER_NODE_NAME]
+
+    node_info = nodes.new(type='ShaderNodeObjectInfo')
+    node_info.location = (-600, 0)
+
+    node_ramp = nodes.new(type='ShaderNodeValToRGB')
+    node_ramp.location = (-350, 0)
+    links.new(node_info.outputs['Random'], node_ramp.inputs['Fac'])
+
+    ramp = node_ramp.color_ramp
+    ramp.interpolation = interpolation
+    # A new ramp has two elements, ascending positions keep their order
+    for element, (position, color) in zip(ramp.elements, stops):
+        element.position = position
+        element.color = color
+    for position, color in stops[len(ramp.elements):]:
+        ramp.elements.new(position).color = color
+
+    for input_name in COLOR_SOCKETS.intersection(inputs):
+        links.new(node_ramp.outputs['Color'], node_shader.inputs[socket_name(input_name)])
+
+    return mat
+
+
+# -----------------------------------------------------------------------------
+# Material Clean Up
+
+MATERIAL_PREFIX = "BFA_"
+
+# Datablock collections that own material slots (some only exist in newer versions)
+MATERIAL_OWNERS = (
+    "meshes",
+    "curves",
+    "metaballs",
+    "grease_pencils",
+    "hair_curves",
+    "pointclouds",
+    "volumes",
+)
+
+
+def rounded_value(value):
+    """Return a hashable, rounded copy of a socket or property value"""
+    if isinstance(value, float):
+        return round(value, 4)
+    if isinstance(value, bpy.types.ID):
+        return value.name
+    if hasattr(value, "__len__") and not isinstance(value, str):
+        return tuple(rounded_value(v) for v in value)
+    return value
+
+
+def node_fingerprint(node, node_index):
+    """Return a hashable description of a node, its settings and input links"""
+    # Node specific settings (e.g. math operation, image), not the generic ones
+    base_props = bpy.types.ShaderNode.bl_rna.properties
+    settings = tuple(
+        (prop.identifier, rounded_value(getattr(node, prop.identifier)))
+        for prop in node.bl_rna.properties
+        if prop.identifier not in base_props and prop.type in {'BOOLEAN', 'INT', 'FLOAT', 'ENUM', 'STRING', 'POINTER'}
+        and (prop.type != 'POINTER' or isinstance(getattr(node, prop.identifier), bpy.types.ID))
+    )
+
+    color_ramp = getattr(node, "color_ramp", None)
+    if color_ramp is not None:
+        settings += (
+            color_ramp.interpolation,
+            color_ramp.color_mode,
+            tuple((rounded_value(e.position), rounded_value(e.color)) for e in color_ramp.elements),
+        )
+
+    inputs = []
+    for socket in node.inputs:
+        if socket.is_linked:
+            link = socket.links[0]
+            inputs.append((socket.identifier, node_index[link.from_node.name], link.from_socket.identifier))
+        elif hasattr(socket, "default_value"):
+            inputs.append((socket.identifier, rounded_value(socket.default_value)))
+
+    return (node.bl_idname, settings, tuple(inputs))
+
+
+def material_fingerprint(mat):
+    """Return a hash of the material settings and node tree content"""
+    data = [
+        rounded_value(mat.diffuse_color),
+        rounded_value(mat.metallic),
+        rounded_value(mat.roughness),
+        mat.blend_method,
+        mat.use_nodes,
+    ]
+
+    if mat.use_nodes and mat.node_tree:
+        nodes = mat.node_tree.nodes
+        # Links refer to nodes by position so renamed nodes still match
+        node_index = {node.name: i for i, node in enumerate(nodes)}
+        data.extend(node_fingerprint(node, node_index) for node in nodes)
+
+    return hashlib.sha1(repr(data).encode()).hexdigest()
+
+
+def canonical_sort_key(mat):
+    """Prefer materials without a .001 suffix, then the most used ones"""
+    base, _sep, suffix = mat.name.rpartition(".")
+    has_suffix = bool(base) and suffix.isdigit()
+    return (has_suffix, -mat.users, mat.name)
+
+
+def remap_materials(remap):
+    """Replace every use of the materials in remap (old -> new)"""
+    # Material slots, in a single pass over the owners instead of one
+    # full-database user_remap per duplicate.
+    for attr in MATERIAL_OWNERS:
+        for data in getattr(bpy.data, attr, ()):
+            if data.library is not None:
+                continue
+            materials = data.materials
+            for i, mat in enumerate(materials):
+                if mat in remap:
+                    materials[i] = remap[mat]
+
+    # Object linked slots
+    for obj in bpy.data.objects:
+        if obj.library is not None:
+            continue
+        for slot in obj.material_slots:
+            if slot.link == 'OBJECT' and slot.material in remap:
+                slot.material = remap[slot.material]
+
+    # Anything else (node groups, drivers, ...) goes through user_remap
+    for old, new in remap.items():
+        old.use_fake_user = False
+        if old.users > 0:
+            old.user_remap(new)
+
+
+class BFA_OT_clean_materials(bpy.types.Operator):
+    """Merge duplicate BFA materials and remove unused ones"""
+    bl_idname = "bfa.clean_materials"
+    bl_label = "Clean Up BFA Materials"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    merge_duplicates: bpy.props.BoolProperty(
+        name="Merge Duplicates",
+        description="Replace materials with identical node trees by a single one",
+        default=True
+    )
+
+    purge_unused: bpy.props.BoolProperty(
+        name="Purge Unused",
+        description="Remove BFA materials without users",
+        default=True
+    )
+
+    def execute(self, context):
+        candidates = [
+            mat for mat in bpy.data.materials
+            if mat.name.startswith(MATERIAL_PREFIX) and mat.library is None
+        ]
+
+        merged = 0
+        if self.merge_duplicates:
+            # Group by fingerprint in one pass, no pairwise comparison
+            groups = {}
+            for mat in candidates:
+                groups.setdefault(material_fingerprint(mat), []).append(mat)
+
+            remap = {}
+            for group in groups.values():
+                if len(group) > 1:
+                    canonical = min(group, key=canonical_sort_key)
+                    for mat in group:
+                        if mat is not canonical:
+                            remap[mat] = canonical
+
+            if remap:
+                remap_materials(remap)
+                merged = len(remap)
+
+        removed = 0
+        if self.purge_unused:
+            unused = [mat for mat in candidates if mat.users == 0]
+            removed = len(unused)
+            if unused:
+                bpy.data.batch_remove(unused)
+
+        # Names may now point to removed materials
+        _registry.clear()
+
+        self.report({'INFO'}, f"Merged {merged} duplicate(s), removed {removed} unused material(s)")
+        return {'FINISHED'}
+
+
 classes = (
     BFA_OT_quick_material,
+    BFA_OT_clean_materials,
 )
 
 def register():
+    resolve_socket_names()
     for cls in classes:
         bpy.utils.register_class(cls)
 
@@ -1,9 +1,53 @@
+import itertools
+
 import bpy
 import bmesh
-from mathutils import Vector
+from mathutils import Matrix, Vector
+
+from . import optional_numpy_module
+from . import chunked
+from . import selection
+from .scene_bounds import BOUNDS_TYPES, BULK_READ_THRESHOLD
+from .selection import (
+    arrays,
+    use_arrays,
+    edit_mesh_objects,
+    read_selections_arrays,
+    combined_world_coords,
+    read_selections_bmesh,
+    bounds_from_vectors,
+)
+
+# Adapters exposing curves, lattices, point clouds and Grease Pencil as
+# arrays, imported on first use. None without NumPy.
+geometry = optional_numpy_module("geometry")
+
+# Array based Smart Delete for huge selections, imported on first use.
+# None without NumPy.
+topology = optional_numpy_module("topology")
+
+# The array delete rebuilds the whole mesh, so it only pays off once many
+# vertices go, both in number and as a part of the mesh. Provisional values,
+# not measured yet: place them at the crossover of the smart_delete/delete
+# and smart_delete/delete_arrays cases of benchmarks/run.py --only smart_delete
+# (which also checks that both paths leave the same mesh). Only the AUTO
+# method uses them, so BMESH stays the default until they are measured.
+ARRAY_DELETE_MIN_SELECTED = 50_000
+ARRAY_DELETE_MIN_FRACTION = 0.05
+
+# Edit modes handled through geometry adapters -> object types they edit
+ADAPTER_MODES = {
+    'EDIT_CURVE': {'CURVE'},
+    'EDIT_SURFACE': {'SURFACE'},
+    'EDIT_LATTICE': {'LATTICE'},
+    'EDIT_POINT_CLOUD': {'POINTCLOUD'},
+    'EDIT_GPENCIL': {'GPENCIL'},
+    'EDIT_GREASE_PENCIL': {'GREASEPENCIL'},
+}
+
 
 class BFA_OT_set_dimensions(bpy.types.Operator):
-    """Set absolute dimensions for selection in World Space"""
+    """Set absolute dimensions for selection in World, Local, Normal or Oriented Box space"""
     bl_idname = "bfa.set_dimensions"
     bl_label = "Set Dimensions"
     bl_options = {'REGISTER', 'UNDO'}
@@ -29,147 +73,825 @@ class BFA_OT_set_dimensions(bpy.types.Operator):
         default='BOUNDS_CENTER'
     )
 
+    orientation: bpy.props.EnumProperty(
+        name="Orientation",
+        description="Axes the selection is measured and scaled along",
+        items=[
+            ('WORLD', "World", "Align to world axes"),
+            ('LOCAL', "Local", "Align to the active object's axes"),
+            ('NORMAL', "Normal", "Align Z to the selection normal"),
+            ('ORIENTED', "Oriented Box", "Align to the minimum volume box around the selection"),
+        ],
+        default='WORLD'
+    )
+
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        items=[
+            ('SELECTION', "Selection", "Size the bounds of the whole selection"),
+            ('ISLANDS', "Individual Islands",
+             "Size every connected part of the selection on its own, around its own pivot"),
+        ],
+        default='SELECTION'
+    )
+
+    # Individual Islands: dimensions the dialog was filled with, see check
+    island_dims: bpy.props.FloatVectorProperty(size=3, options={'HIDDEN', 'SKIP_SAVE'})
+
+    use_evaluated: bpy.props.BoolProperty(
+        name="Evaluated",
+        description="Measure the mesh with its modifiers (as rendered), the scale is still applied to the base mesh",
+        default=False
+    )
+
     @classmethod
     def poll(cls, context):
+        if context.mode in ADAPTER_MODES:
+            return geometry is not None
         return (context.object and context.object.type == 'MESH' and context.mode == 'EDIT_MESH')
 
     def invoke(self, context, event):
         # Initialize properties with current dimensions
-        # This is a bit complex in Execute/Invoke pattern because calculating dims requires BMESH access.
-        # But we want the UI to show current dims when operator starts.
-        # For simplicity in 'Redo Panel', we just rely on defaults or last used?
         # A better UX for "Set Dimensions" is to read current dims FIRST.
-        
-        # We can do this by getting the selection bounds in Invoke.
-        obj = context.edit_object
-        me = obj.data
-        bm = bmesh.from_edit_mesh(me)
-        
-        selected_verts = [v for v in bm.verts if v.select]
-        if not selected_verts:
+        # The combined selection bounds are shared with the BFA Tools panel
+        # through the selection stats cache, so this is usually free.
+        if context.mode in ADAPTER_MODES:
+            dims = self.measure_adapters(context)
+        elif self.mode == 'ISLANDS':
+            if not self.check_islands(context):
+                return {'CANCELLED'}
+            dims = self.measure_islands_dims(context, edit_mesh_objects(context))
+            if dims is not None:
+                # Islands differ, so OK on the unchanged dialog must not
+                # resize them: axes start off and edited fields enable theirs
+                self.island_dims = dims
+                self.use_x = self.use_y = self.use_z = False
+        elif self.orientation == 'WORLD' and not self.use_evaluated:
+            stats = selection.get_selection_stats(context)
+            dims = stats.dimensions if stats else None
+        else:
+            # Other orientations and the evaluated mesh depend on more than
+            # the cached bounds, measure now
+            dims = self.measure(context, edit_mesh_objects(context))
+
+        if dims is None:
             self.report({'WARNING'}, "No vertices selected")
             return {'CANCELLED'}
 
-        # Calculate bounds in WORLD space
-        mat_world = obj.matrix_world
-        
-        # We need efficient min/max
-        # Convert coords to world
-        world_coords = [mat_world @ v.co for v in selected_verts]
-        
-        min_x = min(v.x for v in world_coords)
-        max_x = max(v.x for v in world_coords)
-        min_y = min(v.y for v in world_coords)
-        max_y = max(v.y for v in world_coords)
-        min_z = min(v.z for v in world_coords)
-        max_z = max(v.z for v in world_coords)
-        
-        dims = Vector((max_x - min_x, max_y - min_y, max_z - min_z))
-        
-        self.target_x = dims.x
-        self.target_y = dims.y
-        self.target_z = dims.z
-        
+        self.target_x = dims[0]
+        self.target_y = dims[1]
+        self.target_z = dims[2]
+
         return context.window_manager.invoke_props_dialog(self)
 
+    def check(self, context):
+        if self.mode != 'ISLANDS':
+            return False
+        changed = False
+        for axis, target, filled in zip("xyz", (self.target_x, self.target_y, self.target_z), self.island_dims):
+            if abs(target - filled) > 1e-6 and not getattr(self, f"use_{axis}"):
+                setattr(self, f"use_{axis}", True)
+                changed = True
+        return changed
+
     def execute(self, context):
-        obj = context.edit_object
-        me = obj.data
-        bm = bmesh.from_edit_mesh(me)
-        
-        selected_verts = [v for v in bm.verts if v.select]
-        if not selected_verts:
+        if self.mode == 'ISLANDS' and not self.check_islands(context):
             return {'CANCELLED'}
 
-        mat_world = obj.matrix_world
-        world_coords = [mat_world @ v.co for v in selected_verts]
-        
-        min_x = min(v.x for v in world_coords)
-        max_x = max(v.x for v in world_coords)
-        min_y = min(v.y for v in world_coords)
-        max_y = max(v.y for v in world_coords)
-        min_z = min(v.z for v in world_coords)
-        max_z = max(v.z for v in world_coords)
-        
-        current_dims = Vector((max_x - min_x, max_y - min_y, max_z - min_z))
-        center = Vector(((min_x + max_x) / 2, (min_y + max_y) / 2, (min_z + max_z) / 2))
-        
-        # Determine Transformation Pivot
-        pivot = center # Default BOUNDS_CENTER
-        
+        if context.mode in ADAPTER_MODES:
+            return self.execute_adapters(context)
+
+        # All meshes in edit mode are measured together and scaled
+        # in one operation (one undo step).
+        objects = edit_mesh_objects(context)
+
+        # NumPy path: bulk read, one vectorized transform, bulk write.
+        # The per-vertex loop below is only kept as a fallback.
+        if all(use_arrays(obj) for obj in objects):
+            if self.mode == 'ISLANDS':
+                return self.execute_islands(context, objects)
+            return self.execute_arrays(context, objects)
+        return self.execute_bmesh(context, objects)
+
+    def get_pivot(self, context, center, median):
+        """Return the world space pivot for the current pivot_point"""
+        obj = context.edit_object
+        # Default BOUNDS_CENTER
+        pivot = center
+
         if self.pivot_point == 'MEDIAN':
             # Median of vertices locations
-            # Average of logical coordinates
-            pivot = sum((v for v in world_coords), Vector()) / len(world_coords)
-            
+            pivot = median
+
         elif self.pivot_point == 'CURSOR':
-            pivot = context.scene.cursor.location
-            
-        elif self.pivot_point == 'ACTIVE':
+            pivot = context.scene.cursor.location.copy()
+
+        elif self.pivot_point == 'ACTIVE' and obj and obj.type == 'MESH':
+            bm = bmesh.from_edit_mesh(obj.data)
             elem = bm.select_history.active
             if elem and isinstance(elem, bmesh.types.BMVert):
-                pivot = mat_world @ elem.co
+                pivot = obj.matrix_world @ elem.co
             # Handle edge/face active?
-            # For simplicity, if not vert, fallback to Bounds? Or finding center of active face/edge.
-        
-        # Calculate Scale Factors
-        scale_x = 1.0
-        scale_y = 1.0
-        scale_z = 1.0
-        
+            # For simplicity, if not vert, fallback to Bounds.
+
+        return pivot
+
+    def get_scale(self, current_dims):
+        """Return per-axis scale factors to reach the target dimensions"""
         # Helper to avoid division by zero
-        def get_scale(current, target):
+        def axis_scale(current, target):
             if current < 1e-6: return 1.0 # Cannot scale zero dimension
             return target / current
-            
-        if self.use_x: scale_x = get_scale(current_dims.x, self.target_x)
-        if self.use_y: scale_y = get_scale(current_dims.y, self.target_y)
-        if self.use_z: scale_z = get_scale(current_dims.z, self.target_z)
-        
+
+        scale_x = axis_scale(current_dims[0], self.target_x) if self.use_x else 1.0
+        scale_y = axis_scale(current_dims[1], self.target_y) if self.use_y else 1.0
+        scale_z = axis_scale(current_dims[2], self.target_z) if self.use_z else 1.0
+
+        return Vector((scale_x, scale_y, scale_z))
+
+    def measure(self, context, objects):
+        """Return the selection dimensions along the current orientation"""
+        if all(use_arrays(obj) for obj in objects):
+            selections = self.read_selections(context, objects)
+            if selections:
+                return self.measure_arrays(context, selections)[1]
+        else:
+            selections = read_selections_bmesh(objects)
+            if selections:
+                return self.measure_bmesh(context, selections)[1]
+        return None
+
+    def get_orientation_arrays(self, context, selections, world_coords):
+        """Return the measurement orientation as a 3x3 array (columns are axes)"""
+        if self.orientation == 'LOCAL':
+            # No edit_object in legacy Grease Pencil edit mode
+            obj = context.edit_object or context.active_object
+            return arrays.matrix_to_array(obj.matrix_world.to_quaternion().to_matrix())
+
+        if self.orientation == 'NORMAL':
+            # Only meshes have normals, other geometry is measured along World
+            normals = []
+            for obj, co, sel, mat_world in selections:
+                if obj.type == 'MESH':
+                    normals.append(arrays.world_normals(arrays.read_edit_normals(obj)[sel], mat_world))
+
+            if len(normals) == len(selections):
+                orientation = arrays.normal_orientation(world_coords, arrays.concatenate(normals))
+                if orientation is not None:
+                    return orientation
+
+        if self.orientation == 'ORIENTED':
+            return arrays.oriented_bounds_orientation(world_coords)
+
+        return arrays.world_orientation()
+
+    def measure_arrays(self, context, selections):
+        """Return (orientation, dimensions, center, median) of the selections"""
+        world_coords = combined_world_coords(selections)
+        evaluated = self.get_evaluated_coords(context, selections)
+        if evaluated is not None:
+            world_coords = evaluated
+        orientation = self.get_orientation_arrays(context, selections, world_coords)
+
+        # Bounds along the orientation axes, the center goes back to world space
+        min_co, max_co = arrays.frame_bounds(world_coords, orientation)
+        center = orientation @ ((min_co + max_co) / 2)
+
+        return orientation, max_co - min_co, Vector(center), Vector(world_coords.mean(axis=0))
+
+    def read_selections(self, context, objects):
+        """read_selections_arrays, reading the evaluated coords first when they are used.
+
+        The edit-mesh flush of read_selections_arrays tags the geometry, the
+        depsgraph would then evaluate the modifiers again for the evaluated
+        read. Before it, the cached coords (or the current evaluation) are used.
+        """
+        if self.use_evaluated and context.mode == 'EDIT_MESH':
+            selection.combined_evaluated_coords(context, [obj for obj in objects if obj.data.total_vert_sel])
+        return read_selections_arrays(objects)
+
+    def get_evaluated_coords(self, context, selections):
+        """Return the selected world coords of the evaluated meshes, or None to use the cage"""
+        if not self.use_evaluated or context.mode != 'EDIT_MESH' or arrays is None:
+            return None
+
+        coords = selection.combined_evaluated_coords(context, [entry[0] for entry in selections])
+        if coords is None:
+            self.report({'WARNING'}, "No evaluated vertices map back to the selection, measuring the edit cage")
+        return coords
+
+    def execute_arrays(self, context, objects):
+        # Redo (and axis or pivot changes) reuses the selection read and
+        # measured by the previous run, see selection.SelectionSnapshot.
+        measure_key = (self.orientation, self.use_evaluated, context.edit_object.as_pointer())
+        snapshot = selection.get_snapshot(objects)
+        if snapshot is None or measure_key not in snapshot.measurements:
+            selections = self.read_selections(context, objects)
+            if not selections:
+                return {'CANCELLED'}
+            snapshot = selection.store_snapshot(objects, selections)
+            snapshot.measurements[measure_key] = self.measure_arrays(context, selections)
+
+        selections = snapshot.get_selections(objects)
+        orientation, dims, center, median = snapshot.measurements[measure_key]
+        pivot = self.get_pivot(context, center, median)
+        scale = self.get_scale(dims)
+
+        # Scale along the orientation axes, then fold the world space
+        # scale into one local space matrix per object so every vertex
+        # is transformed once. The snapshot coords stay untouched. After
+        # the undo of a redo, the mesh data still holds the previous result;
+        # only its coords differ and all of them are rewritten here.
+        for obj, co, sel, mat_world in selections:
+            mat = arrays.local_scale_matrix(mat_world, pivot, scale, orientation)
+            result = co.copy()
+            result[sel] = arrays.transform_points(co[sel], mat)
+            arrays.write_edit_mesh(obj, result)
+
+        selection.snapshot_written(snapshot)
+        return {'FINISHED'}
+
+    def check_islands(self, context):
+        """Report and return False when Individual Islands can't run"""
+        if context.mode != 'EDIT_MESH':
+            self.report({'WARNING'}, "Individual Islands only works on meshes")
+            return False
+        if not all(use_arrays(obj) for obj in edit_mesh_objects(context)):
+            self.report({'WARNING'}, "Individual Islands needs NumPy and meshes without shape keys")
+            return False
+        return True
+
+    def measure_islands(self, context, selections):
+        """Return (orientation, islands) of the selections.
+
+        islands holds (indices, labels, min, max, mean) per selection: the
+        selected vertex indices, their island and the bounds of every island
+        along the orientation axes. The orientation is the one of the whole
+        selection, the edit cage is measured (not the evaluated mesh).
+        """
+        world_coords = combined_world_coords(selections)
+        orientation = self.get_orientation_arrays(context, selections, world_coords)
+
+        islands = []
+        for obj, co, sel, mat_world in selections:
+            indices, labels, count = arrays.selection_islands(arrays.read_edges(obj.data), sel)
+            frame = arrays.transform_points(co[indices], mat_world) @ orientation
+            islands.append((indices, labels, *arrays.island_bounds(frame, labels, count)))
+        return orientation, islands
+
+    def measure_islands_dims(self, context, objects):
+        """Return the dimensions of the active island, or None without a selection.
+
+        The active island holds the active element, otherwise it is the
+        first island of the active object.
+        """
+        selections = read_selections_arrays(objects)
+        if not selections:
+            return None
+        _orientation, islands = self.measure_islands(context, selections)
+
+        objs = [obj for obj, _co, _sel, _mat in selections]
+        index = objs.index(context.edit_object) if context.edit_object in objs else 0
+        indices, labels, min_co, max_co, _mean = islands[index]
+
+        island = None
+        bm = bmesh.from_edit_mesh(objs[index].data)
+        elem = bm.select_history.active
+        if elem is not None:
+            vert = elem if isinstance(elem, bmesh.types.BMVert) else elem.verts[0]
+            bm.verts.index_update()
+            island = arrays.island_of(indices, labels, vert.index)
+        if island is None:
+            island = labels[0]
+        return max_co[island] - min_co[island]
+
+    def execute_islands(self, context, objects):
+        # Cached for redo like execute_arrays
+        measure_key = ('ISLANDS', self.orientation, context.edit_object.as_pointer())
+        snapshot = selection.get_snapshot(objects)
+        if snapshot is None or measure_key not in snapshot.measurements:
+            selections = read_selections_arrays(objects)
+            if not selections:
+                return {'CANCELLED'}
+            snapshot = selection.store_snapshot(objects, selections)
+            snapshot.measurements[measure_key] = self.measure_islands(context, selections)
+
+        selections = snapshot.get_selections(objects)
+        orientation, islands = snapshot.measurements[measure_key]
+        targets = (self.target_x, self.target_y, self.target_z)
+        use_axes = (self.use_x, self.use_y, self.use_z)
+
+        count = 0
+        for (obj, co, sel, mat_world), (indices, labels, min_co, max_co, mean) in zip(selections, islands):
+            # Median/Bounds Center per island, the 3D Cursor is shared
+            # (Active Element falls back to the island bounds center)
+            if self.pivot_point == 'MEDIAN':
+                pivots = mean
+            elif self.pivot_point == 'CURSOR':
+                pivots = (arrays.as_points([context.scene.cursor.location]) @ orientation)[0]
+            else:
+                pivots = (min_co + max_co) / 2
+            factors = arrays.scale_factors(max_co - min_co, targets, use_axes)
+
+            result = co.copy()
+            result[indices] = arrays.scale_islands(co[indices], labels, mat_world, orientation, pivots, factors)
+            arrays.write_edit_mesh(obj, result)
+            count += len(mean)
+
+        selection.snapshot_written(snapshot)
+        self.report({'INFO'}, f"Scaled {count} island(s)")
+        return {'FINISHED'}
+
+    def read_adapters(self, context):
+        """Return (adapters, selections) of the edited non-mesh geometry with a selection"""
+        adapters = []
+        selections = []
+        for adapter in geometry.edit_adapters(context, ADAPTER_MODES[context.mode]):
+            co, sel = adapter.read()
+            if sel.any():
+                adapters.append(adapter)
+                selections.append((adapter.obj, co, sel, arrays.matrix_to_array(adapter.matrix_world)))
+        return adapters, selections
+
+    def measure_adapters(self, context):
+        _adapters, selections = self.read_adapters(context)
+        if not selections:
+            return None
+        return self.measure_arrays(context, selections)[1]
+
+    def execute_adapters(self, context):
+        # Same engine as the mesh NumPy path, the adapters only read and
+        # write the points.
+        adapters, selections = self.read_adapters(context)
+        if not selections:
+            return {'CANCELLED'}
+
+        orientation, dims, center, median = self.measure_arrays(context, selections)
+        pivot = self.get_pivot(context, center, median)
+        scale = self.get_scale(dims)
+
+        for adapter, (_obj, co, sel, mat_world) in zip(adapters, selections):
+            mat = arrays.local_scale_matrix(mat_world, pivot, scale, orientation)
+            co[sel] = arrays.transform_points(co[sel], mat)
+            adapter.write(co)
+
+        return {'FINISHED'}
+
+    def get_orientation_bmesh(self, context, selections):
+        """Return the measurement orientation as a 3x3 Matrix (columns are axes)"""
+        if self.orientation == 'LOCAL':
+            return context.edit_object.matrix_world.to_quaternion().to_matrix()
+
+        if self.orientation in {'NORMAL', 'ORIENTED'} and arrays is not None:
+            # Shape key meshes still get the vectorized orientation search
+            world_coords = arrays.as_points([co for _obj, _verts, coords in selections for co in coords])
+            if self.orientation == 'NORMAL':
+                normals = arrays.as_points([
+                    (obj.matrix_world.to_3x3().inverted_safe().transposed() @ v.normal).normalized()
+                    for obj, verts, _coords in selections for v in verts
+                ])
+                orientation = arrays.normal_orientation(world_coords, normals)
+            else:
+                orientation = arrays.oriented_bounds_orientation(world_coords)
+            if orientation is not None:
+                return Matrix(orientation.tolist())
+
+        elif self.orientation == 'NORMAL':
+            normal = Vector()
+            for obj, verts, _coords in selections:
+                normal_matrix = obj.matrix_world.to_3x3().inverted_safe().transposed()
+                for v in verts:
+                    normal += (normal_matrix @ v.normal).normalized()
+            if normal.length > 1e-9:
+                z_axis = normal.normalized()
+                x_axis = z_axis.orthogonal().normalized()
+                return Matrix((x_axis, z_axis.cross(x_axis), z_axis)).transposed()
+
+        elif self.orientation == 'ORIENTED':
+            self.report({'WARNING'}, "Oriented Box requires NumPy, using World axes")
+
+        return Matrix.Identity(3)
+
+    def measure_bmesh(self, context, selections):
+        """Return (orientation, dimensions, center, median) of the selections"""
+        orientation = self.get_orientation_bmesh(context, selections)
+        to_frame = orientation.transposed()
+
+        world_coords = [co for _obj, _verts, coords in selections for co in coords]
+        evaluated = self.get_evaluated_coords(context, selections)
+        if evaluated is not None:
+            world_coords = [Vector(co) for co in evaluated]
+        min_co, max_co, _median = bounds_from_vectors([to_frame @ co for co in world_coords])
+        center = orientation @ ((min_co + max_co) / 2)
+        median = sum(world_coords, Vector()) / len(world_coords)
+
+        return orientation, max_co - min_co, center, median
+
+    def execute_bmesh(self, context, objects):
+        selections = read_selections_bmesh(objects)
+        if not selections:
+            return {'CANCELLED'}
+
+        orientation, dims, center, median = self.measure_bmesh(context, selections)
+        pivot = self.get_pivot(context, center, median)
+        scale = self.get_scale(dims)
+
         # Apply Scaling
-        # To scale in place relative to Pivot:
-        # P' = Pivot + S * (P - Pivot)
-        
-        # We need to apply this to all selected vertices
-        # And convert back to Local Space (since we modify v.co)
-        
-        # Scale Matrix
-        # M_scale = Matrix.Scale(sx, 4, (1,0,0)) @ ... but easier to just do vector math
-        
-        mat_world_inv = mat_world.inverted()
-        
-        # If Pivot is in world space, we can do calculation in world space then transform back?
-        # Or transform pivot to local space?
-        # Doing logic in Local Space:
-        # We computed scale based on World Dimensions, which is correct (users think in World Units).
-        # We computed Pivot in World Space.
-        
-        # Let's perform transform on local coordinates using local pivot and scale?
-        # Wait, if object is rotated, World X scale != Local X scale.
-        # "Set Dimensions" usually implies "Bounding Box aligned to World Axes" for World Dimensions
-        # OR "Bounding Box aligned to Object Axes" for Local Dimensions.
-        # The requirement says "Absolute Dimensions in World Coordinates".
-        # This implies we measure along World Axes and scale along World Axes.
-        
-        for v in selected_verts:
-            p_world = mat_world @ v.co
-            
-            # Apply scale relative to pivot
-            diff = p_world - pivot
-            diff.x *= scale_x
-            diff.y *= scale_y
-            diff.z *= scale_z
-            
-            new_p_world = pivot + diff
-            
-            # Write back to local
-            v.co = mat_world_inv @ new_p_world
-            
-        bmesh.update_edit_mesh(me)
+        # To scale in place relative to Pivot along the orientation axes:
+        # P' = Pivot + R @ S @ R^T @ (P - Pivot)
+        # then convert back to Local Space (since we modify v.co).
+        mat_scale = orientation @ Matrix.Diagonal(scale) @ orientation.transposed()
+
+        for obj, selected_verts, coords in selections:
+            mat_world_inv = obj.matrix_world.inverted()
+
+            for v, p_world in zip(selected_verts, coords):
+                # Write back to local
+                v.co = mat_world_inv @ (pivot + mat_scale @ (p_world - pivot))
+
+            bmesh.update_edit_mesh(obj.data)
+
         return {'FINISHED'}
 
 
-class BFA_OT_smart_delete(bpy.types.Operator):
+class BFA_OT_set_dimensions_modal(BFA_OT_set_dimensions):
+    """Drag or type to set the selection dimensions with a live preview"""
+    bl_idname = "bfa.set_dimensions_modal"
+    bl_label = "Set Dimensions (Interactive)"
+    bl_options = {'REGISTER', 'UNDO', 'GRAB_CURSOR', 'BLOCKING'}
+
+    @classmethod
+    def poll(cls, context):
+        return (context.object and context.object.type == 'MESH' and context.mode == 'EDIT_MESH')
+
+    def invoke(self, context, event):
+        objects = edit_mesh_objects(context)
+        if not all(use_arrays(obj) for obj in objects):
+            # Shape keys or no NumPy: no cheap preview, use the dialog
+            return super().invoke(context, event)
+
+        selections = self.read_selections(context, objects)
+        if not selections:
+            self.report({'WARNING'}, "No vertices selected")
+            return {'CANCELLED'}
+
+        # The preview sizes the whole selection
+        self.mode = 'SELECTION'
+        self._orientation, dims, center, median = self.measure_arrays(context, selections)
+        self._pivot = self.get_pivot(context, center, median)
+        self._dims = tuple(dims)
+        self.target_x, self.target_y, self.target_z = self._dims
+
+        # Snapshot once: (obj, working coords, selected indices, original
+        # selected coords, matrix_world). Every preview frame is one
+        # transform of the original coords, never of the previous frame.
+        self._snapshot = [
+            (obj, co, arrays.selection_indices(sel), co[sel], mat_world)
+            for obj, co, sel, mat_world in selections
+        ]
+
+        # The edit BMesh can only be refreshed by a full reload, far too
+        # slow per frame, so the preview writes the mesh data in Object
+        # Mode and Edit Mode is entered again once at the end, on the same
+        # objects (not whatever is selected then).
+        self._objects = objects
+        self._active = context.view_layer.objects.active
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+        self._start_x = event.mouse_x
+        self._factor = 1.0
+        self._axis = None
+        self._typed = ""
+
+        context.window_manager.modal_handler_add(self)
+        self.update_header(context)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type in {'LEFTMOUSE', 'RET', 'NUMPAD_ENTER'} and event.value == 'PRESS':
+            return self.finish(context, cancel=False)
+
+        if event.type in {'RIGHTMOUSE', 'ESC'} and event.value == 'PRESS':
+            return self.finish(context, cancel=True)
+
+        if event.type == 'MOUSEMOVE' and not self._typed:
+            delta = (event.mouse_x - self._start_x) * 0.01
+            if event.shift:
+                delta *= 0.1
+            factor = max(0.0, 1.0 + delta)
+            if event.ctrl:
+                factor = round(factor, 1)
+            self._factor = factor
+
+        elif event.value != 'PRESS':
+            return {'RUNNING_MODAL'}
+
+        elif event.type in {'X', 'Y', 'Z'}:
+            # Constrain to an axis, press again to release
+            self._axis = None if self._axis == event.type else event.type
+
+        elif event.type == 'BACK_SPACE':
+            self._typed = self._typed[:-1]
+
+        elif event.ascii and event.ascii in "0123456789.":
+            self._typed += event.ascii
+
+        elif event.type in {'MIDDLEMOUSE', 'WHEELUPMOUSE', 'WHEELDOWNMOUSE'}:
+            return {'PASS_THROUGH'}
+
+        else:
+            return {'RUNNING_MODAL'}
+
+        self.update_targets()
+        self.apply_preview()
+        self.update_header(context)
+        return {'RUNNING_MODAL'}
+
+    def typed_value(self):
+        try:
+            return float(self._typed)
+        except ValueError:
+            return None
+
+    def update_targets(self):
+        """Set the operator properties from the drag, typed value and axis"""
+        axes = "XYZ"
+        value = self.typed_value()
+        for i, axis in enumerate(axes):
+            use = self._axis in {None, axis}
+            setattr(self, "use_" + axis.lower(), use)
+            if not use:
+                target = self._dims[i]
+            elif value is not None and self._axis:
+                # Typed with an axis: absolute dimension
+                target = value
+            elif value is not None:
+                # Typed without an axis: scale factor
+                target = self._dims[i] * value
+            else:
+                target = self._dims[i] * self._factor
+            setattr(self, "target_" + axis.lower(), target)
+
+    def apply_preview(self):
+        scale = self.get_scale(self._dims)
+        for obj, co, indices, original, mat_world in self._snapshot:
+            mat = arrays.local_scale_matrix(mat_world, self._pivot, scale, self._orientation)
+            co[indices] = arrays.transform_points(original, mat)
+            arrays.write_mesh(obj.data, co)
+
+    def update_header(self, context):
+        dims = (self.target_x, self.target_y, self.target_z)
+        text = "Dimensions: " + "  ".join(
+            f"{axis} {value:.4g}" for axis, value in zip("XYZ", dims)
+        )
+        if self._typed:
+            text += f"  [{self._typed}] " + ("dimension" if self._axis else "factor")
+        text += "  |  X/Y/Z: axis, type a value, Shift: precise, Ctrl: snap"
+        context.area.header_text_set(text)
+
+    def finish(self, context, cancel):
+        if cancel:
+            for obj, co, indices, original, _mat_world in self._snapshot:
+                co[indices] = original
+                arrays.write_mesh(obj.data, co)
+
+        self.restore_edit_mode(context)
+        context.area.header_text_set(None)
+        self._snapshot = None
+
+        # Only the confirmed result becomes an undo step
+        return {'CANCELLED'} if cancel else {'FINISHED'}
+
+    def restore_edit_mode(self, context):
+        """Enter Edit Mode again on the objects that were in it, keeping the object selection"""
+        view_layer = context.view_layer
+        selected = [obj for obj in view_layer.objects if obj.select_get()]
+        for obj in selected:
+            obj.select_set(False)
+        for obj in self._objects:
+            obj.select_set(True)
+        view_layer.objects.active = self._active
+
+        bpy.ops.object.mode_set(mode='EDIT')
+
+        for obj in self._objects:
+            obj.select_set(False)
+        for obj in selected:
+            obj.select_set(True)
+
+
+class BFA_OT_set_object_dimensions(bpy.types.Operator):
+    """Set absolute dimensions of the selected objects, each on its own or as a group"""
+    bl_idname = "bfa.set_object_dimensions"
+    bl_label = "Set Object Dimensions"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    target_x: bpy.props.FloatProperty(name="X", unit='LENGTH', min=0.0)
+    target_y: bpy.props.FloatProperty(name="Y", unit='LENGTH', min=0.0)
+    target_z: bpy.props.FloatProperty(name="Z", unit='LENGTH', min=0.0)
+
+    use_x: bpy.props.BoolProperty(name="Axis X", default=True)
+    use_y: bpy.props.BoolProperty(name="Axis Y", default=True)
+    use_z: bpy.props.BoolProperty(name="Axis Z", default=True)
+
+    mode: bpy.props.EnumProperty(
+        name="Mode",
+        items=[
+            ('EACH', "Each Object", "Give every object the dimensions, along its own axes"),
+            ('GROUP', "Group", "Give the combined world bounds of the selection the dimensions"),
+        ],
+        default='EACH'
+    )
+
+    pivot_point: bpy.props.EnumProperty(
+        name="Pivot",
+        items=[
+            ('ORIGIN', "Origin", "Object origins (their median for a group)"),
+            ('BOUNDS_CENTER', "Bounds Center", "Center of the bounding box"),
+            ('CURSOR', "3D Cursor", "Use 3D Cursor as pivot"),
+        ],
+        default='ORIGIN'
+    )
+
+    apply_to: bpy.props.EnumProperty(
+        name="Apply To",
+        items=[
+            ('OBJECT', "Object Scale", "Change the object transforms"),
+            ('DATA', "Mesh Data", "Scale the mesh vertices, objects keep their scale"),
+        ],
+        default='OBJECT'
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return context.mode == 'OBJECT' and bool(context.selected_objects)
+
+    def invoke(self, context, event):
+        objects = self.get_objects(context)
+        if not objects or arrays is None:
+            return self.execute(context)
+
+        matrices, corners = read_boxes(context, objects)
+        if self.mode == 'GROUP':
+            dims = group_bounds(matrices, corners)[1]
+        else:
+            # Start from the active object, like the Dimensions in the N panel
+            active = context.active_object
+            index = objects.index(active) if active in objects else 0
+            dims = arrays.box_dimensions(matrices, corners)[index]
+
+        self.target_x, self.target_y, self.target_z = dims
+        return context.window_manager.invoke_props_dialog(self)
+
+    def get_objects(self, context):
+        return [
+            obj for obj in context.selected_objects
+            if obj.type in BOUNDS_TYPES and obj.library is None
+        ]
+
+    def execute(self, context):
+        objects = self.get_objects(context)
+        if not objects:
+            self.report({'WARNING'}, "No objects with dimensions selected")
+            return {'CANCELLED'}
+        if arrays is None:
+            self.report({'ERROR'}, "Set Object Dimensions requires NumPy")
+            return {'CANCELLED'}
+
+        # Parents first, so children are set against their final parent
+        objects.sort(key=hierarchy_depth)
+
+        matrices, corners = read_boxes(context, objects)
+        targets = (self.target_x, self.target_y, self.target_z)
+        use_axes = (self.use_x, self.use_y, self.use_z)
+        cursor = arrays.as_points([context.scene.cursor.location])[0]
+
+        # One world space transform per object: the linear map and its pivot
+        if self.mode == 'GROUP':
+            center, dims = group_bounds(matrices, corners)
+            factors = arrays.scale_factors(dims, targets, use_axes)
+            linear = arrays.diagonal_linear(factors, len(objects))
+            if self.pivot_point == 'BOUNDS_CENTER':
+                pivots = center
+            elif self.pivot_point == 'CURSOR':
+                pivots = cursor
+            else:
+                pivots = matrices[:, :3, 3].mean(axis=0)
+        else:
+            dims = arrays.box_dimensions(matrices, corners)
+            factors = arrays.scale_factors(dims, targets, use_axes)
+            linear = arrays.axis_scale_linear(matrices, factors)
+            if self.pivot_point == 'BOUNDS_CENTER':
+                pivots = arrays.box_centers(matrices, corners)
+            elif self.pivot_point == 'CURSOR':
+                pivots = cursor
+            else:
+                pivots = matrices[:, :3, 3]
+
+        transforms = arrays.affine_about_pivots(linear, pivots)
+        skipped = apply_object_transforms(objects, matrices, transforms, self.apply_to == 'DATA')
+        if skipped:
+            self.report({'WARNING'}, f"{len(skipped)} rotated object(s) without a mesh of their own can't be "
+                                     "scaled along these axes, left unchanged")
+
+        return {'FINISHED'}
+
+
+def read_boxes(context, objects):
+    """Return (matrices, corners) arrays of the evaluated bounds of objects"""
+    if len(objects) > BULK_READ_THRESHOLD:
+        # The bound_box of original objects is synced from their evaluated
+        # copy, so one foreach_get over bpy.data gives evaluated bounds.
+        return arrays.read_object_boxes(bpy.data.objects, objects)
+
+    depsgraph = context.evaluated_depsgraph_get()
+    return arrays.boxes_from_objects([obj.evaluated_get(depsgraph) for obj in objects])
+
+
+def group_bounds(matrices, corners):
+    """Return (center, dimensions) of the combined world bounds of the boxes"""
+    mins, maxs = arrays.box_bounds(matrices, corners)
+    min_co, max_co = mins.min(axis=0), maxs.max(axis=0)
+    return (min_co + max_co) / 2, max_co - min_co
+
+
+def hierarchy_depth(obj):
+    depth = 0
+    while obj.parent:
+        obj = obj.parent
+        depth += 1
+    return depth
+
+
+def apply_object_transforms(objects, matrices, transforms, use_data):
+    """Apply world space transforms to objects, through their transform or mesh data.
+
+    transforms[i] is the (4, 4) world map the geometry of objects[i] should
+    go through. With use_data, each mesh is transformed once in local space;
+    other users of a shared mesh (selected or not) get their transform
+    compensated, so they end up where their own transform asks (or stay
+    where they were).
+
+    matrix_world holds no shear, so a local transform that rotates or shears
+    (e.g. a world axis scale of a rotated object) can't go through the
+    object transform or a compensation. It is baked into the mesh when the
+    object has its own, otherwise the object is left unchanged. Returns the
+    objects left unchanged.
+    """
+    new_matrices = transforms @ matrices
+    local_matrices = arrays.local_transforms(matrices, transforms)
+    aligned = [arrays.is_axis_aligned(matrix) for matrix in local_matrices]
+
+    def own_mesh(obj):
+        return obj.type == 'MESH' and obj.data.library is None
+
+    skipped = set()
+    for i, obj in enumerate(objects):
+        if aligned[i]:
+            continue
+        if not own_mesh(obj):
+            skipped.add(obj)
+        elif obj.data.users > 1:
+            # The other selected users of the mesh would need a sheared compensation
+            skipped.update(other for other in objects if other.data == obj.data)
+
+    # mesh -> index of the object whose transform is baked into it
+    owners = {}
+    for i, obj in enumerate(objects):
+        if obj not in skipped and own_mesh(obj) and (use_data or not aligned[i]):
+            owners.setdefault(obj.data, i)
+
+    local = {}
+    for me, i in owners.items():
+        arrays.transform_mesh(me, local_matrices[i])
+        local[me] = local_matrices[i]
+
+    for i, obj in enumerate(objects):
+        if obj in skipped:
+            continue
+        new_matrix = new_matrices[i]
+        if obj.data in local:
+            if owners[obj.data] == i:
+                continue
+            # Other selected users of the mesh
+            new_matrix = arrays.compensate(matrices[i], new_matrix, local[obj.data])
+        if new_matrix is not None:
+            obj.matrix_world = Matrix(new_matrix.tolist())
+
+    # Users of the transformed meshes outside the selection keep their look
+    if any(me.users > 1 for me in local):
+        selected = set(objects)
+        for obj in bpy.data.objects:
+            if obj.data in local and obj not in selected:
+                current = arrays.matrix_to_array(obj.matrix_world)
+                new_matrix = arrays.compensate(current, current, local[obj.data])
+                if new_matrix is not None:
+                    obj.matrix_world = Matrix(new_matrix.tolist())
+
+    return [obj for obj in objects if obj in skipped]
+
+
+class BFA_OT_smart_delete(chunked.ChunkedOperator, bpy.types.Operator):
     """Context Aware Delete based on selection mode"""
     bl_idname = "bfa.smart_delete"
     bl_label = "Smart Delete"
@@ -181,50 +903,249 @@ class BFA_OT_smart_delete(bpy.types.Operator):
         default=False
     )
 
+    method: bpy.props.EnumProperty(
+        name="Method",
+        items=[
+            ('AUTO', "Automatic", "Arrays for large selections, BMesh otherwise (provisional thresholds)"),
+            ('BMESH', "BMesh", "Delete the elements on the edit BMesh"),
+            ('ARRAYS', "Arrays",
+             "Rebuild the mesh without the deleted elements from arrays "
+             "(delete only, meshes without shape keys, vertex groups or legacy layers)"),
+        ],
+        default='BMESH'
+    )
+
     @classmethod
     def poll(cls, context):
         return (context.object and context.object.type == 'MESH' and context.mode == 'EDIT_MESH')
 
     def execute(self, context):
+        objects = [obj for obj in edit_mesh_objects(context) if obj.data.total_vert_sel]
+        if not objects:
+            self.report({'WARNING'}, "Nothing selected")
+            return {'CANCELLED'}
+
         # Determine selection mode
         # context.tool_settings.mesh_select_mode is a list [Vert, Edge, Face]
-        select_mode = context.tool_settings.mesh_select_mode
-        
-        vert_mode = select_mode[0]
-        edge_mode = select_mode[1]
-        face_mode = select_mode[2]
-
-        # Order of precedence if multiple are active (e.g. shift-click modes):
-        # Face > Edge > Vert is usually "safer" or more comprehensive.
-        
-        target_mode = 'VERT'
-        if face_mode:
-            target_mode = 'FACE'
-        elif edge_mode:
-            target_mode = 'EDGE'
-        elif vert_mode:
-            target_mode = 'VERT'
-            
-        # Call standard delete/dissolve ops
-        if self.dissolve:
-             if target_mode == 'VERT':
-                 bpy.ops.mesh.dissolve_verts()
-             elif target_mode == 'EDGE':
-                 bpy.ops.mesh.dissolve_edges()
-             elif target_mode == 'FACE':
-                 bpy.ops.mesh.dissolve_faces()
-        else:
-             if target_mode == 'VERT':
-                 bpy.ops.mesh.delete(type='VERT')
-             elif target_mode == 'EDGE':
-                 bpy.ops.mesh.delete(type='EDGE')
-             elif target_mode == 'FACE':
-                 bpy.ops.mesh.delete(type='FACE')
-        
+        vert_mode, edge_mode, face_mode = context.tool_settings.mesh_select_mode
+
+        if self.use_array_delete(objects):
+            removed = [0, 0, 0]
+            for obj in objects:
+                for i, count in enumerate(topology.delete_selected(obj, (vert_mode, edge_mode, face_mode))):
+                    removed[i] += count
+            self.report({'INFO'}, "Removed {} vertices, {} edges, {} faces".format(*removed))
+            return {'FINISHED'}
+
+        # Huge selections invoked from the UI are deleted in slices
+        if chunked.use_chunked(self, sum(obj.data.total_vert_sel for obj in objects)):
+            job = DeleteJob(objects, (vert_mode, edge_mode, face_mode), self.dissolve)
+            return self.start_job(context, job)
+
+        # Work on the BMesh directly: no nested operator calls, and all
+        # objects in edit mode are processed in this one undo step.
+        removed = [0, 0, 0]
+        for obj in objects:
+            me = obj.data
+            bm = bmesh.from_edit_mesh(me)
+            before = (len(bm.verts), len(bm.edges), len(bm.faces))
+
+            verts, edges, faces = resolve_delete_selection(bm, vert_mode, edge_mode, face_mode)
+            if self.dissolve:
+                dissolve_geometry(bm, verts, edges, faces)
+            else:
+                delete_geometry(bm, verts, edges, faces)
+
+            after = (len(bm.verts), len(bm.edges), len(bm.faces))
+            for i in range(3):
+                removed[i] += before[i] - after[i]
+
+            bmesh.update_edit_mesh(me)
+
+        self.report({'INFO'}, "Removed {} vertices, {} edges, {} faces".format(*removed))
         return {'FINISHED'}
 
+
+    def use_array_delete(self, objects):
+        """Whether to delete with the array path, see ARRAY_DELETE_MIN_SELECTED"""
+        if self.dissolve or topology is None or self.method == 'BMESH':
+            return False
+        if not all(topology.supports(obj) for obj in objects):
+            if self.method == 'ARRAYS':
+                self.report({'WARNING'}, "Shape keys, vertex groups or legacy layers, deleting with BMesh")
+            return False
+        if self.method == 'ARRAYS':
+            return True
+
+        selected = sum(obj.data.total_vert_sel for obj in objects)
+        total = sum(len(obj.data.vertices) for obj in objects)
+        return selected >= ARRAY_DELETE_MIN_SELECTED and selected >= total * ARRAY_DELETE_MIN_FRACTION
+
+
+def resolve_delete_selection(bm, vert_mode, edge_mode, face_mode):
+    """Return the (verts, edges, faces) to delete for the enabled select modes.
+
+    With several select modes enabled (e.g. shift-click modes) every mode
+    contributes: the highest mode takes all of its selected elements, the
+    lower ones only the selected elements not already covered by a
+    selected element of a higher mode (e.g. a lone selected vertex next to
+    selected faces).
+    """
+    faces = [f for f in bm.faces if f.select] if face_mode else []
+
+    edges = []
+    if edge_mode:
+        if faces:
+            edges = [e for e in bm.edges if lone_selected_edge(e)]
+        else:
+            edges = [e for e in bm.edges if e.select]
+
+    verts = []
+    if vert_mode:
+        if faces or edges:
+            verts = [v for v in bm.verts if lone_selected_vert(v)]
+        else:
+            verts = [v for v in bm.verts if v.select]
+
+    return verts, edges, faces
+
+
+def lone_selected_edge(e):
+    """Selected edge without a selected face"""
+    return e.select and not any(f.select for f in e.link_faces)
+
+
+def lone_selected_vert(v):
+    """Selected vertex without a selected edge"""
+    return v.select and not any(e.select for e in v.link_edges)
+
+
+def collect_selected(seq, result, test):
+    """Return a slice step appending the elements of seq passing test to result"""
+    iterator = iter(seq)
+
+    def step(start, stop):
+        result.extend(elem for elem in itertools.islice(iterator, stop - start) if test(elem))
+
+    return step
+
+
+class DeleteJob(chunked.Job):
+    """Smart Delete in slices: resolve the selection, then delete it.
+
+    Each object gets the same phases (empty ones are skipped): collect the
+    faces, edges and vertices like resolve_delete_selection, then delete
+    them. Deleting a slice never removes elements of another slice of the
+    same kind, so the result matches a single delete. Dissolve merges
+    regions across slices and runs as one slice.
+
+    The edit meshes are only updated in refresh, not after every slice: a
+    full update costs as much as deleting many elements. A copy of each mesh
+    is kept before it is modified, to roll back on cancel.
+    """
+
+    def __init__(self, objects, select_mode, dissolve):
+        self.objects = objects
+        self.select_mode = select_mode
+        self.dissolve = dissolve
+        # Collect faces, edges, vertices, then delete each or dissolve all
+        self.phase_count = (4 if dissolve else 6) * len(objects)
+        self.backups = []
+        self.removed = [0, 0, 0]
+        # Meshes edited since the last refresh
+        self.dirty = set()
+
+    def phases(self):
+        vert_mode, edge_mode, face_mode = self.select_mode
+        for obj in self.objects:
+            me = obj.data
+            bm = bmesh.from_edit_mesh(me)
+            before = (len(bm.verts), len(bm.edges), len(bm.faces))
+            verts, edges, faces = [], [], []
+
+            yield ("Collecting faces", len(bm.faces) if face_mode else 0,
+                   collect_selected(bm.faces, faces, lambda f: f.select))
+            yield ("Collecting edges", len(bm.edges) if edge_mode else 0,
+                   collect_selected(bm.edges, edges, lone_selected_edge if faces else lambda e: e.select))
+            yield ("Collecting vertices", len(bm.verts) if vert_mode else 0,
+                   collect_selected(bm.verts, verts, lone_selected_vert if faces or edges else lambda v: v.select))
+
+            if faces or edges or verts:
+                backup = bpy.data.meshes.new(f"BFA_backup_{me.name}")
+                bm.to_mesh(backup)
+                self.backups.append((me, backup))
+
+            if self.dissolve:
+                def dissolve_step(start, stop, bm=bm, verts=verts, edges=edges, faces=faces, me=me):
+                    dissolve_geometry(bm, verts, edges, faces)
+                    self.dirty.add(me)
+
+                yield "Dissolving", 1 if faces or edges or verts else 0, dissolve_step
+            else:
+                for label, elems, delete_context in (
+                    ("Deleting faces", faces, 'FACES'),
+                    ("Deleting edges", edges, 'EDGES'),
+                    ("Deleting vertices", verts, 'VERTS'),
+                ):
+                    def delete_step(start, stop, bm=bm, elems=elems, delete_context=delete_context, me=me):
+                        bmesh.ops.delete(bm, geom=elems[start:stop], context=delete_context)
+                        self.dirty.add(me)
+
+                    yield label, len(elems), delete_step
+
+            after = (len(bm.verts), len(bm.edges), len(bm.faces))
+            for i in range(3):
+                self.removed[i] += before[i] - after[i]
+
+    def refresh(self, context):
+        for me in self.dirty:
+            bmesh.update_edit_mesh(me)
+        self.dirty.clear()
+
+    def finish(self, operator, context):
+        self.refresh(context)
+        self.remove_backups()
+        operator.report({'INFO'}, "Removed {} vertices, {} edges, {} faces".format(*self.removed))
+
+    def cancel(self, context):
+        for me, backup in self.backups:
+            bm = bmesh.from_edit_mesh(me)
+            bm.clear()
+            bm.from_mesh(backup)
+            bmesh.update_edit_mesh(me)
+        self.dirty.clear()
+        self.remove_backups()
+
+    def remove_backups(self):
+        for _me, backup in self.backups:
+            bpy.data.meshes.remove(backup)
+        self.backups.clear()
+
+
+def delete_geometry(bm, verts, edges, faces):
+    """Delete like mesh.delete(type='FACE'/'EDGE'/'VERT') would"""
+    if faces:
+        bmesh.ops.delete(bm, geom=faces, context='FACES')
+    if edges:
+        bmesh.ops.delete(bm, geom=edges, context='EDGES')
+    if verts:
+        bmesh.ops.delete(bm, geom=verts, context='VERTS')
+
+
+def dissolve_geometry(bm, verts, edges, faces):
+    """Dissolve like mesh.dissolve_faces/edges/verts would"""
+    if faces:
+        bmesh.ops.dissolve_faces(bm, faces=faces, use_verts=False)
+    if edges:
+        bmesh.ops.dissolve_edges(bm, edges=edges, use_verts=True, use_face_split=False)
+    if verts:
+        bmesh.ops.dissolve_verts(bm, verts=verts, use_face_split=False, use_boundary_tear=False)
+
+
 classes = (
     BFA_OT_set_dimensions,
+    BFA_OT_set_dimensions_modal,
+    BFA_OT_set_object_dimensions,
     BFA_OT_smart_delete,
 )
 
@@ -0,0 +1,283 @@
+import bpy
+import collections
+import cProfile
+import functools
+import io
+import json
+import pstats
+import time
+
+from bpy_extras.io_utils import ExportHelper
+
+from .selection import edit_mesh_objects
+
+
+# -----------------------------------------------------------------------------
+# Instrumentation
+#
+# When enabled from the add-on preferences, invoke/execute/modal of every
+# BFA operator is wrapped to record wall time, element counts and call
+# counts. Blender looks the methods up on the class at call time, so they
+# can be swapped while the classes stay registered.
+#
+# A modal operator (e.g. a chunked job) handles many events: their times are
+# summed into one "modal" record, made when it finishes or is cancelled.
+
+INSTRUMENTED_METHODS = ("invoke", "execute", "modal")
+
+# Results of a modal operator that keeps running
+RUNNING_RESULTS = {'RUNNING_MODAL', 'PASS_THROUGH'}
+
+# Most recent calls, oldest dropped first
+records = collections.deque(maxlen=256)
+# (bl_idname, method) -> total number of calls since enabled
+call_counts = collections.Counter()
+
+# (cls, method name) -> function in the class dict, None when inherited
+_originals = {}
+
+# cProfile capture of the next N calls
+_capture = {"remaining": 0, "profile": None, "calls": 0, "rows": []}
+
+
+def instrumented_classes():
+    """Return the BFA operator classes to instrument"""
+    from . import modules
+
+    return [
+        cls for mod in modules
+        for cls in getattr(mod, "classes", ())
+        if issubclass(cls, bpy.types.Operator) and cls not in classes
+    ]
+
+
+def element_counts(context):
+    """Return the selection sizes the operator is about to work on"""
+    if context.mode == 'EDIT_MESH':
+        meshes = [obj.data for obj in edit_mesh_objects(context)]
+        return {
+            "objects": len(meshes),
+            "verts": sum(me.total_vert_sel for me in meshes),
+            "edges": sum(me.total_edge_sel for me in meshes),
+            "faces": sum(me.total_face_sel for me in meshes),
+        }
+    return {"objects": len(context.selected_objects)}
+
+
+def instrument(name, func):
+    """Return the method func wrapped to record the timing of its calls as name"""
+    is_modal = name == "modal"
+
+    @functools.wraps(func)
+    def wrapper(self, context, *args):
+        if not is_modal:
+            counts = element_counts(context)
+        elif not hasattr(self, "_profiling_counts"):
+            # First event: the job hasn't changed anything yet
+            self._profiling_counts = element_counts(context)
+            self._profiling_time = 0.0
+        profile = _capture["profile"] if _capture["remaining"] > 0 else None
+
+        start = time.perf_counter()
+        if profile:
+            profile.enable()
+        try:
+            result = func(self, context, *args)
+        finally:
+            if profile:
+                profile.disable()
+            elapsed = time.perf_counter() - start
+
+        running = isinstance(result, set) and bool(result & RUNNING_RESULTS)
+        if is_modal:
+            self._profiling_time += elapsed
+            if running:
+                return result
+            counts, elapsed = self._profiling_counts, self._profiling_time
+            del self._profiling_counts, self._profiling_time
+
+        # The class is looked up at call time: subclasses inherit the wrapper
+        operator = self.bl_idname
+        records.append({
+            "operator": operator,
+            "method": name,
+            "time_ms": elapsed * 1000.0,
+            "result": sorted(result) if isinstance(result, set) else result,
+            "counts": counts,
+            "timestamp": time.time(),
+        })
+        call_counts[(operator, name)] += 1
+
+        # A call starting a modal job is captured with it, until it ends
+        if profile and not running:
+            _capture["calls"] += 1
+            _capture["remaining"] -= 1
+            if _capture["remaining"] == 0:
+                finish_capture()
+
+        return result
+
+    wrapper.bfa_original = func
+    return wrapper
+
+
+def install(buffer_size=256):
+    """Wrap the operators, keeping previously recorded data"""
+    global records
+    if records.maxlen != buffer_size:
+        records = collections.deque(records, maxlen=buffer_size)
+
+    for cls in instrumented_classes():
+        for name in INSTRUMENTED_METHODS:
+            func = getattr(cls, name, None)
+            if func is None or (cls, name) in _originals:
+                continue
+            # Inherited from an operator wrapped already: wrap the original
+            func = getattr(func, "bfa_original", func)
+            _originals[(cls, name)] = cls.__dict__.get(name)
+            setattr(cls, name, instrument(name, func))
+
+
+def uninstall():
+    """Restore the original operator methods"""
+    for (cls, name), func in _originals.items():
+        if func is None:
+            delattr(cls, name)
+        else:
+            setattr(cls, name, func)
+    _originals.clear()
+
+
+def is_installed():
+    return bool(_originals)
+
+
+def clear():
+    records.clear()
+    call_counts.clear()
+    _capture.update(remaining=0, profile=None, calls=0, rows=[])
+
+
+def start_capture(count):
+    _capture.update(remaining=count, profile=cProfile.Profile(), calls=0, rows=[])
+
+
+def finish_capture():
+    """Turn the running capture into JSON friendly rows"""
+    profile = _capture["profile"]
+    _capture["profile"] = None
+    _capture["remaining"] = 0
+    if profile is None:
+        return
+
+    stats = pstats.Stats(profile, stream=io.StringIO())
+    rows = []
+    for (filename, line, func_name), (_cc, ncalls, tottime, cumtime, _callers) in stats.stats.items():
+        rows.append({
+            "function": f"{filename}:{line}({func_name})",
+            "ncalls": ncalls,
+            "tottime_ms": tottime * 1000.0,
+            "cumtime_ms": cumtime * 1000.0,
+        })
+    rows.sort(key=lambda row: row["cumtime_ms"], reverse=True)
+    _capture["rows"] = rows
+
+
+def capture_status():
+    """Return (remaining calls, captured calls, captured rows)"""
+    return _capture["remaining"], _capture["calls"], _capture["rows"]
+
+
+def summary():
+    """Return per (operator, method) stats of the recorded calls"""
+    groups = collections.defaultdict(list)
+    for record in records:
+        groups[(record["operator"], record["method"])].append(record["time_ms"])
+
+    return [
+        {
+            "operator": operator,
+            "method": method,
+            "calls": call_counts[(operator, method)],
+            "last_ms": times[-1],
+            "mean_ms": sum(times) / len(times),
+            "max_ms": max(times),
+        }
+        for (operator, method), times in sorted(groups.items())
+    ]
+
+
+def export_data():
+    from .. import bl_info
+
+    remaining, calls, rows = capture_status()
+    return {
+        "blender_version": bpy.app.version_string,
+        "addon_version": ".".join(map(str, bl_info["version"])),
+        "summary": summary(),
+        "records": list(records),
+        "profile": {"calls": calls, "pending": remaining, "functions": rows},
+    }
+
+
+class BFA_OT_profiling_export(bpy.types.Operator, ExportHelper):
+    """Export the recorded BFA operator timings as JSON"""
+    bl_idname = "bfa.profiling_export"
+    bl_label = "Export Timings"
+
+    filename_ext = ".json"
+    filter_glob: bpy.props.StringProperty(default="*.json", options={'HIDDEN'})
+
+    def execute(self, context):
+        with open(self.filepath, "w", encoding="utf-8") as f:
+            json.dump(export_data(), f, indent=2)
+        self.report({'INFO'}, f"Timings exported to {self.filepath}")
+        return {'FINISHED'}
+
+
+class BFA_OT_profiling_clear(bpy.types.Operator):
+    """Clear the recorded BFA operator timings"""
+    bl_idname = "bfa.profiling_clear"
+    bl_label = "Clear Timings"
+
+    def execute(self, context):
+        clear()
+        return {'FINISHED'}
+
+
+class BFA_OT_profiling_capture(bpy.types.Operator):
+    """Profile the next BFA operator calls with cProfile"""
+    bl_idname = "bfa.profiling_capture"
+    bl_label = "Capture Profile"
+
+    count: bpy.props.IntProperty(
+        name="Calls",
+        description="Number of operator calls to profile",
+        default=1,
+        min=1
+    )
+
+    @classmethod
+    def poll(cls, context):
+        return is_installed()
+
+    def execute(self, context):
+        start_capture(self.count)
+        self.report({'INFO'}, f"Profiling the next {self.count} BFA operator call(s)")
+        return {'FINISHED'}
+
+
+classes = (
+    BFA_OT_profiling_export,
+    BFA_OT_profiling_clear,
+    BFA_OT_profiling_capture,
+)
+
+def register():
+    for cls in classes:
+        bpy.utils.register_class(cls)
+
+def unregister():
+    uninstall()
+    for cls in classes:
+        bpy.utils.unregister_class(cls)
@@ -0,0 +1,181 @@
+import bpy
+from bpy.app.handlers import persistent
+from mathutils import Vector
+
+from . import optional_numpy_module
+
+# NumPy helpers, imported on first use. None without NumPy, the objects
+# are then read one by one.
+arrays = optional_numpy_module("arrays")
+
+
+# Object types with a meaningful bound_box
+BOUNDS_TYPES = {
+    'MESH', 'CURVE', 'SURFACE', 'META', 'FONT', 'CURVES', 'POINTCLOUD',
+    'VOLUME', 'GPENCIL', 'GREASEPENCIL', 'LATTICE', 'ARMATURE',
+}
+
+# Below this many uncached objects they are read one by one, above it all
+# objects are read with a single foreach_get.
+BULK_READ_THRESHOLD = 64
+
+
+# -----------------------------------------------------------------------------
+# Bounds Cache
+#
+# World space (min, max) per object, kept until a depsgraph update changes
+# the object's transform or data. Collection instances are cached per
+# collection, in collection space, until any object or collection (linked
+# objects, instance offset) changes.
+
+# object.as_pointer() -> (min Vector, max Vector), or None without bounds
+_object_cache = {}
+# collection.as_pointer() -> (min Vector, max Vector), or None when empty
+_collection_cache = {}
+# Pointers of cached collection instancers, stale when any collection is
+_instancers = set()
+
+
+def read_object_bounds(objects):
+    """Fill the cache for objects that have a bound_box"""
+    if arrays is not None and len(objects) > BULK_READ_THRESHOLD:
+        all_objects = bpy.data.objects
+        matrices, corners = arrays.read_object_boxes(all_objects)
+        mins, maxs = arrays.box_bounds(matrices, corners)
+
+        wanted = {obj.as_pointer() for obj in objects}
+        for i, obj in enumerate(all_objects):
+            ptr = obj.as_pointer()
+            if ptr in wanted:
+                _object_cache[ptr] = (Vector(mins[i]), Vector(maxs[i]))
+        return
+
+    for obj in objects:
+        mat_world = obj.matrix_world
+        corners = [mat_world @ Vector(corner) for corner in obj.bound_box]
+        _object_cache[obj.as_pointer()] = merge_bounds([(corner, corner) for corner in corners])
+
+
+def merge_bounds(bounds_list):
+    """Return the (min, max) enclosing a list of (min, max), or None"""
+    bounds_list = [bounds for bounds in bounds_list if bounds is not None]
+    if not bounds_list:
+        return None
+
+    min_co = bounds_list[0][0].copy()
+    max_co = bounds_list[0][1].copy()
+    for entry_min, entry_max in bounds_list[1:]:
+        for i in range(3):
+            min_co[i] = min(min_co[i], entry_min[i])
+            max_co[i] = max(max_co[i], entry_max[i])
+    return min_co, max_co
+
+
+def transform_bounds(bounds, matrix):
+    """Return the world (min, max) of a box transformed by matrix"""
+    if bounds is None:
+        return None
+    (x0, y0, z0), (x1, y1, z1) = bounds
+    corners = [
+        matrix @ Vector((x, y, z))
+        for x in (x0, x1) for y in (y0, y1) for z in (z0, z1)
+    ]
+    return merge_bounds([(corner, corner) for corner in corners])
+
+
+def collection_bounds(collection, visiting=()):
+    """Return the (min, max) of a collection in its own space (instance offset at the origin)"""
+    ptr = collection.as_pointer()
+    if ptr in _collection_cache:
+        return _collection_cache[ptr]
+    if ptr in visiting:
+        # Recursive instancing, ignore
+        return None
+
+    bounds = objects_bounds(collection.all_objects, visiting + (ptr,))
+    if bounds is not None:
+        offset = Vector(collection.instance_offset)
+        bounds = (bounds[0] - offset, bounds[1] - offset)
+
+    _collection_cache[ptr] = bounds
+    return bounds
+
+
+def objects_bounds(objects, visiting=()):
+    """Return the combined world (min, max) of objects, or None"""
+    objects = list(objects)
+
+    missing = [
+        obj for obj in objects
+        if obj.type in BOUNDS_TYPES and obj.as_pointer() not in _object_cache
+    ]
+    if missing:
+        read_object_bounds(missing)
+
+    bounds_list = []
+    for obj in objects:
+        if obj.type in BOUNDS_TYPES:
+            bounds_list.append(_object_cache[obj.as_pointer()])
+
+        elif obj.instance_type == 'COLLECTION' and obj.instance_collection:
+            ptr = obj.as_pointer()
+            if ptr not in _object_cache:
+                local = collection_bounds(obj.instance_collection, visiting)
+                _object_cache[ptr] = transform_bounds(local, obj.matrix_world)
+                _instancers.add(ptr)
+            bounds_list.append(_object_cache[ptr])
+
+    return merge_bounds(bounds_list)
+
+
+def invalidate():
+    _object_cache.clear()
+    _collection_cache.clear()
+    _instancers.clear()
+
+
+@persistent
+def on_depsgraph_update(scene, depsgraph):
+    if not _object_cache:
+        return
+
+    changed = False
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Collection):
+            # Objects linked or unlinked, or the instance offset changed
+            changed = True
+        elif isinstance(update.id, bpy.types.Object):
+            if update.is_updated_transform or update.is_updated_geometry:
+                _object_cache.pop(update.id.original.as_pointer(), None)
+                changed = True
+
+    if changed and _collection_cache:
+        # Any object may be part of an instanced collection
+        _collection_cache.clear()
+        for ptr in _instancers:
+            _object_cache.pop(ptr, None)
+        _instancers.clear()
+
+
+@persistent
+def on_reset(*args):
+    # Undo and file loading re-allocate datablocks, pointers can't be trusted.
+    invalidate()
+
+
+handlers = (
+    (bpy.app.handlers.depsgraph_update_post, on_depsgraph_update),
+    (bpy.app.handlers.undo_post, on_reset),
+    (bpy.app.handlers.redo_post, on_reset),
+    (bpy.app.handlers.load_post, on_reset),
+)
+
+def register():
+    for handler_list, func in handlers:
+        handler_list.append(func)
+
+def unregister():
+    for handler_list, func in handlers:
+        if func in handler_list:
+            handler_list.remove(func)
+    invalidate()
@@ -0,0 +1,468 @@
+import time
+
+import bpy
+import bmesh
+from bpy.app.handlers import persistent
+from mathutils import Vector
+
+from . import optional_numpy_module
+
+# NumPy helpers, imported on first use. None without NumPy, the per-vertex
+# fallback is used then.
+arrays = optional_numpy_module("arrays")
+
+
+def use_arrays(obj):
+    """Whether the NumPy bulk path can be used for obj"""
+    # Shape keys make the edit-mesh coordinates differ from the base mesh,
+    # so we keep the BMesh path for them.
+    return arrays is not None and obj.data.shape_keys is None
+
+
+def edit_mesh_objects(context):
+    """Return all mesh objects currently in edit mode"""
+    objects = getattr(context, "objects_in_mode", None)
+    if objects is None:
+        # No screen context (e.g. background mode)
+        objects = [obj for obj in context.view_layer.objects if obj.mode == 'EDIT']
+    return [obj for obj in objects if obj.type == 'MESH']
+
+
+# Object and mesh pointers flushed by read_edit_mesh since the last
+# depsgraph update. update_from_editmode() tags the geometry, the update
+# it causes is not a change of the mesh and must not drop the caches.
+_flushed = set()
+
+
+def read_edit_mesh(obj):
+    """arrays.read_edit_mesh, noting the flush for on_depsgraph_update"""
+    co, sel = arrays.read_edit_mesh(obj)
+    _flushed.update((obj.as_pointer(), obj.data.as_pointer()))
+    return co, sel
+
+
+def read_selections_arrays(objects):
+    """Return (obj, coords, selection, matrix_world) for objects with a selection"""
+    selections = []
+    for obj in objects:
+        co, sel = read_edit_mesh(obj)
+        if sel.any():
+            selections.append((obj, co, sel, arrays.matrix_to_array(obj.matrix_world)))
+    return selections
+
+
+def combined_world_coords(selections):
+    """Stack the world space selected coords of all selections"""
+    return arrays.concatenate([
+        arrays.transform_points(co[sel], mat_world)
+        for _obj, co, sel, mat_world in selections
+    ])
+
+
+def read_selections_bmesh(objects):
+    """Return (obj, selected_verts, world_coords) for objects with a selection"""
+    selections = []
+    for obj in objects:
+        bm = bmesh.from_edit_mesh(obj.data)
+        selected_verts = [v for v in bm.verts if v.select]
+        if selected_verts:
+            mat_world = obj.matrix_world
+            selections.append((obj, selected_verts, [mat_world @ v.co for v in selected_verts]))
+    return selections
+
+
+def bounds_from_vectors(coords):
+    """Return (min, max, median) Vectors of a list of Vectors"""
+    min_co = Vector(coords[0])
+    max_co = Vector(coords[0])
+    median = Vector()
+    for co in coords:
+        min_co.x = min(min_co.x, co.x)
+        min_co.y = min(min_co.y, co.y)
+        min_co.z = min(min_co.z, co.z)
+        max_co.x = max(max_co.x, co.x)
+        max_co.y = max(max_co.y, co.y)
+        max_co.z = max(max_co.z, co.z)
+        median += co
+    return min_co, max_co, median / len(coords)
+
+
+# -----------------------------------------------------------------------------
+# Selection Statistics Cache
+#
+# Walking the selection is too slow to do on every panel redraw, so the
+# statistics are computed once and kept until a depsgraph update touches the
+# object or its mesh (selection changes, edits, transforms). Panels only
+# read the cache (see peek_selection_stats): computing flushes the
+# edit-mesh, which writes Main data and must not happen while drawing. On
+# big meshes that flush takes long, so the panel waits for the selection
+# to settle instead of flushing after every click.
+
+# Vertices in edit mode from which the panel stats wait for the selection to settle
+STATS_THROTTLE_VERTS = 500_000
+# Seconds without changes before they are computed
+STATS_SETTLE_DELAY = 0.5
+
+# perf_counter() of the last update of an object or mesh
+_changed_time = 0.0
+
+
+class SelectionStats:
+    """Combined world space statistics of the edit-mode selection"""
+
+    __slots__ = ("min", "max", "median", "dimensions", "vert_count", "edge_count", "face_count")
+
+    def __init__(self, min_co, max_co, median, vert_count, edge_count, face_count):
+        self.min = min_co
+        self.max = max_co
+        self.median = median
+        self.dimensions = max_co - min_co
+        self.vert_count = vert_count
+        self.edge_count = edge_count
+        self.face_count = face_count
+
+    @property
+    def center(self):
+        return (self.min + self.max) / 2
+
+
+# Per object: as_pointer() -> (mesh pointer, min, max, co_sum, verts, edges, faces)
+_object_cache = {}
+# Combined stats of the last requested set of objects
+_combined_cache = {}
+
+
+def compute_object_stats(obj):
+    """Compute the selection stats entry of a single object"""
+    me = obj.data
+
+    if me.total_vert_sel == 0:
+        min_co = max_co = co_sum = None
+    elif use_arrays(obj):
+        co, sel = read_edit_mesh(obj)
+        world_coords = arrays.transform_points(co[sel], arrays.matrix_to_array(obj.matrix_world))
+        min_co, max_co, median = arrays.bounds(world_coords)
+        min_co, max_co = Vector(min_co), Vector(max_co)
+        co_sum = Vector(median * len(world_coords))
+    else:
+        bm = bmesh.from_edit_mesh(me)
+        world_coords = [obj.matrix_world @ v.co for v in bm.verts if v.select]
+        min_co, max_co, median = bounds_from_vectors(world_coords)
+        co_sum = median * len(world_coords)
+
+    return (
+        me.as_pointer(), min_co, max_co, co_sum,
+        me.total_vert_sel, me.total_edge_sel, me.total_face_sel,
+    )
+
+
+def get_selection_stats(context):
+    """Return the cached SelectionStats of all meshes in edit mode, or None"""
+    objects = edit_mesh_objects(context)
+    key = stats_key(objects)
+
+    if key in _combined_cache:
+        return _combined_cache[key]
+
+    entries = []
+    for obj in objects:
+        entry = _object_cache.get(obj.as_pointer())
+        if entry is None:
+            entry = compute_object_stats(obj)
+            _object_cache[obj.as_pointer()] = entry
+        entries.append(entry)
+
+    stats = None
+    selected = [entry for entry in entries if entry[1] is not None]
+    if selected:
+        min_co = selected[0][1].copy()
+        max_co = selected[0][2].copy()
+        co_sum = Vector()
+        for _me, entry_min, entry_max, entry_sum, *_counts in selected:
+            for i in range(3):
+                min_co[i] = min(min_co[i], entry_min[i])
+                max_co[i] = max(max_co[i], entry_max[i])
+            co_sum += entry_sum
+
+        vert_count = sum(entry[4] for entry in entries)
+        stats = SelectionStats(
+            min_co, max_co, co_sum / vert_count,
+            vert_count,
+            sum(entry[5] for entry in entries),
+            sum(entry[6] for entry in entries),
+        )
+
+    _combined_cache.clear()
+    _combined_cache[key] = stats
+    return stats
+
+
+def stats_key(objects):
+    # Sorted: the objects come in another order without a screen context
+    return tuple(sorted(obj.as_pointer() for obj in objects))
+
+
+def peek_selection_stats(context):
+    """Return (ready, stats) from the cache only, for drawing.
+
+    Missing stats are computed after the draw by a timer (on big meshes
+    once the selection settled), which redraws the 3D Views when ready.
+    """
+    key = stats_key(edit_mesh_objects(context))
+    if key in _combined_cache:
+        return True, _combined_cache[key]
+    if not bpy.app.timers.is_registered(compute_stats_timer):
+        bpy.app.timers.register(compute_stats_timer, first_interval=0.0)
+    return False, None
+
+
+def compute_stats_timer():
+    context = bpy.context
+    if context.mode != 'EDIT_MESH':
+        return None
+
+    if sum(len(obj.data.vertices) for obj in edit_mesh_objects(context)) >= STATS_THROTTLE_VERTS:
+        wait = _changed_time + STATS_SETTLE_DELAY - time.perf_counter()
+        if wait > 0.0:
+            return wait
+
+    get_selection_stats(context)
+    for window in context.window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+    return None
+
+
+def invalidate(obj=None):
+    """Drop the cached stats of obj, or of every object when obj is None"""
+    _combined_cache.clear()
+    if obj is None:
+        _object_cache.clear()
+        _evaluated_cache.clear()
+    else:
+        _object_cache.pop(obj.as_pointer(), None)
+        _evaluated_cache.pop(obj.as_pointer(), None)
+
+
+# -----------------------------------------------------------------------------
+# Evaluated Selection Cache
+#
+# World space coords of the evaluated (with modifiers) vertices that carry
+# the selection of the original ones: Mirror, Array, Solidify... copy the
+# selection flags to the vertices they generate. Evaluating and converting
+# a heavy modifier stack is expensive, so the coords are kept until the
+# next depsgraph update of the object or its mesh that isn't our own
+# edit-mesh flush (see read_edit_mesh). Read them before flushing: the
+# flush tags the geometry, so the depsgraph would evaluate the modifiers
+# again first.
+
+# object.as_pointer() -> (mesh pointer, (N, 3) world coords or None)
+_evaluated_cache = {}
+
+
+def evaluated_selection_coords(context, obj):
+    """Return the world coords of the selected evaluated vertices of obj, or None"""
+    ptr = obj.as_pointer()
+    entry = _evaluated_cache.get(ptr)
+    if entry is not None:
+        return entry[1]
+
+    obj_eval = obj.evaluated_get(context.evaluated_depsgraph_get())
+    try:
+        co, sel = arrays.read_mesh(obj_eval.to_mesh())
+    finally:
+        obj_eval.to_mesh_clear()
+
+    coords = None
+    if sel.any():
+        coords = arrays.transform_points(co[sel], arrays.matrix_to_array(obj.matrix_world))
+    _evaluated_cache[ptr] = (obj.data.as_pointer(), coords)
+    return coords
+
+
+def combined_evaluated_coords(context, objects):
+    """Stack the evaluated selected coords of objects, None if one has none"""
+    coords = [evaluated_selection_coords(context, obj) for obj in objects]
+    if not coords or any(entry is None for entry in coords):
+        return None
+    return arrays.concatenate(coords)
+
+
+# -----------------------------------------------------------------------------
+# Selection Snapshot
+#
+# Set Dimensions keeps what it read from the meshes (selected coordinates,
+# measurements) so a redo from the Adjust Last Operation panel only has to
+# transform cached arrays. Redo first undoes the previous result, which
+# brings the meshes back to the snapshot state; any other change to the
+# meshes, another operator or loading a file drops the snapshot.
+
+class SelectionSnapshot:
+    """Original selection of the meshes in edit mode, before Set Dimensions"""
+
+    __slots__ = ("key", "selections", "measurements", "restored", "pending")
+
+    def __init__(self, key, selections):
+        self.key = key
+        # (object pointer, coords, selection, matrix_world), see read_selections_arrays
+        self.selections = [
+            (obj.as_pointer(), co, sel, mat_world)
+            for obj, co, sel, mat_world in selections
+        ]
+        # Measurement results, keyed by the operator settings they depend on
+        self.measurements = {}
+        # Whether the meshes currently hold the snapshot state
+        self.restored = True
+        # Mesh pointers whose next depsgraph update is our own write
+        self.pending = set()
+
+    def get_selections(self, objects):
+        """Return the cached selections with the live objects"""
+        objects = {obj.as_pointer(): obj for obj in objects}
+        return [(objects[ptr], co, sel, mat_world) for ptr, co, sel, mat_world in self.selections]
+
+
+SNAPSHOT_OPERATORS = {"BFA_OT_set_dimensions", "BFA_OT_set_dimensions_modal"}
+
+_snapshot = None
+
+
+def snapshot_key(objects):
+    """Return the mesh identities and a cheap selection/geometry fingerprint"""
+    key = []
+    for obj in objects:
+        me = obj.data
+        bm = bmesh.from_edit_mesh(me)
+        key.append((
+            obj.as_pointer(), me.as_pointer(),
+            len(bm.verts), len(bm.edges), len(bm.faces),
+            me.total_vert_sel, me.total_edge_sel, me.total_face_sel,
+            tuple(value for row in obj.matrix_world for value in row),
+        ))
+    return tuple(key)
+
+
+def get_snapshot(objects):
+    """Return the snapshot of objects when their meshes are in the snapshot state, or None"""
+    if _snapshot is None or not _snapshot.restored:
+        return None
+    if _snapshot.key != snapshot_key(objects):
+        return None
+    return _snapshot
+
+
+def store_snapshot(objects, selections):
+    global _snapshot
+    _snapshot = SelectionSnapshot(snapshot_key(objects), selections)
+    return _snapshot
+
+
+def snapshot_written(snapshot):
+    """Note that the meshes of snapshot were just written by the operator"""
+    snapshot.restored = False
+    snapshot.pending = {ptr for entry in snapshot.key for ptr in entry[:2]}
+
+
+def drop_snapshot():
+    global _snapshot
+    _snapshot = None
+
+
+def check_snapshot(updated, flushed=frozenset()):
+    """Drop the snapshot after an update that isn't our own write, flush or an undo"""
+    changed = {ptr for entry in _snapshot.key for ptr in entry[:2]} & updated
+    if changed - _snapshot.pending - flushed:
+        drop_snapshot()
+        return
+    _snapshot.pending -= changed
+
+    operators = bpy.context.window_manager.operators
+    if operators and operators[-1].bl_idname not in SNAPSHOT_OPERATORS:
+        # Another operator ran, the redo session is over
+        drop_snapshot()
+
+
+def drop_stale(cache, updated):
+    """Drop the entries of cache whose object or mesh pointer was updated"""
+    stale = [
+        ptr for ptr, entry in cache.items()
+        if ptr in updated or entry[0] in updated
+    ]
+    for ptr in stale:
+        del cache[ptr]
+    return bool(stale)
+
+
+@persistent
+def on_depsgraph_update(scene, depsgraph):
+    global _changed_time
+    flushed = set(_flushed)
+    _flushed.clear()
+    # A pending stats computation needs the time of the last change
+    if (
+        not _object_cache and not _evaluated_cache and _snapshot is None
+        and not bpy.app.timers.is_registered(compute_stats_timer)
+    ):
+        return
+
+    updated = set()
+    for update in depsgraph.updates:
+        if isinstance(update.id, (bpy.types.Object, bpy.types.Mesh)):
+            updated.add(update.id.original.as_pointer())
+
+    if _snapshot is not None:
+        check_snapshot(updated, flushed)
+
+    # Our own flushes didn't change anything
+    updated -= flushed
+    if not updated:
+        return
+    _changed_time = time.perf_counter()
+
+    # An entry is stale when its object (transform, modifiers) or its mesh
+    # (selection, geometry) was updated.
+    drop_stale(_evaluated_cache, updated)
+    if drop_stale(_object_cache, updated):
+        _combined_cache.clear()
+
+
+@persistent
+def on_reset(*args):
+    # Undo and file loading re-allocate datablocks, pointers can't be trusted.
+    invalidate()
+    _flushed.clear()
+
+
+@persistent
+def on_undo(*args):
+    on_reset()
+    # Undo right after Set Dimensions (as redo does) restores the snapshot
+    # state. Anything else is caught by the key or the next depsgraph update.
+    if _snapshot is not None:
+        _snapshot.restored = True
+
+
+@persistent
+def on_load(*args):
+    on_reset()
+    drop_snapshot()
+
+
+handlers = (
+    (bpy.app.handlers.depsgraph_update_post, on_depsgraph_update),
+    (bpy.app.handlers.undo_post, on_undo),
+    (bpy.app.handlers.redo_post, on_load),
+    (bpy.app.handlers.load_post, on_load),
+)
+
+def register():
+    for handler_list, func in handlers:
+        handler_list.append(func)
+
+def unregister():
+    for handler_list, func in handlers:
+        if func in handler_list:
+            handler_list.remove(func)
+    invalidate()
+    drop_snapshot()
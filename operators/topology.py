@@ -0,0 +1,290 @@
+"""Array based Smart Delete for huge selections.
+
+BMesh deletes element by element, which gets slow when a large part of a
+multi-million face mesh goes. Here the mesh is read with ``foreach_get``,
+the kept vertices, edges and faces are found with NumPy masks (the same
+result as Smart Delete on the BMesh, see delete_masks) and a new mesh is
+written in one go, with every generic attribute (UVs, colors, material
+indices, creases from 4.0...) and the custom normals filtered alike. The
+edit BMesh is then reloaded from it. Meshes with data outside of the
+generic attributes are left to the BMesh delete, see supports.
+"""
+
+import bpy
+import bmesh
+import numpy as np
+
+# Generic attributes written as topology, not copied
+TOPOLOGY_ATTRIBUTES = {"position", ".edge_verts", ".corner_vert", ".corner_edge"}
+
+# Attribute data_type -> (foreach_get/set property, width, dtype)
+ATTRIBUTE_LAYOUTS = {
+    'FLOAT': ("value", 1, np.float32),
+    'INT': ("value", 1, np.int32),
+    'INT8': ("value", 1, np.int32),
+    'BOOLEAN': ("value", 1, bool),
+    'FLOAT2': ("vector", 2, np.float32),
+    'INT32_2D': ("value", 2, np.int32),
+    'FLOAT_VECTOR': ("vector", 3, np.float32),
+    'FLOAT_COLOR': ("color", 4, np.float32),
+    'BYTE_COLOR': ("color", 4, np.float32),
+    'QUATERNION': ("value", 4, np.float32),
+    'FLOAT4X4': ("value", 16, np.float32),
+}
+
+# Mesh flags of crease and bevel weight layers before Blender 4.0
+LEGACY_LAYER_FLAGS = (
+    "use_customdata_vertex_crease",
+    "use_customdata_edge_crease",
+    "use_customdata_vertex_bevel",
+    "use_customdata_edge_bevel",
+)
+
+# Element flags that are not generic attributes before Blender 4.0
+LEGACY_FLAGS = (
+    ("vertices", "select"),
+    ("vertices", "hide"),
+    ("edges", "select"),
+    ("edges", "hide"),
+    ("edges", "use_seam"),
+    ("edges", "use_edge_sharp"),
+    ("polygons", "select"),
+    ("polygons", "hide"),
+    ("polygons", "use_smooth"),
+)
+
+
+def has_legacy_layers(obj):
+    """Whether obj has mesh data stored in layers that are not generic attributes.
+
+    Before 4.0 creases, bevel weights and face maps are such layers, and so
+    are Freestyle marks until they became attributes.
+    """
+    me = obj.data
+    if bpy.app.version < (4, 0, 0):
+        if getattr(obj, "face_maps", None) or getattr(me, "face_maps", None):
+            return True
+        if getattr(me, "vertex_creases", None) is not None or getattr(me, "edge_creases", None) is not None:
+            return True
+        if any(getattr(me, prop, False) for prop in LEGACY_LAYER_FLAGS):
+            return True
+
+    for elements, element_type, attr_name in (
+        (me.edges, bpy.types.MeshEdge, "freestyle_edge"),
+        (me.polygons, bpy.types.MeshPolygon, "freestyle_face"),
+    ):
+        if (
+            attr_name not in me.attributes
+            and "use_freestyle_mark" in element_type.bl_rna.properties
+            and read_bools(elements, "use_freestyle_mark").any()
+        ):
+            return True
+    return False
+
+
+def supports(obj):
+    """Whether the mesh of obj can be rebuilt from arrays without losing data"""
+    me = obj.data
+    # Shape keys and vertex weights are not attributes, they would be lost
+    if me.shape_keys is not None or obj.vertex_groups or has_legacy_layers(obj):
+        return False
+    return all(attr.data_type in ATTRIBUTE_LAYOUTS for attr in me.attributes)
+
+
+def read_ints(collection, attr, width=1):
+    data = np.empty(len(collection) * width, dtype=np.int32)
+    collection.foreach_get(attr, data)
+    return data.reshape(-1, width) if width > 1 else data
+
+
+def read_bools(collection, attr):
+    data = np.empty(len(collection), dtype=bool)
+    collection.foreach_get(attr, data)
+    return data
+
+
+def read_topology(me):
+    """Return (edge_verts, loop_vert, loop_edge, loop_total, loop_face) of a mesh"""
+    loop_total = read_ints(me.polygons, "loop_total")
+    loop_face = np.repeat(np.arange(len(me.polygons)), loop_total)
+    return (
+        read_ints(me.edges, "vertices", 2),
+        read_ints(me.loops, "vertex_index"),
+        read_ints(me.loops, "edge_index"),
+        loop_total,
+        loop_face,
+    )
+
+
+def mark(indices, count):
+    """Return a (count,) bool mask set at indices"""
+    mask = np.zeros(count, dtype=bool)
+    mask[indices] = True
+    return mask
+
+
+def delete_masks(topology, vert_sel, edge_sel, face_sel, select_mode):
+    """Return the (vert_keep, edge_keep, face_keep) masks after Smart Delete.
+
+    The selection is resolved like resolve_delete_selection, then deleted
+    like delete_geometry: faces with their edges and vertices no longer
+    used, lone edges with their faces and the vertices left without edges,
+    lone vertices with their edges and faces.
+    """
+    edge_verts, loop_vert, loop_edge, _loop_total, loop_face = topology
+    vert_count, edge_count, face_count = len(vert_sel), len(edge_sel), len(face_sel)
+    vert_mode, edge_mode, face_mode = select_mode
+
+    faces = face_sel if face_mode else np.zeros(face_count, dtype=bool)
+    loop_in_faces = faces[loop_face]
+
+    edges = np.zeros(edge_count, dtype=bool)
+    if edge_mode:
+        edges = edge_sel & ~mark(loop_edge[loop_in_faces], edge_count) if faces.any() else edge_sel
+
+    verts = np.zeros(vert_count, dtype=bool)
+    if vert_mode:
+        if faces.any() or edges.any():
+            verts = vert_sel & ~mark(edge_verts[edge_sel].ravel(), vert_count)
+        else:
+            verts = vert_sel
+
+    # Faces, and their edges and vertices not used by another face or edge
+    face_keep = ~faces
+    loop_kept = ~loop_in_faces
+    edge_keep = ~(mark(loop_edge[loop_in_faces], edge_count) & ~mark(loop_edge[loop_kept], edge_count))
+    vert_keep = ~(
+        mark(loop_vert[loop_in_faces], vert_count)
+        & ~mark(loop_vert[loop_kept], vert_count)
+        & ~mark(edge_verts[edge_keep].ravel(), vert_count)
+    )
+
+    # Lone edges with their faces, and the vertices left without edges
+    face_keep &= ~mark(loop_face[edges[loop_edge]], face_count)
+    edge_keep &= ~edges
+    vert_keep &= ~(mark(edge_verts[edges].ravel(), vert_count) & ~mark(edge_verts[edge_keep].ravel(), vert_count))
+
+    # Lone vertices with their edges and faces
+    vert_keep &= ~verts
+    edge_keep &= ~verts[edge_verts].any(axis=1)
+    face_keep &= ~mark(loop_face[verts[loop_vert]], face_count)
+
+    return vert_keep, edge_keep, face_keep
+
+
+def read_custom_normals(me):
+    """Return the (L, 3) corner normals of a mesh with custom normals, or None"""
+    # Blender 5.0+ stores them as a generic attribute, copied with the others
+    if not me.has_custom_normals or "custom_normal" in me.attributes:
+        return None
+    normals = np.empty(len(me.loops) * 3, dtype=np.float32)
+    if hasattr(me, "corner_normals"):
+        me.corner_normals.foreach_get("vector", normals)
+    else:
+        # Before 4.1
+        me.calc_normals_split()
+        me.loops.foreach_get("normal", normals)
+    return normals.reshape(-1, 3)
+
+
+def copy_attributes(source, target, masks):
+    """Copy the generic attributes of source to target, filtered by the domain masks"""
+    for attr in list(source.attributes):
+        if attr.name in TOPOLOGY_ATTRIBUTES:
+            continue
+        prop, width, dtype = ATTRIBUTE_LAYOUTS[attr.data_type]
+        data = np.empty(len(attr.data) * width, dtype=dtype)
+        attr.data.foreach_get(prop, data)
+        data = data.reshape(-1, width)[masks[attr.domain]]
+
+        target_attr = target.attributes.get(attr.name)
+        if target_attr is None:
+            try:
+                target_attr = target.attributes.new(attr.name, attr.data_type, attr.domain)
+            except RuntimeError:
+                # Internal layers Python can't create (they are rebuilt by Blender)
+                continue
+        target_attr.data.foreach_set(prop, data.ravel())
+
+    active_uv = source.uv_layers.active
+    if active_uv is not None and active_uv.name in target.uv_layers:
+        target.uv_layers.active = target.uv_layers[active_uv.name]
+    for layer in source.uv_layers:
+        if layer.active_render and layer.name in target.uv_layers:
+            target.uv_layers[layer.name].active_render = True
+
+    if hasattr(source, "color_attributes"):
+        target.color_attributes.active_color_index = source.color_attributes.active_color_index
+        target.color_attributes.render_color_index = source.color_attributes.render_color_index
+
+
+def filtered_mesh(me, topology, vert_keep, edge_keep, face_keep):
+    """Return a new mesh with the kept elements of me and all their data"""
+    edge_verts, loop_vert, loop_edge, loop_total, loop_face = topology
+    loop_keep = face_keep[loop_face]
+    vert_index = np.cumsum(vert_keep, dtype=np.int32) - 1
+    edge_index = np.cumsum(edge_keep, dtype=np.int32) - 1
+    totals = loop_total[face_keep]
+
+    new = bpy.data.meshes.new(me.name)
+    new.vertices.add(int(vert_keep.sum()))
+    new.edges.add(int(edge_keep.sum()))
+    new.loops.add(int(totals.sum()))
+    new.polygons.add(len(totals))
+
+    co = np.empty(len(me.vertices) * 3, dtype=np.float32)
+    me.vertices.foreach_get("co", co)
+    new.vertices.foreach_set("co", co.reshape(-1, 3)[vert_keep].ravel())
+    new.edges.foreach_set("vertices", vert_index[edge_verts[edge_keep]].ravel())
+    new.loops.foreach_set("vertex_index", vert_index[loop_vert[loop_keep]])
+    new.loops.foreach_set("edge_index", edge_index[loop_edge[loop_keep]])
+    new.polygons.foreach_set("loop_start", (np.cumsum(totals) - totals).astype(np.int32))
+    if bpy.app.version < (4, 0, 0):
+        new.polygons.foreach_set("loop_total", totals)
+
+    masks = {'POINT': vert_keep, 'EDGE': edge_keep, 'FACE': face_keep, 'CORNER': loop_keep}
+    copy_attributes(me, new, masks)
+
+    if bpy.app.version < (4, 0, 0):
+        domains = {"vertices": 'POINT', "edges": 'EDGE', "polygons": 'FACE'}
+        for collection, flag in LEGACY_FLAGS:
+            values = read_bools(getattr(me, collection), flag)[masks[domains[collection]]]
+            getattr(new, collection).foreach_set(flag, values)
+
+    normals = read_custom_normals(me)
+    if normals is not None:
+        if hasattr(me, "use_auto_smooth"):
+            # Before 4.1 custom normals only apply with Auto Smooth
+            new.use_auto_smooth = True
+        new.normals_split_custom_set(normals[loop_keep])
+
+    new.update()
+    return new
+
+
+def delete_selected(obj, select_mode):
+    """Smart Delete the selection of obj in edit mode, return the removed (verts, edges, faces)"""
+    obj.update_from_editmode()
+    me = obj.data
+    before = (len(me.vertices), len(me.edges), len(me.polygons))
+
+    topology = read_topology(me)
+    vert_keep, edge_keep, face_keep = delete_masks(
+        topology,
+        read_bools(me.vertices, "select"),
+        read_bools(me.edges, "select"),
+        read_bools(me.polygons, "select"),
+        select_mode,
+    )
+
+    new = filtered_mesh(me, topology, vert_keep, edge_keep, face_keep)
+    try:
+        bm = bmesh.from_edit_mesh(me)
+        bm.clear()
+        bm.from_mesh(new)
+        bmesh.update_edit_mesh(me)
+    finally:
+        bpy.data.meshes.remove(new)
+
+    after = (int(vert_keep.sum()), int(edge_keep.sum()), int(face_keep.sum()))
+    return tuple(b - a for b, a in zip(before, after))
@@ -1,4 +1,11 @@
+import math
+
 import bpy
+from bpy.app.handlers import persistent
+from mathutils import Quaternion
+
+from . import scene_bounds
+from . import selection
 
 class BFA_OT_reset_3d_view(bpy.types.Operator):
     """Reset 3D View to a standard state"""
@@ -29,64 +36,121 @@ class BFA_OT_reset_3d_view(bpy.types.Operator):
         default=True
     )
 
+    frame: bpy.props.EnumProperty(
+        name="Frame",
+        description="What the view is centered on",
+        items=[
+            ('ORIGIN', "Origin", "Center on the world origin at the default distance"),
+            ('ALL', "All", "Frame all visible objects"),
+            ('SELECTED', "Selected", "Frame the selected objects (or the Edit Mode selection)"),
+        ],
+        default='ORIGIN'
+    )
+
+    all_viewports: bpy.props.BoolProperty(
+        name="All Viewports",
+        description="Reset every 3D Viewport in every window",
+        default=False
+    )
+
     @classmethod
     def poll(cls, context):
         return context.area.type == 'VIEW_3D'
 
     def execute(self, context):
-        rv3d = context.region_data
-        
+        if self.all_viewports:
+            areas = [
+                area for window in context.window_manager.windows
+                for area in window.screen.areas if area.type == 'VIEW_3D'
+            ]
+        else:
+            areas = [context.area]
+
+        # Bounds are computed once for all viewports
+        bounds = None
+        if self.frame != 'ORIGIN':
+            bounds = self.get_frame_bounds(context)
+            if bounds is None:
+                self.report({'WARNING'}, "Nothing to frame")
+
+        for area in areas:
+            space = area.spaces.active
+            region = next((r for r in area.regions if r.type == 'WINDOW'), None)
+            if area == context.area and context.region_data:
+                rv3d = context.region_data
+            else:
+                rv3d = space.region_3d
+            self.reset_view(space, region, rv3d, bounds)
+
+        return {'FINISHED'}
+
+    def get_frame_bounds(self, context):
+        """Return the world space (min, max) to frame, or None"""
+        if self.frame == 'SELECTED':
+            if context.mode == 'EDIT_MESH':
+                stats = selection.get_selection_stats(context)
+                return (stats.min, stats.max) if stats else None
+            return scene_bounds.objects_bounds(context.selected_objects)
+        return scene_bounds.objects_bounds(context.visible_objects)
+
+    def reset_view(self, space, region, rv3d, bounds):
         # Check if we are in camera view
         if rv3d.view_perspective == 'CAMERA':
             if self.keep_camera_view:
-                # If keeping camera view, maybe just reset internal camera logic or do nothing?
-                # User request says: "Reset view_location, view_rotation, view_distance... adjust perspective"
-                # But for camera view, location/rotation are locked to the camera object usually.
-                # If "Keep Camera View" is ON, we might just want to ensure we stay in camera view.
-                # If OFF, we exit camera view.
-                return {'FINISHED'}
+                # For camera view, location/rotation are locked to the camera object usually.
+                # If "Keep Camera View" is ON, we just stay in camera view.
+                return
             else:
                 # Exit camera view
                 rv3d.view_perspective = 'PERSP'
 
-        # Reset location (target)
-        rv3d.view_location = (0.0, 0.0, 0.0)
-        
         # Reset rotation
-        # Front view quaternion is typically identity or specific rotation depending on setup.
-        # But "Reset" usually implies restoring a default looking-at-center state.
         # If align_to_front is True, we use standard front view.
         if self.align_to_front:
-             # Reset view to Front
-             # We can use the ops for this or set rotation manually.
-             # bpy.ops.view3d.view_axis(type='FRONT') is cleaner but acts on context.
-             # Setting rotation manually is more robust for an operator that claims "Reset".
-             # Front view looks along +Y or -Y? Standard Blender Front is looking along +Y axis (showing XZ plane).
-             # Actually Front view looks along +Y, so towards -Y.
-             # Let's use the ops for standard behavior if possible, or set quaternion.
-             
-             # Standard Front View Quaternion (approx): (1, 0, 0, 0) is Top? No.
-             # Let's try calling view_axis which is reliable.
-             bpy.ops.view3d.view_axis(type='FRONT')
-        else:
-             # Just reset rotation to a "default" angle? Or keep it?
-             # "Reset" implies changing it. Let's set to a standard 3/4 view or Front if not specified.
-             # Usually Reset View means Front or Top. Let's stick to Front as default if not aligned.
-             # Or if user disables align_to_front, maybe they just want to center view?
-             # Let's assume align_to_front is the primary rotation reset.
-             pass
-
-        # Reset distance
-        rv3d.view_distance = 10.0
+            # Front view looks along +Y (showing the XZ plane): the view
+            # rotation is 90 degrees around X. Set directly instead of
+            # calling view3d.view_axis, which needs an operator context.
+            rv3d.view_rotation = FRONT_VIEW_ROTATION
 
         # Set perspective
         if self.use_perspective == 'PERSP':
             rv3d.view_perspective = 'PERSP'
         elif self.use_perspective == 'ORTHO':
             rv3d.view_perspective = 'ORTHO'
-        # AUTO: do nothing or logic implementation (omitted for simplicity if not strictly defined)
+        # AUTO: keep current
+
+        if bounds is None:
+            # Reset location (target) and distance
+            rv3d.view_location = (0.0, 0.0, 0.0)
+            rv3d.view_distance = 10.0
+            return
+
+        min_co, max_co = bounds
+        rv3d.view_location = (min_co + max_co) / 2
+        rv3d.view_distance = frame_distance(space, region, rv3d, (max_co - min_co).length / 2)
 
-        return {'FINISHED'}
+
+FRONT_VIEW_ROTATION = Quaternion((math.sqrt(0.5), math.sqrt(0.5), 0.0, 0.0))
+
+# Sensor width Blender uses for the viewport lens
+VIEW_SENSOR_WIDTH = 36.0
+
+
+def frame_distance(space, region, rv3d, radius):
+    """Return the view distance that fits a sphere of radius in the view"""
+    radius = max(radius, 1e-3)
+
+    # The lens applies to the larger region side, fit the smaller one
+    half_angle = math.atan(VIEW_SENSOR_WIDTH / 2 / space.lens)
+    if region and region.width > 0 and region.height > 0:
+        aspect = min(region.width, region.height) / max(region.width, region.height)
+        half_angle = math.atan(math.tan(half_angle) * aspect)
+
+    # A little margin around the content
+    margin = 1.1
+    if rv3d.view_perspective == 'ORTHO':
+        return radius * margin / math.tan(half_angle)
+    return radius * margin / math.sin(half_angle)
 
 
 class BFA_OT_toggle_silhouette(bpy.types.Operator):
@@ -95,68 +159,122 @@ class BFA_OT_toggle_silhouette(bpy.types.Operator):
     bl_label = "Toggle Silhouette"
     bl_options = {'REGISTER', 'UNDO'}
 
+    all_viewports: bpy.props.BoolProperty(
+        name="All Viewports",
+        description="Toggle every 3D Viewport in every window",
+        default=False
+    )
+
     def execute(self, context):
-        # Logic to toggle silhouette
-        # We can store state in window_manager or just toggle based on current state.
-        shading = context.space_data.shading
-        overlay = context.space_data.overlay
-
-        # State detection: Are we in "Silhouette" mode?
-        # Silhouette mode definition: Flat lighting, single color (black/white), outline?
-        # A simple silhouette is: Solid Mode, Flat Lighting, Color = Single (Black), Background = White?
-        # Or standard "Workbench" with Flat Color + Outline.
-        
-        # Checking if we are already in our "Silhouette" state is tricky because users change settings.
-        # Let's use a custom property on the View3D Shading settings if possible, or just a simple toggle logic.
-        
-        # Simple Logic:
-        # If Shading is SOLID and Color is SINGLE and Light is FLAT -> Restore PREV (if saved) or Default
-        # Else -> Set SOLID, FLAT, SINGLE, Setup Outline.
-        
-        # To keep it simple and robust without complex state saving/restoring (which is fragile):
-        # We will act as a "Setter" mostly.
-        
-        if shading.type == 'SOLID' and shading.light == 'FLAT' and shading.color_type == 'SINGLE':
-            # Likely in silhouette mode, toggle OFF to standard
-            shading.light = 'STUDIO'
-            shading.color_type = 'MATERIAL'
-            shading.show_shadows = False
-            shading.show_cavity = True # Standard-ish
-            # Restore background behavior if we changed it? 
-            # Viewport background (World/Theme) usually not changed by shading directly unless using specific options.
+        # The state is not guessed from the shading settings (users change
+        # them), each area remembers whether we put it in silhouette mode
+        # and the exact settings it had before.
+        view_areas = [
+            area for window in context.window_manager.windows
+            for area in window.screen.areas if area.type == 'VIEW_3D'
+        ]
+        prune_silhouette_snapshots(view_areas)
+
+        if self.all_viewports:
+            areas = view_areas
+        elif context.area and context.area.type == 'VIEW_3D':
+            areas = [context.area]
         else:
-            # Enable Silhouette
-            shading.type = 'SOLID'
-            shading.light = 'FLAT'
-            shading.color_type = 'SINGLE'
-            # Set single color to Black? Or user preference?
-            # Accessing the actual single color preference:
-            # shading.single_color = (0, 0, 0) # This is a float vector
-            
-            # Note: Changing theme settings affects all viewports if not careful, 
-            # but shading settings are per-viewport (SpaceView3D).
-            
-            # To make a true "Silhouette", we want the object to be black and background white/light?
-            # Or just "Outline" visible?
-            # The prompt mentions "Silhouette/Outline".
-            # Bforartists "Silhouette" usually means making the mesh black/flat to see the form.
-            
-            # Let's try to set the single color to a dark grey/black.
-            # But changing shading.single_color changes it for the current viewport setup.
-            # We assume this is desired.
-            
-            # Also enable Outline
-            shading.show_xray = False
-            shading.show_shadows = False
-            shading.show_cavity = False
-            
-            # Outline options are part of shading only in Workbench usually?
-            # In 'SOLID', we might not have "Outline" clearly unless we use 'show_object_outline' which is selection.
-            # But Workbench has "Outline" option.
-            pass
+            self.report({'WARNING'}, "No 3D Viewport")
+            return {'CANCELLED'}
+
+        # Decide once so every viewport ends up in the same state
+        if context.area in areas:
+            enable = not is_silhouette(context.area)
+        else:
+            enable = not any(is_silhouette(area) for area in areas)
+
+        for area in areas:
+            space = area.spaces.active
+            if enable and not is_silhouette(area):
+                enable_silhouette(area, space)
+            elif not enable and is_silhouette(area):
+                disable_silhouette(area, space)
 
         return {'FINISHED'}
 
+
+# -----------------------------------------------------------------------------
+# Silhouette State
+#
+# Snapshots of the shading and overlay settings taken when entering
+# silhouette mode, stored per area and restored as-is when leaving it.
+
+# area.as_pointer() -> (shading snapshot, overlay snapshot)
+_silhouette_snapshots = {}
+
+SNAPSHOT_PROPERTY_TYPES = {'BOOLEAN', 'INT', 'FLOAT', 'ENUM', 'STRING'}
+
+
+def snapshot_settings(data):
+    """Return a dict of every writable setting of an RNA struct"""
+    snapshot = {}
+    for prop in data.bl_rna.properties:
+        if prop.is_readonly or prop.type not in SNAPSHOT_PROPERTY_TYPES:
+            continue
+        value = getattr(data, prop.identifier)
+        if getattr(prop, "is_array", False):
+            value = tuple(value)
+        snapshot[prop.identifier] = value
+    return snapshot
+
+
+def restore_settings(data, snapshot):
+    """Write a snapshot back, in definition order (e.g. light before studio_light)"""
+    for identifier, value in snapshot.items():
+        try:
+            setattr(data, identifier, value)
+        except (AttributeError, TypeError, ValueError):
+            # Setting not available in the current state (e.g. an enum
+            # item that depends on another setting), keep going.
+            pass
+
+
+def is_silhouette(area):
+    return area.as_pointer() in _silhouette_snapshots
+
+
+def enable_silhouette(area, space):
+    shading = space.shading
+    _silhouette_snapshots[area.as_pointer()] = (
+        snapshot_settings(shading),
+        snapshot_settings(space.overlay),
+    )
+
+    # Flat lighting, single color, no shadows/cavity/x-ray to see the form
+    shading.type = 'SOLID'
+    shading.light = 'FLAT'
+    shading.color_type = 'SINGLE'
+    shading.show_xray = False
+    shading.show_shadows = False
+    shading.show_cavity = False
+
+
+def disable_silhouette(area, space):
+    shading_snapshot, overlay_snapshot = _silhouette_snapshots.pop(area.as_pointer())
+    restore_settings(space.shading, shading_snapshot)
+    restore_settings(space.overlay, overlay_snapshot)
+
+
+def prune_silhouette_snapshots(areas):
+    """Forget snapshots of areas that no longer exist"""
+    alive = {area.as_pointer() for area in areas}
+    for key in list(_silhouette_snapshots):
+        if key not in alive:
+            del _silhouette_snapshots[key]
+
+
+@persistent
+def clear_silhouette_snapshots(*args):
+    # Areas of the previous file are gone
+    _silhouette_snapshots.clear()
+
+
 classes = (
     BFA_OT_reset_3d_view,
     BFA_OT_toggle_silhouette,
@@ -165,7 +283,11 @@ classes = (
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
+    bpy.app.handlers.load_post.append(clear_silhouette_snapshots)
 
 def unregister():
+    if clear_silhouette_snapshots in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(clear_silhouette_snapshots)
+    _silhouette_snapshots.clear()
     for cls in classes:
         bpy.utils.unregister_class(cls)
@@ -3,45 +3,125 @@ import bpy
 class BFA_AddonPreferences(bpy.types.AddonPreferences):
     bl_idname = __package__
 
+    # Features: only the enabled ones are imported and registered
+    enable_view_tools: bpy.props.BoolProperty(
+        name="Viewport Tools",
+        description="Reset 3D View and Toggle Silhouette",
+        default=True,
+        update=lambda self, context: update_features(self, context)
+    )
+
+    enable_mesh_tools: bpy.props.BoolProperty(
+        name="Modeling Tools",
+        description="Set Dimensions, Smart Delete and the live selection dimensions",
+        default=True,
+        update=lambda self, context: update_features(self, context)
+    )
+
+    enable_material_tools: bpy.props.BoolProperty(
+        name="Quick Materials",
+        description="Quick Material and Clean Up Materials",
+        default=True,
+        update=lambda self, context: update_features(self, context)
+    )
+
+    enable_material_previews: bpy.props.BoolProperty(
+        name="Rendered Material Icons",
+        description="Show rendered swatches on the Quick Materials buttons. "
+                    "Missing swatches are rendered once in the background and cached on disk",
+        default=True,
+        update=lambda self, context: update_features(self, context)
+    )
+
     enable_menu_entries: bpy.props.BoolProperty(
         name="Enable Menu Entries",
         description="Add entries to standard Blender menus (View, Mesh, etc.)",
-        default=True
+        default=True,
+        update=lambda self, context: update_features(self, context)
     )
 
     enable_header_button: bpy.props.BoolProperty(
         name="Enable Header Button",
         description="Add Reset View button to 3D View Header",
-        default=False
+        default=False,
+        update=lambda self, context: update_features(self, context)
     )
 
     enable_keymaps: bpy.props.BoolProperty(
         name="Enable Keymaps",
         description="Enable custom keymaps (e.g. Ctrl+Delete for Smart Delete)",
         default=True,
-        update=lambda self, context: update_keymaps(self, context)
+        update=lambda self, context: update_features(self, context)
     )
 
     enable_shelf_header: bpy.props.BoolProperty(
         name="Enable Quick Shelf in Header",
         description="Add Quick Create popover to 3D View Header",
-        default=True
+        default=True,
+        update=lambda self, context: update_features(self, context)
+    )
+
+    enable_profiling: bpy.props.BoolProperty(
+        name="Enable Profiling",
+        description="Record timings of BFA operators (shown in the BFA Tools sidebar)",
+        default=False,
+        update=lambda self, context: update_features(self, context)
+    )
+
+    profiling_buffer_size: bpy.props.IntProperty(
+        name="Recorded Calls",
+        description="Number of most recent operator calls kept",
+        default=256,
+        min=16,
+        max=100000,
+        update=lambda self, context: update_features(self, context)
     )
 
     def draw(self, context):
         layout = self.layout
+
+        col = layout.column(heading="Features")
+        col.prop(self, "enable_view_tools")
+        col.prop(self, "enable_mesh_tools")
+        col.prop(self, "enable_material_tools")
+        sub = col.row()
+        sub.active = self.enable_material_tools
+        sub.prop(self, "enable_material_previews")
+
+        layout.separator()
         layout.prop(self, "enable_menu_entries")
         layout.prop(self, "enable_header_button")
         layout.prop(self, "enable_keymaps")
         layout.prop(self, "enable_shelf_header")
 
+        row = layout.row()
+        row.prop(self, "enable_profiling")
+        sub = row.row()
+        sub.active = self.enable_profiling
+        sub.prop(self, "profiling_buffer_size")
+
+        draw_registration_timings(layout)
+
+
+def draw_registration_timings(layout):
+    """Show how long each step of the add-on registration took"""
+    from . import registration_timings
+
+    if not registration_timings:
+        return
+
+    box = layout.box()
+    box.label(text="Startup Timings", icon='TIME')
+    col = box.column(align=True)
+    for step, seconds in registration_timings:
+        split = col.split(factor=0.6)
+        split.label(text=step)
+        split.label(text=f"{seconds * 1000.0:.2f} ms")
+
 
-def update_keymaps(self, context):
-    from . import keymap
-    if self.enable_keymaps:
-        keymap.register_keymaps()
-    else:
-        keymap.unregister_keymaps()
+def update_features(self, context):
+    from . import sync_features
+    sync_features(self)
 
 def register():
     bpy.utils.register_class(BFA_AddonPreferences)
@@ -1,17 +1,41 @@
+import time
+
 from . import panels
 from . import menus
 from . import shelf
+from . import previews
 
 modules = (
     panels,
     menus,
     shelf,
+    previews,
 )
 
-def register():
+_registered = False
+
+
+def sync(prefs, timings=None):
+    """Register the UI once, then add or remove the optional menu and header entries"""
+    global _registered
     for mod in modules:
-        mod.register()
+        start = time.perf_counter()
+        if not _registered:
+            mod.register()
+        if hasattr(mod, "sync"):
+            mod.sync(prefs)
+        if timings is not None:
+            timings.append((f"ui.{mod.__name__.rpartition('.')[2]}", time.perf_counter() - start))
+    _registered = True
+
+
+def register(prefs, timings=None):
+    sync(prefs, timings)
 
 def unregister():
-    for mod in modules:
+    global _registered
+    if not _registered:
+        return
+    for mod in reversed(modules):
         mod.unregister()
+    _registered = False
@@ -1,4 +1,32 @@
 import bpy
+from bpy.utils import units
+
+
+def format_length(context, value):
+    unit_settings = context.scene.unit_settings
+    return units.to_string(unit_settings.system, 'LENGTH', value * unit_settings.scale_length)
+
+
+def draw_selection_stats(layout, context):
+    """Draw the live selection dimensions from the selection stats cache"""
+    from ..operators import selection
+
+    ready, stats = selection.peek_selection_stats(context)
+    if not ready:
+        layout.label(text="Measuring...", icon='TIME')
+        return
+    if stats is None:
+        layout.label(text="Nothing selected", icon='INFO')
+        return
+
+    col = layout.column(align=True)
+    for axis, value in zip("XYZ", stats.dimensions):
+        row = col.row(align=True)
+        row.label(text=axis)
+        row.label(text=format_length(context, value))
+
+    layout.label(text=f"Verts {stats.vert_count}  Edges {stats.edge_count}  Faces {stats.face_count}")
+
 
 class VIEW3D_PT_bfa_tools(bpy.types.Panel):
     """BFA Tools Main Panel"""
@@ -13,16 +41,31 @@ class VIEW3D_PT_bfa_tools(bpy.types.Panel):
         layout.use_property_split = True
         layout.use_property_decorate = False
 
+        prefs = context.preferences.addons[__package__.split('.')[0]].preferences
+
         # Viewport Section
         col = layout.column(align=True)
-        col.label(text="Viewport")
-        
-        row = col.row(align=True)
-        row.operator("bfa.reset_3d_view", text="Reset View", icon="VIEW3D")
-        row.operator("bfa.toggle_silhouette", text="Silhouette", icon="SHADING_SOLID")
+        if prefs.enable_view_tools:
+            col.label(text="Viewport")
+
+            row = col.row(align=True)
+            row.operator("bfa.reset_3d_view", text="Reset View", icon="VIEW3D")
+            row.operator("bfa.toggle_silhouette", text="Silhouette", icon="SHADING_SOLID")
+
+        # Object Mode Section
+        if context.mode == 'OBJECT' and prefs.enable_mesh_tools:
+            col.separator()
+            col.label(text="Object Mode")
+            col.operator("bfa.set_object_dimensions", text="Set Dimensions", icon="FIXED_SIZE")
+
+        # Curves, lattices, point clouds and Grease Pencil
+        if context.mode.startswith('EDIT_') and context.mode != 'EDIT_MESH' and prefs.enable_mesh_tools:
+            col.separator()
+            col.label(text="Edit Mode")
+            col.operator("bfa.set_dimensions", text="Set Dimensions", icon="FIXED_SIZE")
 
         # Edit Mode Section
-        if context.mode == 'EDIT_MESH':
+        if context.mode == 'EDIT_MESH' and prefs.enable_mesh_tools:
             col.separator()
             col.label(text="Edit Mode")
             
@@ -54,15 +97,67 @@ class VIEW3D_PT_bfa_tools(bpy.types.Panel):
             # Checking "Bforartists" style: "Set Dimensions" tool usually is a modal or a panel with X/Y/Z inputs.
             
             # Let's compromise: The operator has Invoke which shows a dialog with current dims. 
-            # In the panel, we just show the button.
-            box.operator("bfa.set_dimensions", text="Set Dimensions", icon="FIXED_SIZE")
+            # In the panel, we show the live (cached) dimensions and the button.
+            draw_selection_stats(box, context)
+            row = box.row(align=True)
+            row.operator("bfa.set_dimensions", text="Set Dimensions", icon="FIXED_SIZE")
+            row.operator("bfa.set_dimensions_modal", text="", icon="MOUSE_MOVE")
             
             # Smart Delete
             col.separator()
             col.operator("bfa.smart_delete", text="Smart Delete", icon="X")
 
+class VIEW3D_PT_bfa_profiling(bpy.types.Panel):
+    """Timings of BFA operators, when profiling is enabled"""
+    bl_label = "BFA Profiling"
+    bl_idname = "VIEW3D_PT_bfa_profiling"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "BFA Tools"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        prefs = context.preferences.addons[__package__.split('.')[0]].preferences
+        return prefs.enable_profiling
+
+    def draw(self, context):
+        from ..operators import profiling
+
+        layout = self.layout
+
+        rows = profiling.summary()
+        if not rows:
+            layout.label(text="No operator calls recorded", icon='INFO')
+
+        col = layout.column(align=True)
+        for row in rows:
+            box = col.box()
+            box.label(text=f"{row['operator']} ({row['method']})")
+            split = box.split(factor=0.5)
+            split.label(text=f"Calls {row['calls']}")
+            split.label(text=f"Last {row['last_ms']:.1f} ms")
+            split = box.split(factor=0.5)
+            split.label(text=f"Mean {row['mean_ms']:.1f} ms")
+            split.label(text=f"Max {row['max_ms']:.1f} ms")
+
+        remaining, calls, function_rows = profiling.capture_status()
+        layout.separator()
+        row = layout.row(align=True)
+        row.operator("bfa.profiling_capture", icon='REC')
+        if remaining:
+            layout.label(text=f"Profiling: {remaining} call(s) left")
+        elif function_rows:
+            layout.label(text=f"Profiled {calls} call(s), {len(function_rows)} functions")
+
+        row = layout.row(align=True)
+        row.operator("bfa.profiling_export", icon='EXPORT')
+        row.operator("bfa.profiling_clear", icon='TRASH')
+
+
 classes = (
     VIEW3D_PT_bfa_tools,
+    VIEW3D_PT_bfa_profiling,
 )
 
 def register():
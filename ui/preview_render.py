@@ -0,0 +1,84 @@
+"""Render Quick Material preview swatches with Cycles (CPU), run by ui/previews.py.
+
+    blender -b --factory-startup --python ui/preview_render.py -- jobs.json
+
+jobs.json is a list of {"name", "mat_type", "color", "output"}. Each preset
+is built with the add-on's own create_preset_material, rendered on a
+sphere and written next to its output path first, then moved in place, so
+a killed render never leaves a broken cache file.
+"""
+
+import importlib
+import json
+import os
+import sys
+
+import bpy
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESOLUTION = 128
+
+
+def import_materials():
+    """Import the add-on's materials module without enabling the add-on"""
+    sys.path.insert(0, os.path.dirname(ROOT))
+    return importlib.import_module(os.path.basename(ROOT) + ".operators.materials")
+
+
+def setup_scene():
+    scene = bpy.context.scene
+    for obj in list(scene.objects):
+        if obj.type == 'MESH':
+            bpy.data.objects.remove(obj)
+
+    bpy.ops.mesh.primitive_uv_sphere_add(segments=48, ring_count=24, radius=1.0)
+    sphere = bpy.context.active_object
+    bpy.ops.object.shade_smooth()
+
+    camera = scene.camera
+    camera.location = (0.0, -4.2, 0.0)
+    camera.rotation_euler = (1.5708, 0.0, 0.0)
+    camera.data.lens = 50
+
+    world = scene.world or bpy.data.worlds.new("World")
+    scene.world = world
+    world.use_nodes = True
+    world.node_tree.nodes["Background"].inputs["Strength"].default_value = 0.6
+
+    scene.render.engine = 'CYCLES'
+    scene.cycles.device = 'CPU'
+    scene.cycles.samples = 32
+    scene.cycles.use_denoising = False
+    scene.render.resolution_x = RESOLUTION
+    scene.render.resolution_y = RESOLUTION
+    scene.render.resolution_percentage = 100
+    scene.render.film_transparent = True
+    scene.render.image_settings.file_format = 'PNG'
+    scene.render.image_settings.color_mode = 'RGBA'
+    return sphere
+
+
+def main():
+    jobs_path = sys.argv[sys.argv.index("--") + 1]
+    with open(jobs_path, encoding="utf-8") as f:
+        jobs = json.load(f)
+
+    materials = import_materials()
+    sphere = setup_scene()
+    scene = bpy.context.scene
+
+    for job in jobs:
+        inputs = materials.preset_inputs(job["mat_type"], tuple(job["color"]))
+        mat = materials.create_preset_material(job["name"], inputs)
+        sphere.data.materials.clear()
+        sphere.data.materials.append(mat)
+
+        temp_path = job["output"] + ".tmp.png"
+        scene.render.filepath = temp_path
+        bpy.ops.render.render(write_still=True)
+        os.replace(temp_path, job["output"])
+        print(f"Rendered {job['output']}", flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import json
+import os
+import subprocess
+import tempfile
+
+import bpy
+import bpy.utils.previews
+
+# -----------------------------------------------------------------------------
+# Quick Material Previews
+#
+# The shelf swatches are rendered once with Cycles (CPU) by a background
+# Blender process and kept on disk, named after the preset hash and the
+# Blender version (a new version may render differently). Only missing
+# swatches are rendered; until they are ready the shelf keeps stock icons.
+
+RENDER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "preview_render.py")
+POLL_INTERVAL = 1.0
+
+_previews = None
+# Running background render: {"process", "jobs_path", "presets"}, empty when idle
+_render = {}
+# Set when a render failed, so it is not retried at every redraw
+_render_failed = False
+
+
+def cache_dir():
+    return bpy.utils.user_resource('DATAFILES', path=os.path.join("bfa_tools", "previews"), create=True)
+
+
+def preset_key(mat_type, color_preset):
+    """Return the cache key of a preset (hash + Blender version)"""
+    from ..operators import materials
+
+    color = materials.PRESET_COLORS[color_preset]
+    inputs = materials.preset_inputs(mat_type, color)
+    version = "_".join(map(str, bpy.app.version))
+    return f"{materials.preset_hash(mat_type, color, inputs)}_{version}"
+
+
+def preview_path(key):
+    return os.path.join(cache_dir(), key + ".png")
+
+
+def get_icon(mat_type, color_preset):
+    """Return the icon_id of a preset swatch, 0 while it isn't available"""
+    if _previews is None:
+        return 0
+    preview = _previews.get(preset_key(mat_type, color_preset))
+    return preview.icon_id if preview else 0
+
+
+def load_cached(presets):
+    """Load the cached swatches of presets, return the presets that are missing"""
+    missing = []
+    for mat_type, color_preset in presets:
+        key = preset_key(mat_type, color_preset)
+        if key in _previews:
+            continue
+        path = preview_path(key)
+        if os.path.exists(path):
+            _previews.load(key, path, 'IMAGE')
+        else:
+            missing.append((mat_type, color_preset))
+    return missing
+
+
+def start_render(presets):
+    """Render the swatches of presets in a background Blender process"""
+    from ..operators import materials
+
+    jobs = [
+        {
+            "name": f"BFA_{mat_type}_{color_preset}",
+            "mat_type": mat_type,
+            "color": materials.PRESET_COLORS[color_preset],
+            "output": preview_path(preset_key(mat_type, color_preset)),
+        }
+        for mat_type, color_preset in presets
+    ]
+    fd, jobs_path = tempfile.mkstemp(prefix="bfa_previews_", suffix=".json")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(jobs, f)
+
+    process = subprocess.Popen(
+        [bpy.app.binary_path, "-b", "--factory-startup", "--python", RENDER_SCRIPT, "--", jobs_path],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    _render.update(process=process, jobs_path=jobs_path, presets=presets)
+    # Persistent: loading a file must not orphan the running render
+    bpy.app.timers.register(poll_render, first_interval=POLL_INTERVAL, persistent=True)
+
+
+def poll_render():
+    """Timer: load the swatches once the background render is done"""
+    global _render_failed
+
+    process = _render.get("process")
+    if process is None:
+        return None
+    if process.poll() is None:
+        return POLL_INTERVAL
+
+    if _previews is not None:
+        if load_cached(_render["presets"]):
+            _render_failed = True
+        for window in bpy.context.window_manager.windows:
+            for area in window.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+
+    os.remove(_render["jobs_path"])
+    _render.clear()
+    return None
+
+
+def ensure_previews(presets):
+    """Load cached swatches and render the missing ones in the background"""
+    if _previews is None or _render or _render_failed or bpy.app.background:
+        return
+    missing = load_cached(presets)
+    if missing:
+        start_render(missing)
+
+
+def stop_render():
+    process = _render.get("process")
+    if process is not None and process.poll() is None:
+        process.kill()
+        process.wait()
+    if _render:
+        os.remove(_render["jobs_path"])
+    _render.clear()
+    if bpy.app.timers.is_registered(poll_render):
+        bpy.app.timers.unregister(poll_render)
+
+
+def sync(prefs):
+    """Load (or render) the swatches when the Quick Materials and previews are enabled"""
+    global _previews
+    if prefs.enable_material_tools and prefs.enable_material_previews:
+        if _previews is None:
+            _previews = bpy.utils.previews.new()
+        from .shelf import SHELF_MATERIALS
+
+        # Deferred so enabling the add-on (and startup) isn't slowed down.
+        # Persistent: starting Blender with a file loads it before the timer runs.
+        presets = [(mat_type, color_preset) for _icon, mat_type, color_preset in SHELF_MATERIALS]
+        bpy.app.timers.register(lambda: ensure_previews(presets), first_interval=0.5, persistent=True)
+    else:
+        unregister()
+
+
+def register():
+    pass
+
+def unregister():
+    global _previews
+    stop_render()
+    if _previews is not None:
+        bpy.utils.previews.remove(_previews)
+        _previews = None
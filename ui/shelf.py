@@ -1,5 +1,16 @@
 import bpy
 
+from . import previews
+
+# (fallback icon, mat_type, color_preset) of the Quick Materials buttons
+SHELF_MATERIALS = (
+    ('MATERIAL', 'PLASTIC', 'WHITE'),
+    ('SHADING_TEXTURE', 'PLASTIC', 'RED'),
+    ('SHADING_SOLID', 'PLASTIC', 'BLUE'),
+    ('SHADING_RENDERED', 'METAL', 'GREY'),
+    ('XRAY', 'GLASS', 'WHITE'),
+)
+
 class BFA_PT_shelf(bpy.types.Panel):
     """BFA Quick Shelf Panel in Sidebar"""
     bl_label = "Quick Create"
@@ -33,44 +44,34 @@ def draw_shelf(layout):
     row.operator("object.light_add", text="", icon='LIGHT_SPOT').type='SPOT'
     row.operator("object.light_add", text="", icon='LIGHT_AREA').type='AREA'
     
-    # Materials (Our Custom Operator)
+    # Materials (Our Custom Operator), only while the feature is enabled
+    if not hasattr(bpy.types, "BFA_OT_quick_material"):
+        return
+
     layout.label(text="Quick Materials")
     row = layout.row(align=True)
     
-    # We can use colored icons or just text? 
-    # Use standard icon 'MATERIAL' but distinctive colors if we could color the button... 
-    # (Not possible in standard UI without custom icons).
-    # We'll use the prompt logic: preset enums.
-    
-    op = row.operator("bfa.quick_material", text="", icon='MATERIAL')
-    op.mat_type = 'PLASTIC'
-    op.color_preset = 'WHITE'
-    
-    op = row.operator("bfa.quick_material", text="", icon='SHADING_TEXTURE') # Red
-    op.mat_type = 'PLASTIC'
-    op.color_preset = 'RED'
+    # Rendered swatches once they are cached (see previews.py), stock icons until then
+    for icon, mat_type, color_preset in SHELF_MATERIALS:
+        icon_value = previews.get_icon(mat_type, color_preset)
+        if icon_value:
+            op = row.operator("bfa.quick_material", text="", icon_value=icon_value)
+        else:
+            op = row.operator("bfa.quick_material", text="", icon=icon)
+        op.mat_type = mat_type
+        op.color_preset = color_preset
 
-    op = row.operator("bfa.quick_material", text="", icon='SHADING_SOLID') # Blue
+    # One shared material, a different color per object
+    op = row.operator("bfa.quick_material", text="", icon='COLOR')
     op.mat_type = 'PLASTIC'
-    op.color_preset = 'BLUE'
+    op.color_preset = 'RANDOM_OBJECT'
 
-    op = row.operator("bfa.quick_material", text="", icon='SHADING_RENDERED') # Metal
-    op.mat_type = 'METAL'
-    op.color_preset = 'GREY'
-    
-    op = row.operator("bfa.quick_material", text="", icon='XRAY') # Glass
-    op.mat_type = 'GLASS'
-    op.color_preset = 'WHITE'
+    layout.operator("bfa.clean_materials", text="Clean Up Materials", icon='BRUSH_DATA')
 
 
 # Header Integration
 def draw_header_shelf(self, context):
     layout = self.layout
-    # Check preferences
-    prefs = bpy.context.preferences.addons[__package__.split('.')[0]].preferences
-    if not prefs.enable_shelf_header:
-        return
-        
     layout.separator()
     # Primitives Popover
     layout.popover(panel="VIEW3D_PT_bfa_shelf_popover", text="", icon='ADD')
@@ -89,11 +90,18 @@ classes = (
     VIEW3D_PT_bfa_shelf_popover,
 )
 
+def sync(prefs):
+    """Append the header popover only while it is enabled"""
+    # Header draw callbacks run on every header redraw of every 3D View,
+    # so the callback is removed instead of returning early when disabled.
+    # (remove() ignores functions that were not appended)
+    bpy.types.VIEW3D_HT_header.remove(draw_header_shelf)
+    if prefs.enable_shelf_header:
+        bpy.types.VIEW3D_HT_header.append(draw_header_shelf)
+
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
-    # Append to header
-    bpy.types.VIEW3D_HT_header.append(draw_header_shelf)
 
 def unregister():
     bpy.types.VIEW3D_HT_header.remove(draw_header_shelf)